@@ -130,9 +130,13 @@ class DispatcherAgent(BaseAgent):
                 )
 
             if result.success:
-                return f"Result from specialist:\n{result.message or str(result.data) or 'Success'}"
+                output = f"Result from specialist:\n{result.message or str(result.data) or 'Success'}"
             else:
-                return f"Error from specialist:\n{result.error or 'Unknown error'}"
+                output = f"Error from specialist:\n{result.error or 'Unknown error'}"
+
+            # The result is fully consumed; hand it back to the pool if pooled
+            result.release()
+            return output
 
         tool_wrapper.__name__ = tool_name
         tool_wrapper.__doc__ = tool_description
@@ -32,6 +32,9 @@ When asked to create an event, use calendar_writer with:
 - `description`: Event details (optional)
 - `location`: Event location (optional)
 
+When asked to create several events at once, call calendar_writer once with
+`events`: a list of objects with the fields above, instead of one call per event.
+
 ## Time Interpretation
 
 Convert natural language time references to ISO format:
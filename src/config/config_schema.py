@@ -113,6 +113,20 @@ class NotionConfig(BaseModel):
         le=20,
         description="Default number of search results to return",
     )
+    embedding_precision: str = Field(
+        default="fp32",
+        description="Query embedding precision: fp32, fp16 (GPU) or int8 (CPU)",
+    )
+
+    @field_validator('embedding_precision')
+    @classmethod
+    def validate_embedding_precision(cls, v: str) -> str:
+        """Validate embedding precision is a supported value."""
+        if v not in ("fp32", "fp16", "int8"):
+            raise ValueError(
+                f"Invalid embedding precision: '{v}'. Must be fp32, fp16 or int8"
+            )
+        return v
 
 
 class GoogleCalendarConfig(BaseModel):
@@ -121,6 +135,9 @@ class GoogleCalendarConfig(BaseModel):
     credentials_path: Optional[str] = Field(default=None, description="Path to credentials JSON file")
     service_account_email: Optional[str] = Field(default=None, description="Service account email")
     service_account_key: Optional[str] = Field(default=None, description="Service account key")
+    token_path: Optional[str] = Field(
+        default=None, description="Path to persist OAuth2 user tokens for refresh"
+    )
 
 
 class ToolsConfig(BaseModel):
@@ -137,6 +154,9 @@ class DatabaseConfig(BaseModel):
 
     conversation_db: str = Field(default="data/conversations.db", description="Conversation database path")
     vector_db_path: str = Field(default="data/vector_db", description="Vector database path")
+    embedding_cache: str = Field(
+        default="data/embedding_cache.db", description="Embedding cache database path"
+    )
 
 
 class AgentPreferencesConfig(BaseModel):
@@ -313,6 +333,22 @@ class DebugConfig(BaseModel):
         le=65535,
         description="Port for web debug UI"
     )
+    web_log_level: str = Field(
+        default="DEBUG",
+        description="Lowest log level kept for the web UI's Live Logs view"
+    )
+
+    @field_validator('web_log_level')
+    @classmethod
+    def validate_web_log_level(cls, v: str) -> str:
+        """Validate the web log level is a standard level name."""
+        v = v.upper()
+        if v not in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"):
+            raise ValueError(
+                f"Invalid web log level: '{v}'. "
+                "Must be DEBUG, INFO, WARNING, ERROR or CRITICAL"
+            )
+        return v
 
 
 class AgentConfig(BaseModel):
@@ -1,10 +1,14 @@
 """Conversation context manager."""
 
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from typing import List, Optional, Tuple
 
 from .conversation_db import ConversationDB
-from .models import ConversationContext, Message
+from .models import ConversationContext, Message, format_transcript
+
+# Maximum number of LLM context summaries kept for reuse
+_SUMMARY_CACHE_SIZE = 512
 
 
 class ConversationContextManager:
@@ -36,6 +40,9 @@ class ConversationContextManager:
         self.lookback_limit = lookback_limit
         self.llm = llm
         self.message_limit = message_limit
+        # LRU of (chat, window, newest message, query) -> LLM summary. A new
+        # message changes the key, so stale summaries are never served.
+        self._summary_cache: "OrderedDict[Tuple, str]" = OrderedDict()
 
     async def get_context(
         self, chat_id: int, user_id: int, limit: Optional[int] = None
@@ -219,13 +226,23 @@ class ConversationContextManager:
         if not messages:
             return "No previous conversation context found.", 0
 
+        # Reuse the summary if this query was already answered for the
+        # same conversation window
+        last = messages[-1]
+        cache_key = (
+            chat_id,
+            len(messages),
+            last.timestamp,
+            last.message_id,
+            query,
+        )
+        cached = self._summary_cache.get(cache_key)
+        if cached is not None:
+            self._summary_cache.move_to_end(cache_key)
+            return cached, len(messages)
+
         # 2. Format messages for the prompt
-        formatted_messages = []
-        for msg in messages:
-            role = "User" if msg.role == "user" else "Assistant"
-            formatted_messages.append(f"{role}: {msg.message_text}")
-        
-        history_text = "\n".join(formatted_messages)
+        history_text = format_transcript(messages)
 
         # 3. Construct Prompt
         prompt = (f"""
@@ -253,5 +270,11 @@ User's Latest Input:
         # 4. Call LLM
         response = await self.llm.generate(prompt)
 
-        return response.text if response.text else "Could not generate context summary.", len(messages)
+        if not response.text:
+            return "Could not generate context summary.", len(messages)
+
+        self._summary_cache[cache_key] = response.text
+        if len(self._summary_cache) > _SUMMARY_CACHE_SIZE:
+            self._summary_cache.popitem(last=False)
+        return response.text, len(messages)
 
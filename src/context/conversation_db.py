@@ -1,15 +1,69 @@
 """SQLite database for conversation storage."""
 
+import asyncio
 import logging
 import aiosqlite
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 
 from .models import Message
 
 logger = logging.getLogger(__name__)
 
+# While a recent-messages read is running, further calls queue up and are
+# answered together by one query when it finishes. A batch is flushed early
+# once it is this large.
+_RECENT_BATCH_MAX_SIZE = 32
+
+# Columns of the messages table, in Message field order
+_MESSAGE_COLUMNS = (
+    "id, chat_id, user_id, message_text, role, timestamp, "
+    "message_id, raw_json, reply_to_message_id"
+)
+
+
+def _recent_messages_query(chat_count: int) -> str:
+    """
+    Build a query for the newest messages of several chats.
+
+    Each chat gets its own "ORDER BY timestamp DESC LIMIT ?" arm so it is
+    answered from idx_chat_id_timestamp; the arms are joined with UNION ALL.
+
+    Args:
+        chat_count: Number of chats, each taking (chat_id, limit) parameters
+
+    Returns:
+        SQL returning rows ordered by chat ID, then timestamp (oldest first)
+    """
+    arm = (
+        f"SELECT * FROM (SELECT {_MESSAGE_COLUMNS} FROM messages "
+        "WHERE chat_id = ? ORDER BY timestamp DESC LIMIT ?)"
+    )
+    arms = " UNION ALL ".join([arm] * chat_count)
+    return f"SELECT * FROM ({arms}) ORDER BY chat_id, timestamp ASC"
+
+
+def _newest(messages: List[Message], limit: int) -> List[Message]:
+    """Take the newest `limit` messages; a negative limit means no limit."""
+    if limit < 0:
+        return messages
+    return messages[-limit:] if limit else []
+
+
+def _row_to_message(row: aiosqlite.Row) -> Message:
+    """Build a Message from a messages table row."""
+    return Message(
+        chat_id=row["chat_id"],
+        user_id=row["user_id"],
+        message_text=row["message_text"],
+        role=row["role"],
+        timestamp=datetime.fromisoformat(row["timestamp"]),
+        message_id=row["message_id"],
+        raw_json=row["raw_json"],
+        reply_to_message_id=row["reply_to_message_id"],
+    )
+
 
 class ConversationDB:
     """Manages conversation storage in SQLite database."""
@@ -23,6 +77,11 @@ class ConversationDB:
         """
         self.db_path = db_path
         self._initialized = False
+        # Pending (chat_id, limit, future) requests for the next recent-messages batch
+        self._recent_pending: List[Tuple[int, int, asyncio.Future]] = []
+        # Recent-messages reads currently running, direct or batched
+        self._recent_active = 0
+        self._recent_batches: Set[asyncio.Task] = set()
 
     async def _run_migrations(self) -> None:
         """Run database migrations for schema updates."""
@@ -151,47 +210,114 @@ class ConversationDB:
         """
         Get recent messages for a chat.
 
+        A call made while no other read is running queries right away.
+        Calls made while one is running are queued and answered together
+        by one get_recent_messages_batched query when it finishes.
+
         Args:
             chat_id: Telegram chat ID
-            limit: Maximum number of messages to retrieve
+            limit: Maximum number of messages to retrieve; negative for all
 
         Returns:
             List of Message objects, ordered by timestamp (oldest first)
         """
         await self.initialize()
 
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            async with db.execute(
-                """
-                SELECT * FROM (
-                    SELECT id, chat_id, user_id, message_text, role, timestamp, message_id, raw_json, reply_to_message_id
-                    FROM messages
-                    WHERE chat_id = ?
-                    ORDER BY timestamp DESC
-                    LIMIT ?
-                ) ORDER BY timestamp ASC
-                """,
-                (chat_id, limit),
-            ) as cursor:
-                rows = await cursor.fetchall()
+        if self._recent_active == 0 and not self._recent_pending:
+            self._recent_active += 1
+            try:
+                by_chat = await self.get_recent_messages_batched([(chat_id, limit)])
+            finally:
+                self._recent_active -= 1
+                self._flush_recent_batch()
+            return by_chat[chat_id]
+
+        future = asyncio.get_running_loop().create_future()
+        self._recent_pending.append((chat_id, limit, future))
+        if len(self._recent_pending) >= _RECENT_BATCH_MAX_SIZE:
+            self._flush_recent_batch()
+
+        return await future
+
+    def _flush_recent_batch(self) -> None:
+        """Start a query for all pending recent-messages requests."""
+        batch, self._recent_pending = self._recent_pending, []
+        if not batch:
+            return
 
-        messages = []
-        for row in rows:
-            messages.append(
-                Message(
-                    chat_id=row["chat_id"],
-                    user_id=row["user_id"],
-                    message_text=row["message_text"],
-                    role=row["role"],
-                    timestamp=datetime.fromisoformat(row["timestamp"]),
-                    message_id=row["message_id"],
-                    raw_json=row["raw_json"],
-                    reply_to_message_id=row["reply_to_message_id"],
-                )
+        self._recent_active += 1
+        task = asyncio.ensure_future(self._run_recent_batch(batch))
+        # Keep a reference so the task isn't garbage collected mid-flight
+        self._recent_batches.add(task)
+        task.add_done_callback(self._recent_batches.discard)
+
+    async def _run_recent_batch(
+        self, batch: List[Tuple[int, int, asyncio.Future]]
+    ) -> None:
+        """Run one batched query and resolve each request's future."""
+        try:
+            by_chat = await self.get_recent_messages_batched(
+                [(chat_id, limit) for chat_id, limit, _ in batch]
             )
+            for chat_id, limit, future in batch:
+                if not future.done():
+                    # Each chat was fetched with its largest requested
+                    # limit; the newest `limit` messages are at the end
+                    future.set_result(_newest(by_chat[chat_id], limit))
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            # Reached on cancellation too, so no caller waits forever
+            for _, _, future in batch:
+                if not future.done():
+                    future.cancel()
+            self._recent_active -= 1
+            self._flush_recent_batch()
+
+    async def get_recent_messages_batched(
+        self, requests: Sequence[Tuple[int, int]]
+    ) -> Dict[int, List[Message]]:
+        """
+        Get recent messages for several chats in one query.
 
-        return messages
+        Args:
+            requests: (chat_id, limit) pairs; a chat requested more than
+                once is fetched with its largest limit, and a negative
+                limit means no limit
+
+        Returns:
+            Dict of chat ID to Message objects, ordered by timestamp
+            (oldest first)
+        """
+        await self.initialize()
+
+        limits: Dict[int, int] = {}
+        for chat_id, limit in requests:
+            current = limits.get(chat_id)
+            if current is None or (current >= 0 and (limit < 0 or limit > current)):
+                limits[chat_id] = limit
+        if not limits:
+            return {}
+
+        by_chat: Dict[int, List[Message]] = {chat_id: [] for chat_id in limits}
+        items = list(limits.items())
+
+        async with aiosqlite.connect(self.db_path) as db:
+            db.row_factory = aiosqlite.Row
+            # SQLite caps the number of terms in a compound SELECT
+            for start in range(0, len(items), _RECENT_BATCH_MAX_SIZE):
+                chunk = items[start:start + _RECENT_BATCH_MAX_SIZE]
+                params = [value for item in chunk for value in item]
+                async with db.execute(
+                    _recent_messages_query(len(chunk)), params
+                ) as cursor:
+                    rows = await cursor.fetchall()
+                for row in rows:
+                    by_chat[row["chat_id"]].append(_row_to_message(row))
+
+        return by_chat
 
     async def get_all_messages(self, chat_id: int) -> List[Message]:
         """
@@ -1,8 +1,18 @@
 """Data models for conversation context."""
 
-from dataclasses import dataclass
+import io
+import sys
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
+
+# Keys of the role/content history dicts handed to agents
+_ROLE = sys.intern("role")
+_CONTENT = sys.intern("content")
+
+# Speaker prefixes for transcripts handed to LLMs
+_USER_PREFIX = "User: "
+_ASSISTANT_PREFIX = "Assistant: "
 
 
 @dataclass
@@ -19,6 +29,26 @@ class Message:
     reply_to_message_id: Optional[int] = None
 
 
+def format_transcript(messages: List[Message]) -> str:
+    """
+    Format messages as a "User: ..." / "Assistant: ..." transcript.
+
+    Args:
+        messages: Messages to format, oldest first
+
+    Returns:
+        One line per message, joined by newlines
+    """
+    buffer = io.StringIO()
+    write = buffer.write
+    for msg in messages:
+        write(_USER_PREFIX if msg.role == "user" else _ASSISTANT_PREFIX)
+        write(msg.message_text)
+        write("\n")
+    # Drop the newline after the last line, matching "\n".join
+    return buffer.getvalue()[:-1]
+
+
 @dataclass
 class ConversationContext:
     """Context for a conversation including recent messages and metadata."""
@@ -28,6 +58,33 @@ class ConversationContext:
     messages: List[Message]
     metadata: Optional[dict] = None  # Added metadata support
     recent_limit: int = 10
+    # (messages list, its length, projected history) for message_history_dicts
+    _history_cache: Optional[Tuple[List[Message], int, List[Dict[str, str]]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def message_history_dicts(self) -> List[Dict[str, str]]:
+        """
+        Messages projected to role/content dicts for agent hand-off.
+
+        The projection is memoized and rebuilt when the messages list is
+        replaced or grows/shrinks. Callers must treat the result as read-only.
+
+        Returns:
+            List of {"role", "content"} dictionaries
+        """
+        cache = self._history_cache
+        if cache is None or cache[0] is not self.messages or cache[1] != len(self.messages):
+            # Role values come from the database as fresh strings; interning
+            # shares one "user"/"assistant" object across all entries
+            history = [
+                {_ROLE: sys.intern(m.role), _CONTENT: m.message_text}
+                for m in self.messages
+            ]
+            cache = (self.messages, len(self.messages), history)
+            self._history_cache = cache
+        return cache[2]
 
     def format_for_llm(self) -> str:
         """
@@ -36,11 +93,7 @@ class ConversationContext:
         Returns:
             Formatted string with conversation history
         """
-        formatted = []
-        for msg in self.messages:
-            role_label = "User" if msg.role == "user" else "Assistant"
-            formatted.append(f"{role_label}: {msg.message_text}")
-        return "\n".join(formatted)
+        return format_transcript(self.messages)
 
     def get_recent_messages(self, limit: Optional[int] = None) -> List[Message]:
         """
@@ -11,6 +11,39 @@ from .svg_generator import SVGDataFlowGenerator
 
 logger = logging.getLogger(__name__)
 
+# Suffix of the small file written next to each JSON trace with only the
+# fields the conversation list needs, so listing traces never parses events
+SUMMARY_SUFFIX = ".summary.json"
+
+# Characters of the user message kept in a trace summary
+_USER_MESSAGE_PREVIEW_LENGTH = 100
+
+
+def build_trace_summary(trace_data: dict) -> dict:
+    """Build the conversation list summary of a trace.
+
+    Args:
+        trace_data: Full trace data as built by build_trace_data
+
+    Returns:
+        Dictionary with the trace's summary fields
+    """
+    preview = trace_data.get("user_message_preview")
+    if preview is None:
+        # Traces logged before previews were stored
+        preview = trace_data.get("user_message", "")[:_USER_MESSAGE_PREVIEW_LENGTH]
+
+    return {
+        "trace_id": trace_data.get("trace_id", ""),
+        "chat_id": trace_data.get("chat_id", 0),
+        "user_id": trace_data.get("user_id"),
+        "timestamp": trace_data.get("timestamp", ""),
+        "duration_ms": trace_data.get("duration_ms", 0),
+        "user_message": preview,
+        "event_count": len(trace_data.get("events", [])),
+        "file_path": trace_data.get("file_path", ""),
+    }
+
 
 class TelegramResponseLogger:
     """Creates separate log files for each Telegram response.
@@ -223,6 +256,11 @@ class TelegramResponseLogger:
         with open(path, "w", encoding="utf-8") as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
 
+        # Written after the trace, so a summary always has its trace file
+        summary_path = path.with_suffix(SUMMARY_SUFFIX)
+        with open(summary_path, "w", encoding="utf-8") as f:
+            json.dump(build_trace_summary(data), f, ensure_ascii=False)
+
     def build_trace_data(
         self,
         trace: RequestTrace,
@@ -253,6 +291,7 @@ class TelegramResponseLogger:
             "end_time": trace.end_time.isoformat() if trace.end_time else None,
             "duration_ms": trace.get_duration_ms(),
             "user_message": user_message,
+            "user_message_preview": user_message[:_USER_MESSAGE_PREVIEW_LENGTH],
             "bot_response": bot_response,
             "file_path": file_path,
             "events": [e.to_dict() for e in trace.events],
@@ -18,6 +18,7 @@ from .context.context_manager import ConversationContextManager
 from .llm.gemini_llm import GeminiLLM
 from .llm.ollama_llm import OllamaLLM
 from .llm.openai_llm import OpenAILLM
+from .memory.embedding_cache import EmbeddingCache
 from .memory.embeddings import EmbeddingGenerator
 from .memory.vector_store import VectorStore
 from .telegram.client import TelegramClient
@@ -42,6 +43,11 @@ from .tools.agent_tools import (
 )
 from .debug import RequestTrace, TraceEventType, TelegramResponseLogger
 
+try:
+    import uvloop
+except ImportError:  # Not available on Windows
+    uvloop = None
+
 # Set up logging with verbosity support
 verbosity = parse_verbosity(sys.argv)
 logger = setup_logging(verbosity=verbosity)
@@ -319,7 +325,9 @@ async def main():
     logger.info(f"  Vector DB path: {config.database.vector_db_path}")
     try:
         vector_store = VectorStore(config.database.vector_db_path)
-        embedding_generator = EmbeddingGenerator()
+        embedding_generator = EmbeddingGenerator(
+            cache=EmbeddingCache(config.database.embedding_cache)
+        )
         logger.info("✓ Vector store ready - Memory features enabled")
     except ImportError as e:
         logger.warning(
@@ -540,6 +548,17 @@ async def main():
             response_logger.on_trace_event_callback = broadcast_event
             response_logger.on_trace_start_callback = broadcast_start
             logger.info("  Connected response logger to web UI")
+
+        # Stream new log entries to the Live Logs view
+        log_viewer = registry.get("logs")
+        if log_viewer:
+            log_viewer.set_capture_level(debug_config.web_log_level)
+
+            async def broadcast_logs(log_data: dict):
+                """Broadcast a batch of new log entries to web UI."""
+                await web_server.broadcast_update("logs", log_data)
+
+            log_viewer.set_broadcast_callback(broadcast_logs)
         
         logger.info("✓ Web debug UI ready")
         logger.info(f"  URL: http://{debug_config.web_host}:{debug_config.web_port}")
@@ -726,11 +745,19 @@ async def main():
         logger.info("Stopping Telegram client...")
         await telegram_client.stop()
         logger.info("✓ Telegram client stopped")
+        logger.info("Closing tool connections...")
+        await tool_registry.aclose()
+        logger.info("✓ Tool connections closed")
         logger.info("=" * 60)
         logger.info("✓ Personal Agent System shutdown complete")
         logger.info("=" * 60)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop (libuv) runs the bot and the web debug server faster than the
+    # default asyncio loop when it is installed
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
 
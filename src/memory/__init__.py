@@ -2,6 +2,7 @@
 
 from .vector_store import VectorStore
 from .embeddings import EmbeddingGenerator
+from .embedding_cache import EmbeddingCache
 
-__all__ = ["VectorStore", "EmbeddingGenerator"]
+__all__ = ["VectorStore", "EmbeddingGenerator", "EmbeddingCache"]
 
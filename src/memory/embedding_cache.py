@@ -0,0 +1,92 @@
+"""Persistent cache of text embeddings keyed by model and content hash."""
+
+import hashlib
+import os
+import sqlite3
+import threading
+from array import array
+from typing import List, Optional
+
+
+class EmbeddingCache:
+    """SQLite-backed store of embeddings so unchanged text skips the model."""
+
+    def __init__(self, db_path: str = "data/embedding_cache.db"):
+        """
+        Initialize embedding cache.
+
+        Args:
+            db_path: Path to the SQLite cache file
+        """
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings "
+            "(key BLOB PRIMARY KEY, vec BLOB NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(model_id: str, text: str) -> bytes:
+        """
+        Build the cache key for a text embedded by a given model.
+
+        Args:
+            model_id: Embedding model identifier
+            text: Embedded text
+
+        Returns:
+            SHA-256 digest of the model ID and text
+        """
+        return hashlib.sha256(f"{model_id}:{text}".encode("utf-8")).digest()
+
+    def get_many(self, keys: List[bytes]) -> List[Optional[List[float]]]:
+        """
+        Look up several embeddings.
+
+        Args:
+            keys: Cache keys from make_key
+
+        Returns:
+            Embedding for each key, or None where it is not cached
+        """
+        if not keys:
+            return []
+
+        placeholders = ",".join("?" * len(keys))
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT key, vec FROM embeddings WHERE key IN ({placeholders})",
+                keys,
+            ).fetchall()
+
+        found = {key: array("f", vec).tolist() for key, vec in rows}
+        return [found.get(key) for key in keys]
+
+    def put_many(self, keys: List[bytes], embeddings: List[List[float]]) -> None:
+        """
+        Store several embeddings.
+
+        Args:
+            keys: Cache keys from make_key
+            embeddings: Embedding vectors, one per key
+        """
+        rows = [
+            (key, array("f", embedding).tobytes())
+            for key, embedding in zip(keys, embeddings)
+        ]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vec) VALUES (?, ?)", rows
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the cache database."""
+        with self._lock:
+            self._conn.close()
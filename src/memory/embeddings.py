@@ -1,31 +1,77 @@
 """Embedding generation for vector database."""
 
-from typing import List
+import functools
+import importlib.util
+import logging
+from typing import List, Optional
 
-try:
-    from sentence_transformers import SentenceTransformer
-except ImportError:
-    SentenceTransformer = None
+from .embedding_cache import EmbeddingCache
+
+# sentence-transformers pulls in torch, which is slow to import, so it is
+# only imported when a model is first needed
+SentenceTransformer = None
+_SENTENCE_TRANSFORMERS_AVAILABLE = (
+    importlib.util.find_spec("sentence_transformers") is not None
+)
+
+logger = logging.getLogger(__name__)
+
+# Supported inference precisions for the embedding model
+PRECISIONS = ("fp32", "fp16", "int8")
 
 
 class EmbeddingGenerator:
     """Generates embeddings for text using sentence transformers."""
 
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
+    def __init__(
+        self,
+        model_name: str = "all-MiniLM-L6-v2",
+        cache: Optional[EmbeddingCache] = None,
+        precision: str = "fp32",
+    ):
         """
         Initialize embedding generator.
 
         Args:
             model_name: Sentence transformer model name
+            cache: Optional persistent cache consulted before the model
+            precision: Inference precision: "fp32", "fp16" (GPU only) or
+                "int8" (dynamic quantization, CPU only)
         """
-        if SentenceTransformer is None:
+        if precision not in PRECISIONS:
+            raise ValueError(
+                f"Invalid embedding precision: '{precision}'. "
+                f"Must be one of {', '.join(PRECISIONS)}"
+            )
+
+        if SentenceTransformer is None and not _SENTENCE_TRANSFORMERS_AVAILABLE:
             raise ImportError(
                 "sentence-transformers is required for embeddings. "
                 "Install it with: pip install sentence-transformers"
             )
 
-        self.model = SentenceTransformer(model_name)
         self.model_name = model_name
+        self.cache = cache
+        self.precision = precision
+
+    @functools.cached_property
+    def model(self):
+        """Sentence transformer model, loaded on first use."""
+        model = _sentence_transformer_class()(self.model_name)
+        self.precision = _apply_precision(model, self.precision)
+        return model
+
+    @functools.cached_property
+    def _cache_model_id(self) -> str:
+        """Cache namespace for the model at the precision actually applied."""
+        if self.precision != "fp32":
+            # Whether the device supports it, or falls back to fp32, is only
+            # known once the model is loaded
+            self.model
+        # Reduced-precision vectors differ slightly, so cache them separately
+        if self.precision == "fp32":
+            return self.model_name
+        return f"{self.model_name}@{self.precision}"
 
     def generate_embedding(self, text: str) -> List[float]:
         """
@@ -35,21 +81,94 @@ class EmbeddingGenerator:
             text: Text to embed
 
         Returns:
-            Embedding vector as list of floats
+            Unit-length embedding vector as list of floats
         """
-        embedding = self.model.encode(text, convert_to_numpy=True)
-        return embedding.tolist()
+        if self.cache is None:
+            embedding = self.model.encode(
+                text, convert_to_numpy=True, normalize_embeddings=True
+            )
+            return embedding.tolist()
+
+        return self.generate_embeddings([text])[0]
 
-    def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
+    def generate_embeddings(
+        self, texts: List[str], batch_size: int = 32
+    ) -> List[List[float]]:
         """
-        Generate embeddings for multiple texts.
+        Generate embeddings for multiple texts in batched forward passes.
 
         Args:
             texts: List of texts to embed
+            batch_size: Number of texts encoded per forward pass
 
         Returns:
-            List of embedding vectors
+            List of unit-length embedding vectors
         """
-        embeddings = self.model.encode(texts, convert_to_numpy=True)
+        if self.cache is None:
+            return self._encode(texts, batch_size)
+
+        # Only texts without a cached embedding go through the model
+        keys = [EmbeddingCache.make_key(self._cache_model_id, text) for text in texts]
+        embeddings = self.cache.get_many(keys)
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+
+        if missing:
+            encoded = self._encode([texts[i] for i in missing], batch_size)
+            self.cache.put_many([keys[i] for i in missing], encoded)
+            for i, embedding in zip(missing, encoded):
+                embeddings[i] = embedding
+
+        return embeddings
+
+    def _encode(self, texts: List[str], batch_size: int) -> List[List[float]]:
+        """Run the model over texts in batches."""
+        embeddings = self.model.encode(
+            texts,
+            batch_size=batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+        )
         return embeddings.tolist()
 
+
+def _sentence_transformer_class():
+    """Import SentenceTransformer on first use."""
+    global SentenceTransformer
+    if SentenceTransformer is None:
+        from sentence_transformers import SentenceTransformer
+    return SentenceTransformer
+
+
+def _apply_precision(model, precision: str) -> str:
+    """
+    Convert a loaded model to the requested inference precision.
+
+    Args:
+        model: Loaded sentence transformer model
+        precision: Requested precision
+
+    Returns:
+        Precision actually in effect ("fp32" when unsupported on the device)
+    """
+    if precision == "fp32":
+        return precision
+
+    on_gpu = str(getattr(model, "device", "cpu")).startswith("cuda")
+
+    if precision == "fp16":
+        if not on_gpu:
+            logger.warning("fp16 embeddings need a GPU; using fp32")
+            return "fp32"
+        model.half()
+        return precision
+
+    if on_gpu:
+        logger.warning("int8 embeddings are CPU only; using fp32")
+        return "fp32"
+
+    import torch
+
+    torch.ao.quantization.quantize_dynamic(
+        model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+    )
+    return precision
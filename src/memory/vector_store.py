@@ -30,9 +30,12 @@ class VectorStore:
             path=db_path,
             settings=Settings(anonymized_telemetry=False),
         )
+        # Embeddings are L2-normalized, so inner product ranks like cosine
+        # (distance = 1 - dot) without per-comparison norms. Existing
+        # collections keep the metric they were created with.
         self.collection = self.client.get_or_create_collection(
             name=collection_name,
-            metadata={"hnsw:space": "cosine"},
+            metadata={"hnsw:space": "ip"},
         )
         self.collection_name = collection_name
 
@@ -71,6 +74,29 @@ class VectorStore:
 
         return id
 
+    def upsert_batch(
+        self,
+        texts: List[str],
+        embeddings: List[List[float]],
+        metadatas: List[dict],
+        ids: List[str],
+    ) -> None:
+        """
+        Store several items in one call, replacing any with the same IDs.
+
+        Args:
+            texts: Text contents
+            embeddings: Embedding vectors, one per text
+            metadatas: Metadata dictionaries, one per text
+            ids: Unique IDs, one per text
+        """
+        self.collection.upsert(
+            ids=ids,
+            embeddings=embeddings,
+            documents=texts,
+            metadatas=metadatas,
+        )
+
     def search(
         self,
         query_embedding: List[float],
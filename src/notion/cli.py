@@ -10,6 +10,7 @@ from ..config.config_loader import load_config
 from ..llm.gemini_llm import GeminiLLM
 from ..llm.ollama_llm import OllamaLLM
 from ..llm.openai_llm import OpenAILLM
+from ..memory.embedding_cache import EmbeddingCache
 from ..memory.embeddings import EmbeddingGenerator
 from ..memory.vector_store import VectorStore
 from ..utils.logging import setup_logging
@@ -190,7 +191,9 @@ async def run_indexer(args: argparse.Namespace) -> int:
             collection_name=notion_config.index_collection,
         )
 
-        embedding_generator = EmbeddingGenerator()
+        embedding_generator = EmbeddingGenerator(
+            cache=EmbeddingCache(config.database.embedding_cache)
+        )
         llm = create_llm(config)
 
     except ImportError as e:
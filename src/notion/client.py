@@ -1,13 +1,54 @@
 """Notion API client wrapper with traversal support."""
 
+import asyncio
+import io
 import logging
 import time
-from typing import Any, Dict, Iterator, List, Optional
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple
 
-from notion_client import Client
+import httpx
+from notion_client import AsyncClient, Client
+from notion_client.helpers import async_iterate_paginated_api
 
 from .models import NotionBlock
 
+# Connection pool for the async client, so sequential tool calls reuse
+# keep-alive connections to api.notion.com
+_ASYNC_POOL_LIMITS = httpx.Limits(max_keepalive_connections=20, keepalive_expiry=300)
+
+# Maximum child-block listings in flight at once while reading a page
+_MAX_CONCURRENT_BLOCK_REQUESTS = 4
+
+
+def _plain_text(rich_text: List[Dict[str, Any]]) -> str:
+    """Join the plain text of a rich text array."""
+    return "".join(t.get("plain_text", "") for t in rich_text)
+
+
+def _render_code(data: Dict[str, Any]) -> str:
+    """Render a code block as a fenced code block."""
+    return f"```{data.get('language', '')}\n{_plain_text(data.get('rich_text', []))}\n```"
+
+
+def _render_image(data: Dict[str, Any]) -> str:
+    """Render an image block as a placeholder with its caption."""
+    caption_text = _plain_text(data.get("caption", []))
+    return f"[Image: {caption_text}]" if caption_text else "[Image]"
+
+
+# Block types whose content isn't plain rich text, by block type. Every other
+# block with a rich_text array renders as its joined plain text.
+_BLOCK_RENDERERS: Dict[str, Callable[[Dict[str, Any]], str]] = {
+    "code": _render_code,
+    "child_page": lambda data: f"[Page: {data.get('title', '')}]",
+    "child_database": lambda data: f"[Database: {data.get('title', '')}]",
+    "image": _render_image,
+    "equation": lambda data: f"[Equation: {data.get('expression', '')}]",
+    "table_of_contents": lambda data: "[Table of Contents]",
+    "divider": lambda data: "---",
+    "bookmark": lambda data: f"[Bookmark: {data.get('url', '')}]",
+}
+
 
 class NotionClient:
     """Enhanced Notion API client with traversal and content extraction."""
@@ -21,14 +62,55 @@ class NotionClient:
             rate_limit_delay: Delay between API calls (seconds) to avoid rate limits
         """
         self.client = Client(auth=api_key)
+        self.api_key = api_key
         self.rate_limit_delay = rate_limit_delay
         self.logger = logging.getLogger(__name__)
+        self._async_client: Optional[AsyncClient] = None
+        # Async primitives are created on first async use, inside the event
+        # loop that runs the requests
+        self._block_request_slots: Optional[asyncio.Semaphore] = None
+        self._rate_limit_lock: Optional[asyncio.Lock] = None
+        # Earliest time.monotonic() at which the next async request may start
+        self._next_async_request_at = 0.0
 
     def _rate_limit(self) -> None:
         """Apply rate limiting delay between API calls."""
         if self.rate_limit_delay > 0:
             time.sleep(self.rate_limit_delay)
 
+    async def _rate_limit_async(self) -> None:
+        """
+        Apply rate limiting delay between async API calls.
+
+        Every async request passes through one gate, so requests start at
+        least rate_limit_delay apart however many run concurrently.
+        """
+        if self.rate_limit_delay <= 0:
+            return
+        if self._rate_limit_lock is None:
+            self._rate_limit_lock = asyncio.Lock()
+        async with self._rate_limit_lock:
+            wait = self._next_async_request_at - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._next_async_request_at = time.monotonic() + self.rate_limit_delay
+
+    @property
+    def async_client(self) -> AsyncClient:
+        """Async Notion client, created on first use with a pooled connection."""
+        if self._async_client is None:
+            self._async_client = AsyncClient(
+                auth=self.api_key,
+                client=httpx.AsyncClient(limits=_ASYNC_POOL_LIMITS),
+            )
+        return self._async_client
+
+    async def aclose(self) -> None:
+        """Close the async client's connection pool, if one was opened."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+
     def get_page(self, page_id: str) -> Dict[str, Any]:
         """
         Fetch a single page by ID.
@@ -42,6 +124,19 @@ class NotionClient:
         self._rate_limit()
         return self.client.pages.retrieve(page_id=page_id)
 
+    async def get_page_async(self, page_id: str) -> Dict[str, Any]:
+        """
+        Fetch a single page by ID without blocking the event loop.
+
+        Args:
+            page_id: Notion page ID
+
+        Returns:
+            Page object from Notion API
+        """
+        await self._rate_limit_async()
+        return await self.async_client.pages.retrieve(page_id=page_id)
+
     def get_page_title(self, page: Dict[str, Any]) -> str:
         """
         Extract title from page properties.
@@ -93,16 +188,7 @@ class NotionClient:
                 block_id=block_id, start_cursor=cursor, page_size=100
             )
 
-            for block in response.get("results", []):
-                content = self._extract_block_content(block)
-                blocks.append(
-                    NotionBlock(
-                        block_id=block["id"],
-                        block_type=block["type"],
-                        content=content,
-                        has_children=block.get("has_children", False),
-                    )
-                )
+            blocks.extend(map(self._to_block, response.get("results", [])))
 
             if not response.get("has_more"):
                 break
@@ -110,6 +196,56 @@ class NotionClient:
 
         return blocks
 
+    async def get_blocks_async(self, block_id: str) -> List[NotionBlock]:
+        """
+        Fetch all blocks under a page or block without blocking the event loop.
+
+        Args:
+            block_id: Page ID or block ID
+
+        Returns:
+            List of NotionBlock objects
+        """
+        return [
+            self._to_block(block)
+            async for block in self._iter_children_async(block_id)
+        ]
+
+    def _iter_children_async(self, block_id: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream the raw child blocks of a page or block, one API page at a time.
+
+        Args:
+            block_id: Page ID or block ID
+
+        Returns:
+            Async iterator over block objects from the Notion API
+        """
+
+        if self._block_request_slots is None:
+            self._block_request_slots = asyncio.Semaphore(
+                _MAX_CONCURRENT_BLOCK_REQUESTS
+            )
+        slots = self._block_request_slots
+
+        async def list_children(**kwargs: Any) -> Dict[str, Any]:
+            async with slots:
+                await self._rate_limit_async()
+                return await self.async_client.blocks.children.list(**kwargs)
+
+        return async_iterate_paginated_api(
+            list_children, block_id=block_id, page_size=100
+        )
+
+    def _to_block(self, block: Dict[str, Any]) -> NotionBlock:
+        """Convert a block object from the Notion API to a NotionBlock."""
+        return NotionBlock(
+            block_id=block["id"],
+            block_type=block["type"],
+            content=self._extract_block_content(block),
+            has_children=block.get("has_children", False),
+        )
+
     def _extract_block_content(self, block: Dict[str, Any]) -> str:
         """
         Extract text content from a block.
@@ -123,44 +259,14 @@ class NotionClient:
         block_type = block.get("type", "")
         block_data = block.get(block_type, {})
 
-        # Handle special block types first (before generic rich_text handling)
-        if block_type == "code":
-            code_text = "".join(
-                t.get("plain_text", "") for t in block_data.get("rich_text", [])
-            )
-            language = block_data.get("language", "")
-            return f"```{language}\n{code_text}\n```"
-
-        # Handle rich text blocks
-        if "rich_text" in block_data:
-            return "".join(
-                t.get("plain_text", "") for t in block_data.get("rich_text", [])
-            )
+        render = _BLOCK_RENDERERS.get(block_type)
+        if render is not None:
+            return render(block_data)
 
-        # Handle other special block types
-        if block_type == "child_page":
-            return f"[Page: {block_data.get('title', '')}]"
-        elif block_type == "child_database":
-            return f"[Database: {block_data.get('title', '')}]"
-        elif block_type == "image":
-            caption = block_data.get("caption", [])
-            caption_text = "".join(t.get("plain_text", "") for t in caption)
-            return f"[Image: {caption_text}]" if caption_text else "[Image]"
-        elif block_type == "code":
-            code_text = "".join(
-                t.get("plain_text", "") for t in block_data.get("rich_text", [])
-            )
-            language = block_data.get("language", "")
-            return f"```{language}\n{code_text}\n```"
-        elif block_type == "equation":
-            return f"[Equation: {block_data.get('expression', '')}]"
-        elif block_type == "table_of_contents":
-            return "[Table of Contents]"
-        elif block_type == "divider":
-            return "---"
-        elif block_type == "bookmark":
-            url = block_data.get("url", "")
-            return f"[Bookmark: {url}]"
+        # Generic rich text blocks (paragraphs, headings, list items, ...)
+        rich_text = block_data.get("rich_text")
+        if rich_text is not None:
+            return _plain_text(rich_text)
 
         return ""
 
@@ -195,6 +301,78 @@ class NotionClient:
         process_blocks(page_id)
         return "\n".join(content_parts)
 
+    async def get_page_content_async(
+        self, page_id: str, include_children: bool = True
+    ) -> str:
+        """
+        Extract all text content from a page without blocking the event loop.
+
+        Child blocks of sibling blocks are fetched concurrently (bounded by
+        _MAX_CONCURRENT_BLOCK_REQUESTS) and stitched back in document order.
+        If any listing fails, the subtree fetches still running are cancelled.
+
+        Args:
+            page_id: Notion page ID
+            include_children: Whether to recursively fetch child blocks
+
+        Returns:
+            Plain text content of the page
+        """
+
+        async def process_blocks(block_id: str, depth: int = 0) -> str:
+            if depth > 10:  # Prevent infinite recursion
+                return ""
+
+            # Add indentation for nested blocks
+            indent = "  " * depth
+            buffer = io.StringIO()
+            # Each child subtree is fetched in the background while the
+            # listing continues; its text is written after the parent line
+            pending: List[Tuple[int, "asyncio.Task[str]"]] = []
+
+            try:
+                async for block in self._iter_children_async(block_id):
+                    content = self._extract_block_content(block)
+                    if content:
+                        buffer.write(indent)
+                        buffer.write(content)
+                        buffer.write("\n")
+
+                    # Recursively process child blocks
+                    if include_children and block.get("has_children", False):
+                        task = asyncio.ensure_future(
+                            process_blocks(block["id"], depth + 1)
+                        )
+                        pending.append((buffer.tell(), task))
+
+                children = await asyncio.gather(*(task for _, task in pending))
+            except BaseException:
+                # On failure or cancellation, stop subtrees still fetching so
+                # they send no requests after the error, and reap them all
+                for _, task in pending:
+                    task.cancel()
+                await asyncio.gather(
+                    *(task for _, task in pending), return_exceptions=True
+                )
+                raise
+
+            text = buffer.getvalue()
+            if not pending:
+                return text
+
+            parts = []
+            start = 0
+            for (offset, _), child_text in zip(pending, children):
+                parts.append(text[start:offset])
+                parts.append(child_text)
+                start = offset
+            parts.append(text[start:])
+            return "".join(parts)
+
+        content = await process_blocks(page_id)
+        # Drop the newline after the last line, matching "\n".join
+        return content[:-1]
+
     def get_child_pages(self, page_id: str) -> List[str]:
         """
         Get IDs of all child pages under a parent page.
@@ -21,6 +21,7 @@ class NotionIndexer:
 
     COLLECTION_NAME = "notion_pages"
     MAX_CONTENT_LENGTH = 8000  # Max chars for summary generation
+    EMBEDDING_BATCH_SIZE = 32  # Pages embedded and stored per batch
     DEFAULT_INFO_PATH = "data/notion/info.json"
 
     WORKSPACE_SUMMARY_PROMPT = """You are analyzing a user's Notion workspace. Based on the following indexed pages,
@@ -102,9 +103,12 @@ Summary:"""
 
         self.logger.info(f"Starting indexing for workspace: {workspace_config.name}")
 
+        # Changed pages are embedded and stored in batches
+        pending: List[NotionPage] = []
+
         for page_id, title, path in traverser.traverse():
             try:
-                indexed_page = await self.index_page(
+                indexed_page = await self._prepare_page(
                     page_id=page_id,
                     title=title,
                     path=path,
@@ -113,10 +117,7 @@ Summary:"""
                 )
 
                 if indexed_page:
-                    stats.pages_indexed += 1
-                    stats.indexed_pages.append(indexed_page)
-                    indexed_page_ids.add(page_id)
-                    self.logger.info(f"Indexed: {path}")
+                    pending.append(indexed_page)
                 else:
                     stats.pages_skipped += 1
                     indexed_page_ids.add(page_id)
@@ -127,6 +128,13 @@ Summary:"""
                 stats.errors.append(f"{path}: {str(e)}")
                 self.logger.error(f"Failed to index {path}: {e}")
 
+            if len(pending) >= self.EMBEDDING_BATCH_SIZE:
+                self._flush_pages(pending, stats, indexed_page_ids)
+                pending = []
+
+        if pending:
+            self._flush_pages(pending, stats, indexed_page_ids)
+
         # Delete stale pages (optional cleanup)
         # This is commented out by default to preserve historical data
         # deleted = await self.delete_stale_pages(indexed_page_ids, workspace_config.name)
@@ -160,6 +168,34 @@ Summary:"""
         Returns:
             NotionPage if indexed, None if skipped
         """
+        notion_page = await self._prepare_page(
+            page_id, title, path, workspace, force_reindex
+        )
+        if notion_page:
+            self._store_page(notion_page)
+        return notion_page
+
+    async def _prepare_page(
+        self,
+        page_id: str,
+        title: str,
+        path: str,
+        workspace: str,
+        force_reindex: bool = False,
+    ) -> Optional[NotionPage]:
+        """
+        Fetch and summarize a page that needs (re)indexing, without storing it.
+
+        Args:
+            page_id: Page ID
+            title: Page title
+            path: Breadcrumb path
+            workspace: Workspace name
+            force_reindex: If True, prepare even if unchanged
+
+        Returns:
+            NotionPage ready to store, None if unchanged
+        """
         # Fetch page content
         content = self.notion_client.get_page_content(page_id)
         content_hash = self._compute_content_hash(content)
@@ -188,9 +224,6 @@ Summary:"""
             workspace=workspace,
         )
 
-        # Store in vector store
-        self._store_page(notion_page)
-
         return notion_page
 
     async def generate_summary(self, title: str, path: str, content: str) -> str:
@@ -243,21 +276,60 @@ Summary:"""
         stored_hash = existing.get("metadata", {}).get("content_hash")
         return stored_hash != content_hash
 
-    def _store_page(self, page: NotionPage) -> None:
+    def _flush_pages(
+        self,
+        pages: List[NotionPage],
+        stats: IndexingStats,
+        indexed_page_ids: Set[str],
+    ) -> None:
         """
-        Store a page in the vector store.
+        Store a batch of prepared pages and record the outcome in stats.
 
         Args:
-            page: NotionPage to store
+            pages: Prepared pages to store
+            stats: Indexing statistics to update
+            indexed_page_ids: Set of indexed page IDs to update
         """
-        # Create searchable document text
-        document = f"{page.title}\n{page.path}\n{page.summary}"
+        try:
+            self._store_pages(pages)
+        except Exception as e:
+            for page in pages:
+                stats.pages_failed += 1
+                stats.errors.append(f"{page.path}: {str(e)}")
+            self.logger.error(f"Failed to store {len(pages)} pages: {e}")
+            return
 
-        # Generate embedding
-        embedding = self.embedding_generator.generate_embedding(document)
+        for page in pages:
+            stats.pages_indexed += 1
+            stats.indexed_pages.append(page)
+            indexed_page_ids.add(page.page_id)
+            self.logger.info(f"Indexed: {page.path}")
 
-        # Prepare metadata
-        metadata = {
+    def _store_pages(self, pages: List[NotionPage]) -> None:
+        """
+        Store several pages with one batched embedding pass and one upsert.
+
+        Args:
+            pages: NotionPages to store
+        """
+        documents = [self._page_document(page) for page in pages]
+        embeddings = self.embedding_generator.generate_embeddings(
+            documents, batch_size=self.EMBEDDING_BATCH_SIZE
+        )
+        self.vector_store.upsert_batch(
+            texts=documents,
+            embeddings=embeddings,
+            metadatas=[self._page_metadata(page) for page in pages],
+            ids=[page.page_id for page in pages],
+        )
+
+    def _page_document(self, page: NotionPage) -> str:
+        """Build the searchable document text for a page."""
+        return f"{page.title}\n{page.path}\n{page.summary}"
+
+    def _page_metadata(self, page: NotionPage) -> Dict[str, Any]:
+        """Build the vector store metadata for a page."""
+        return {
             "page_id": page.page_id,
             "title": page.title,
             "path": page.path,
@@ -268,6 +340,22 @@ Summary:"""
             "workspace": page.workspace or "",
         }
 
+    def _store_page(self, page: NotionPage) -> None:
+        """
+        Store a page in the vector store.
+
+        Args:
+            page: NotionPage to store
+        """
+        # Create searchable document text
+        document = self._page_document(page)
+
+        # Generate embedding
+        embedding = self.embedding_generator.generate_embedding(document)
+
+        # Prepare metadata
+        metadata = self._page_metadata(page)
+
         # Delete existing entry if it exists (for updates)
         try:
             self.vector_store.delete(page.page_id)
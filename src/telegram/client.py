@@ -1,6 +1,7 @@
 """Telegram client for sending and receiving messages."""
 
-from typing import Callable, Optional
+import asyncio
+from typing import Callable, List, Optional
 
 from telegram import Bot
 from telegram.error import TelegramError
@@ -10,6 +11,11 @@ from .poll_handler import PollHandler
 from .webhook_handler import WebhookHandler
 
 
+def _format_for_telegram(text: str) -> List[str]:
+    """Convert markdown to Telegram HTML and split it into sendable chunks."""
+    return split_message_for_telegram(markdown_to_telegram_html(text))
+
+
 class TelegramClient:
     """Client for Telegram bot operations."""
 
@@ -49,11 +55,16 @@ class TelegramClient:
         if self.mode != "poll":
             raise ValueError("Client is not configured for poll mode")
 
-        self.handler = PollHandler(
-            bot_token=self.bot_token,
-            message_handler=message_handler,
-            poll_interval=self.poll_interval,
-        )
+        # Reuse an existing poll handler so its application survives restarts
+        if isinstance(self.handler, PollHandler):
+            self.handler.message_handler = message_handler
+            self.handler.poll_interval = self.poll_interval
+        else:
+            self.handler = PollHandler(
+                bot_token=self.bot_token,
+                message_handler=message_handler,
+                poll_interval=self.poll_interval,
+            )
         await self.handler.start()
 
     async def start_webhook(self, message_handler: Callable) -> None:
@@ -93,9 +104,12 @@ class TelegramClient:
         """
         try:
             if format_markdown:
-                # Convert markdown to Telegram-compatible HTML
-                formatted_text = markdown_to_telegram_html(text)
-                chunks = split_message_for_telegram(formatted_text)
+                # Convert markdown to Telegram-compatible HTML in a worker
+                # thread so large replies don't stall the event loop
+                loop = asyncio.get_running_loop()
+                chunks = await loop.run_in_executor(
+                    None, _format_for_telegram, text
+                )
                 for chunk in chunks:
                     await self.bot.send_message(
                         chat_id=chat_id, text=chunk, parse_mode="HTML"
@@ -116,7 +130,9 @@ class TelegramClient:
             raise TelegramError(f"Failed to send message: {str(e)}")
 
     async def stop(self) -> None:
-        """Stop the client."""
-        if self.handler:
+        """Stop the client and release its handler's connections."""
+        if isinstance(self.handler, PollHandler):
+            await self.handler.shutdown()
+        elif self.handler:
             await self.handler.stop()
 
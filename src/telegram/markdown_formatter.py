@@ -7,6 +7,14 @@ from typing import List, Tuple
 # Use unique placeholders that won't be matched by markdown patterns
 _CODE_BLOCK_PLACEHOLDER = "\x00CB\x00"
 _INLINE_CODE_PLACEHOLDER = "\x00IC\x00"
+_PLACEHOLDER_SPLIT_RE = re.compile(
+    f"({_CODE_BLOCK_PLACEHOLDER}\\d+{_CODE_BLOCK_PLACEHOLDER}"
+    f"|{_INLINE_CODE_PLACEHOLDER}\\d+{_INLINE_CODE_PLACEHOLDER})"
+)
+
+# Any character (or list marker) that can trigger a markdown conversion below.
+# Text without a match only needs HTML escaping.
+_HAS_MARKDOWN_RE = re.compile(r"[*_`#\[~]|^-\s", re.MULTILINE)
 
 
 def markdown_to_telegram_html(text: str) -> str:
@@ -31,6 +39,10 @@ def markdown_to_telegram_html(text: str) -> str:
     if not text:
         return text
 
+    # Fast path: plain text skips the conversion pipeline entirely
+    if not _HAS_MARKDOWN_RE.search(text):
+        return html.escape(text)
+
     # First, extract and preserve code blocks to avoid processing markdown inside them
     code_blocks: List[Tuple[str, str]] = []
     inline_codes: List[Tuple[str, str]] = []
@@ -62,15 +74,11 @@ def markdown_to_telegram_html(text: str) -> str:
 
     # Escape HTML entities in the rest of the text
     # But we need to be careful not to escape our placeholders
-    placeholder_pattern = f"({_CODE_BLOCK_PLACEHOLDER}\\d+{_CODE_BLOCK_PLACEHOLDER}|{_INLINE_CODE_PLACEHOLDER}\\d+{_INLINE_CODE_PLACEHOLDER})"
-    parts = re.split(placeholder_pattern, text)
-    escaped_parts = []
-    for part in parts:
-        if part.startswith(_CODE_BLOCK_PLACEHOLDER) or part.startswith(_INLINE_CODE_PLACEHOLDER):
-            escaped_parts.append(part)
-        else:
-            escaped_parts.append(html.escape(part))
-    text = "".join(escaped_parts)
+    # re.split with a capturing group puts the placeholders at odd indices
+    parts = _PLACEHOLDER_SPLIT_RE.split(text)
+    text = "".join(
+        part if i & 1 else html.escape(part) for i, part in enumerate(parts)
+    )
 
     # Convert markdown headers to bold (Telegram doesn't support headers)
     # Handle ### Header, ## Header, # Header
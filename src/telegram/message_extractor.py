@@ -10,7 +10,7 @@ from ..config.config_schema import AppConfig
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedMessage:
     """Extracted and validated message from Telegram."""
 
@@ -104,23 +104,28 @@ class MessageExtractor:
         Returns:
             ExtractedMessage if valid, None otherwise
         """
-        # Handle message updates
-        if "message" not in update:
+        # Cheap rejections first: only text message updates are of interest
+        message = update.get("message")
+        if not message:
             return None
 
-        message = update["message"]
-        chat = message.get("chat", {})
-        from_user = message.get("from", {})
+        message_text = message.get("text")
+        if not message_text:
+            return None
 
-        chat_id = chat.get("id")
-        user_id = from_user.get("id")
-        message_text = message.get("text", "")
-        message_id = message.get("message_id")
-        username = from_user.get("username")
+        try:
+            chat_id = message["chat"]["id"]
+            from_user = message["from"]
+            user_id = from_user["id"]
+        except KeyError:
+            return None
 
-        if not message_text or not chat_id or not user_id:
+        if not chat_id or not user_id:
             return None
 
+        message_id = message.get("message_id")
+        username = from_user.get("username")
+
         # Check if conversation is allowed
         if not self.is_allowed_conversation(chat_id):
             return None
@@ -31,20 +31,28 @@ class PollHandler:
         self.message_handler = message_handler
         self.poll_interval = poll_interval
         self.application: Optional[Application] = None
+        # Token the current application was built with; a new application
+        # (and HTTP connection pool) is only built when this changes
+        self._application_token: Optional[str] = None
 
     async def start(self) -> None:
-        """Start polling for updates."""
-        self.application = Application.builder().token(self.bot_token).build()
-
-        # Add message handler
-        self.application.add_handler(
-            MessageHandler(filters.TEXT & ~filters.COMMAND, self._handle_message)
-        )
-        self.application.add_handler(
-            MessageHandler(filters.COMMAND, self._handle_message)
-        )
-
-        # Start polling
+        """Start polling for updates, reusing the application from a previous run."""
+        if self.application is None or self._application_token != self.bot_token:
+            if self.application is not None:
+                await self.shutdown()
+
+            self.application = Application.builder().token(self.bot_token).build()
+            self._application_token = self.bot_token
+
+            # Add message handler
+            self.application.add_handler(
+                MessageHandler(filters.TEXT & ~filters.COMMAND, self._handle_message)
+            )
+            self.application.add_handler(
+                MessageHandler(filters.COMMAND, self._handle_message)
+            )
+
+        # Start polling (initialize is a no-op on an already initialized application)
         await self.application.initialize()
         await self.application.start()
 
@@ -58,11 +66,25 @@ class PollHandler:
         )
 
     async def stop(self) -> None:
-        """Stop polling."""
+        """
+        Stop polling.
+
+        The application stays initialized so its HTTP connections can be
+        reused by a later start(). Use shutdown() to release them.
+        """
+        if self.application:
+            if self.application.updater.running:
+                await self.application.updater.stop()
+            if self.application.running:
+                await self.application.stop()
+
+    async def shutdown(self) -> None:
+        """Stop polling and release the application and its connections."""
         if self.application:
-            await self.application.updater.stop()
-            await self.application.stop()
+            await self.stop()
             await self.application.shutdown()
+            self.application = None
+            self._application_token = None
 
     async def _handle_message(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
@@ -1,10 +1,12 @@
 """Base class for Agent-as-a-Tool pattern."""
 
+import copy
+import functools
 import logging
-from datetime import datetime
+import time
 from typing import Any, Dict, Type
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 
 from ..base import BaseTool, ToolResult
 from ...context.models import ConversationContext
@@ -13,6 +15,15 @@ from ...agent.base import AgentContext, BaseAgent
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
+def _build_desc(agent_name: str, agent_description: str) -> str:
+    """Build (and intern) the delegation description for an agent."""
+    return (
+        f"Delegate this request to the {agent_name} specialist. "
+        f"{agent_description}"
+    )
+
+
 class BaseAgentTool(BaseTool):
     """Wraps a specialist agent as a tool for the Dispatcher.
 
@@ -38,12 +49,16 @@ class BaseAgentTool(BaseTool):
             agent: The specialist agent to wrap
             request_model: Pydantic model defining the request schema
         """
+        agent_name = agent.get_name()
         super().__init__(
-            name=f"delegate_to_{agent.get_name()}",
+            name=f"delegate_to_{agent_name}",
             description=self._build_description(agent),
         )
         self.agent = agent
+        self.agent_name = agent_name
         self.request_model = request_model
+        # The request model is static, so its schema only needs building once
+        self._schema = self._build_schema()
 
     def _build_description(self, agent: BaseAgent) -> str:
         """Build tool description from agent.
@@ -54,10 +69,7 @@ class BaseAgentTool(BaseTool):
         Returns:
             Tool description string
         """
-        return (
-            f"Delegate this request to the {agent.get_name()} specialist. "
-            f"{agent.get_description()}"
-        )
+        return _build_desc(agent.get_name(), agent.get_description())
 
     async def execute(
         self,
@@ -74,10 +86,25 @@ class BaseAgentTool(BaseTool):
             ToolResult with specialist's response
         """
         try:
-            # Validate and parse request using Pydantic model
-            request = self.request_model(**kwargs)
+            # Validate and parse request using Pydantic model, feeding the
+            # kwargs dict straight to the compiled validator
+            request = self.request_model.model_validate(kwargs)
+        except ValidationError as e:
+            # Bad arguments from the model are expected; no traceback needed
+            logger.warning(
+                f"Invalid request for {self.agent_name}: {e}"
+            )
+            return ToolResult(
+                success=False,
+                data=None,
+                error=f"Agent delegation failed: {str(e)}",
+            )
+
+        try:
+            # Serialize once; the same payload is logged and handed off
+            payload = request.model_dump_json()
             logger.debug(
-                f"Delegating to {self.agent.get_name()}: {request.model_dump()}"
+                "Delegating to %s: %s", self.agent_name, payload
             )
 
             # Convert ConversationContext to AgentContext
@@ -85,10 +112,7 @@ class BaseAgentTool(BaseTool):
                 chat_id=context.chat_id,
                 user_id=context.user_id,
                 session_id=str(context.chat_id),
-                message_history=[
-                    {"role": m.role, "content": m.message_text}
-                    for m in context.messages
-                ],
+                message_history=context.message_history_dicts,
                 metadata=getattr(context, "metadata", {}),
             )
 
@@ -97,25 +121,23 @@ class BaseAgentTool(BaseTool):
                 agent_context = agent_context.with_child_trace()
 
             # Record delegation start time
-            start_time = datetime.now()
+            start_time = time.perf_counter()
 
             # Delegate to specialist agent
             result = await self.agent.process(
-                message=request.model_dump_json(),
+                message=payload,
                 context=agent_context,
             )
 
             # Calculate processing time
-            processing_time_ms = (
-                datetime.now() - start_time
-            ).total_seconds() * 1000
+            processing_time_ms = (time.perf_counter() - start_time) * 1000
 
             logger.debug(
-                f"Specialist {self.agent.get_name()} responded in "
+                f"Specialist {self.agent_name} responded in "
                 f"{processing_time_ms:.2f}ms: {result.response_text[:100]}..."
             )
 
-            return ToolResult(
+            return ToolResult.acquire(
                 success=result.success,
                 data=result.structured_data,
                 message=result.response_text,
@@ -123,7 +145,7 @@ class BaseAgentTool(BaseTool):
 
         except Exception as e:
             logger.error(
-                f"Agent delegation to {self.agent.get_name()} failed: {e}",
+                f"Agent delegation to {self.agent_name} failed: {e}",
                 exc_info=True
             )
             return ToolResult(
@@ -132,7 +154,7 @@ class BaseAgentTool(BaseTool):
                 error=f"Agent delegation failed: {str(e)}",
             )
 
-    def get_schema(self) -> Dict[str, Any]:
+    def _build_schema(self) -> Dict[str, Any]:
         """Generate schema from Pydantic request model.
 
         Returns:
@@ -152,3 +174,12 @@ class BaseAgentTool(BaseTool):
             "description": self.description,
             "parameters": parameters,
         }
+
+    def get_schema(self) -> Dict[str, Any]:
+        """Get schema generated from the Pydantic request model.
+
+        Returns:
+            Tool schema dictionary for pydantic_ai registration; a copy of
+            the one built at construction, so callers may modify it
+        """
+        return copy.deepcopy(self._schema)
@@ -1,11 +1,10 @@
 """Notion Agent-as-a-Tool wrapper."""
 
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import BaseModel, Field, model_validator
 
 from .base_agent_tool import BaseAgentTool
-from ...agent.specialists.notion_models import SearchScope
 
 
 class NotionQuery(BaseModel):
@@ -39,8 +38,10 @@ class NotionQuery(BaseModel):
     )
 
     # Search scope indicator
-    search_scope: SearchScope = Field(
-        default=SearchScope.PRECISE,
+    # Values mirror notion_models.SearchScope; a Literal keeps the specialist
+    # package out of the import path and the schema free of $ref definitions
+    search_scope: Literal["precise", "exploratory", "comprehensive"] = Field(
+        default="precise",
         description=(
             "How specific vs. broad the search should be. "
             "'precise' for specific documents, 'exploratory' for browsing, "
@@ -88,18 +89,28 @@ class NotionQuery(BaseModel):
     @classmethod
     def handle_legacy_format(cls, values):
         """Handle backward compatibility with old NotionQuery format."""
-        if isinstance(values, dict):
-            # Map search_term to user_question if user_question not provided
-            if values.get("search_term") and not values.get("user_question"):
-                values["user_question"] = values["search_term"]
-
-            # Map date_range to time_context
-            if values.get("date_range") and not values.get("time_context"):
-                values["time_context"] = values["date_range"]
-
-            # Map max_results to max_pages_to_analyze
-            if values.get("max_results") and not values.get("max_pages_to_analyze"):
-                values["max_pages_to_analyze"] = min(values["max_results"], 10)
+        if not isinstance(values, dict):
+            return values
+
+        # Modern callers never send the deprecated keys; skip the mapping
+        if not (
+            values.get("search_term")
+            or values.get("date_range")
+            or values.get("max_results")
+        ):
+            return values
+
+        # Map search_term to user_question if user_question not provided
+        if values.get("search_term") and not values.get("user_question"):
+            values["user_question"] = values["search_term"]
+
+        # Map date_range to time_context
+        if values.get("date_range") and not values.get("time_context"):
+            values["time_context"] = values["date_range"]
+
+        # Map max_results to max_pages_to_analyze
+        if values.get("max_results") and not values.get("max_pages_to_analyze"):
+            values["max_pages_to_analyze"] = min(values["max_results"], 10)
 
         return values
 
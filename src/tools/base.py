@@ -1,13 +1,13 @@
 """Base tool interface."""
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Dict, List, Optional
 
 from ..context.models import ConversationContext
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolResult:
     """Result from tool execution."""
 
@@ -15,6 +15,58 @@ class ToolResult:
     data: Any
     error: Optional[str] = None
     message: Optional[str] = None
+    # Set for instances handed out by acquire(); only those may be released
+    _pooled: bool = field(default=False, init=False, repr=False, compare=False)
+
+    # Free list of released results, reused by acquire()
+    _pool: ClassVar[List["ToolResult"]] = []
+    _POOL_SIZE: ClassVar[int] = 64
+
+    @classmethod
+    def acquire(
+        cls,
+        success: bool,
+        data: Any,
+        error: Optional[str] = None,
+        message: Optional[str] = None,
+    ) -> "ToolResult":
+        """
+        Get a result from the pool, or create one if the pool is empty.
+
+        The consumer should call release() once it is done with the result.
+
+        Args:
+            success: Whether the tool succeeded
+            data: Result payload
+            error: Error message
+            message: Human-readable result message
+
+        Returns:
+            Initialized ToolResult
+        """
+        if cls._pool:
+            result = cls._pool.pop()
+            result.success = success
+            result.data = data
+            result.error = error
+            result.message = message
+        else:
+            result = cls(success=success, data=data, error=error, message=message)
+        result._pooled = True
+        return result
+
+    def release(self) -> None:
+        """Return an acquired result to the pool; no-op for other results."""
+        if not self._pooled:
+            return
+        # Cleared first so a second release() can't pool the object twice
+        self._pooled = False
+        if len(self._pool) >= self._POOL_SIZE:
+            return
+        self.data = None
+        self.error = None
+        self.message = None
+        self._pool.append(self)
 
 
 class BaseTool(ABC):
@@ -69,6 +121,9 @@ class BaseTool(ABC):
         """
         return True
 
+    async def aclose(self) -> None:
+        """Release resources held by the tool, such as connection pools."""
+
     def get_name(self) -> str:
         """Get tool name."""
         return self.name
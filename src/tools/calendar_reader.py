@@ -1,21 +1,40 @@
 """Google Calendar Reader tool."""
 
-from datetime import datetime, timedelta
+import asyncio
+import copy
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, Optional
 
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google.oauth2.service_account import Credentials as ServiceAccountCredentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
+from pydantic import BaseModel, ValidationError
 
 from .base import BaseTool, ToolResult
+from .google_service import execute_with_retry, get_calendar_service
 from ..context.models import ConversationContext
 
 SCOPES = ["https://www.googleapis.com/auth/calendar.readonly"]
 
 
+class CalendarReaderArgs(BaseModel):
+    """Parameters of a calendar read."""
+
+    max_results: Optional[int] = None
+    time_min: Optional[str] = None
+    time_max: Optional[str] = None
+
+
+def _project_event(event: Dict[str, Any]) -> Dict[str, Any]:
+    """Project a Google Calendar event onto the fields returned by the tool."""
+    start = event["start"]
+    get = event.get
+    return {
+        "id": get("id"),
+        "summary": get("summary", "No title"),
+        "start": start.get("dateTime") or start.get("date"),
+        "description": get("description", ""),
+        "location": get("location", ""),
+    }
+
+
 class CalendarReaderTool(BaseTool):
     """Tool for reading events from Google Calendar."""
 
@@ -24,6 +43,7 @@ class CalendarReaderTool(BaseTool):
         credentials_path: Optional[str] = None,
         service_account_email: Optional[str] = None,
         service_account_key: Optional[str] = None,
+        token_path: Optional[str] = None,
     ):
         """
         Initialize Calendar Reader tool.
@@ -32,6 +52,8 @@ class CalendarReaderTool(BaseTool):
             credentials_path: Path to OAuth2 credentials JSON file
             service_account_email: Service account email (alternative auth)
             service_account_key: Service account key (alternative auth)
+            token_path: Path where OAuth2 user tokens are persisted so they
+                can be refreshed instead of re-running the consent flow
         """
         super().__init__(
             name="calendar_reader",
@@ -40,45 +62,34 @@ class CalendarReaderTool(BaseTool):
         self.credentials_path = credentials_path
         self.service_account_email = service_account_email
         self.service_account_key = service_account_key
+        self.token_path = token_path
         self.service = None
+        self._events_resource = None
+        # The schema is static, so it only needs building once
+        self._schema = self._build_schema()
 
     def _get_service(self):
         """Get or create Google Calendar service."""
         if self.service:
             return self.service
 
-        creds = None
-
-        # Try service account first
-        if self.service_account_email and self.service_account_key:
-            try:
-                creds = ServiceAccountCredentials.from_service_account_info(
-                    {
-                        "type": "service_account",
-                        "client_email": self.service_account_email,
-                        "private_key": self.service_account_key,
-                    },
-                    scopes=SCOPES,
-                )
-            except Exception:
-                pass
-
-        # Fall back to OAuth2 credentials file
-        if not creds and self.credentials_path:
-            try:
-                flow = InstalledAppFlow.from_client_secrets_file(
-                    self.credentials_path, SCOPES
-                )
-                creds = flow.run_local_server(port=0)
-            except Exception:
-                pass
-
-        if not creds or not creds.valid:
-            raise ValueError("Invalid Google Calendar credentials")
-
-        self.service = build("calendar", "v3", credentials=creds)
+        self.service = get_calendar_service(
+            SCOPES,
+            credentials_path=self.credentials_path,
+            service_account_email=self.service_account_email,
+            service_account_key=self.service_account_key,
+            token_path=self.token_path,
+        )
         return self.service
 
+    def _events(self, service):
+        """Get the service's events collection, built once per tool."""
+        # Each service.events() call rebuilds a Resource and its methods
+        # from the discovery document; the collection itself is reusable
+        if self._events_resource is None:
+            self._events_resource = service.events()
+        return self._events_resource
+
     async def execute(
         self, context: ConversationContext, **kwargs
     ) -> ToolResult:
@@ -96,7 +107,17 @@ class CalendarReaderTool(BaseTool):
             ToolResult with calendar events
         """
         try:
-            service = self._get_service()
+            args = CalendarReaderArgs.model_validate(kwargs)
+        except ValidationError as e:
+            return ToolResult(
+                success=False,
+                data=None,
+                error=f"Invalid calendar read parameters: {str(e)}",
+            )
+
+        try:
+            # Building the service may refresh tokens over the network
+            service = await asyncio.to_thread(self._get_service)
         except Exception as e:
             return ToolResult(
                 success=False,
@@ -104,43 +125,35 @@ class CalendarReaderTool(BaseTool):
                 error=f"Failed to authenticate with Google Calendar: {str(e)}",
             )
 
-        max_results = kwargs.get("max_results", 10)
-        time_min = kwargs.get("time_min")
-        time_max = kwargs.get("time_max")
+        max_results = args.max_results or 10
+        time_min = args.time_min
+        time_max = args.time_max
+
+        # Default to next 7 days if no time range specified, reading the
+        # clock at most once
+        if not time_min or not time_max:
+            now = datetime.now(timezone.utc)
+            if not time_min:
+                time_min = now.isoformat()
+            if not time_max:
+                time_max = (now + timedelta(days=7)).isoformat()
 
-        # Default to next 7 days if no time range specified
-        if not time_min:
-            time_min = datetime.utcnow().isoformat() + "Z"
-        if not time_max:
-            time_max = (datetime.utcnow() + timedelta(days=7)).isoformat() + "Z"
+        from googleapiclient.errors import HttpError
 
         try:
-            events_result = (
-                service.events()
-                .list(
-                    calendarId="primary",
-                    timeMin=time_min,
-                    timeMax=time_max,
-                    maxResults=max_results,
-                    singleEvents=True,
-                    orderBy="startTime",
-                )
-                .execute()
+            # googleapiclient is blocking; keep the event loop free meanwhile
+            request = self._events(service).list(
+                calendarId="primary",
+                timeMin=time_min,
+                timeMax=time_max,
+                maxResults=max_results,
+                singleEvents=True,
+                orderBy="startTime",
             )
+            events_result = await asyncio.to_thread(execute_with_retry, request)
             events = events_result.get("items", [])
 
-            event_list = []
-            for event in events:
-                start = event["start"].get("dateTime", event["start"].get("date"))
-                event_list.append(
-                    {
-                        "id": event.get("id"),
-                        "summary": event.get("summary", "No title"),
-                        "start": start,
-                        "description": event.get("description", ""),
-                        "location": event.get("location", ""),
-                    }
-                )
+            event_list = list(map(_project_event, events))
 
             return ToolResult(
                 success=True,
@@ -164,8 +177,8 @@ class CalendarReaderTool(BaseTool):
                 error=f"Failed to read calendar: {str(e)}",
             )
 
-    def get_schema(self) -> Dict[str, Any]:
-        """Get tool schema for pydantic_ai."""
+    def _build_schema(self) -> Dict[str, Any]:
+        """Build tool schema for pydantic_ai."""
         return {
             "name": self.name,
             "description": self.description,
@@ -189,3 +202,6 @@ class CalendarReaderTool(BaseTool):
             },
         }
 
+    def get_schema(self) -> Dict[str, Any]:
+        """Get tool schema for pydantic_ai; a copy callers may modify."""
+        return copy.deepcopy(self._schema)
@@ -1,20 +1,90 @@
 """Google Calendar Writer tool."""
 
-from datetime import datetime
-from typing import Any, Dict, Optional
+import asyncio
+import copy
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
 
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google.oauth2.service_account import Credentials as ServiceAccountCredentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
+from pydantic import BaseModel, ValidationError
 
 from .base import BaseTool, ToolResult
+from .google_service import (
+    execute_batch_with_retry,
+    execute_with_retry,
+    get_calendar_service,
+)
 from ..context.models import ConversationContext
 
 SCOPES = ["https://www.googleapis.com/auth/calendar"]
 
+# Google API batch requests accept at most 50 calls
+_MAX_BATCH_SIZE = 50
+
+_INVALID_START_TIME = (
+    "Invalid start_time format. Use ISO format (e.g., 2024-01-01T10:00:00Z)"
+)
+
+# Argument errors are returned often and never vary, so they are shared
+# instances. Callers treat results as read-only; release() ignores them.
+_MISSING_TITLE = ToolResult(
+    success=False, data=None, error="Missing required parameter: title"
+)
+_MISSING_START_TIME = ToolResult(
+    success=False, data=None, error="Missing required parameter: start_time"
+)
+_INVALID_START_TIME_RESULT = ToolResult(
+    success=False, data=None, error=_INVALID_START_TIME
+)
+_INVALID_EVENTS = ToolResult(
+    success=False, data=None, error="Parameter 'events' must be a non-empty list"
+)
+
+
+class CalendarEventArgs(BaseModel):
+    """Parameters of one event to create."""
+
+    title: str
+    start_time: str
+    end_time: Optional[str] = None
+    description: Optional[str] = None
+    location: Optional[str] = None
+
+
+def _build_event(args: CalendarEventArgs) -> Optional[Dict[str, Any]]:
+    """
+    Build a Calendar API event body from validated tool parameters.
+
+    Args:
+        args: Event parameters
+
+    Returns:
+        Event body, or None if start_time can't be parsed for a default end_time
+    """
+    start_time = args.start_time
+    end_time = args.end_time
+
+    # If no end_time, default to 1 hour after start
+    if not end_time:
+        try:
+            start_dt = datetime.fromisoformat(start_time.replace("Z", "+00:00"))
+            end_time = (start_dt + timedelta(hours=1)).isoformat()
+        except Exception:
+            return None
+
+    return {
+        "summary": args.title,
+        "description": args.description or "",
+        "location": args.location or "",
+        "start": {
+            "dateTime": start_time,
+            "timeZone": "UTC",
+        },
+        "end": {
+            "dateTime": end_time,
+            "timeZone": "UTC",
+        },
+    }
+
 
 class CalendarWriterTool(BaseTool):
     """Tool for creating events in Google Calendar."""
@@ -24,6 +94,7 @@ class CalendarWriterTool(BaseTool):
         credentials_path: Optional[str] = None,
         service_account_email: Optional[str] = None,
         service_account_key: Optional[str] = None,
+        token_path: Optional[str] = None,
     ):
         """
         Initialize Calendar Writer tool.
@@ -32,6 +103,8 @@ class CalendarWriterTool(BaseTool):
             credentials_path: Path to OAuth2 credentials JSON file
             service_account_email: Service account email (alternative auth)
             service_account_key: Service account key (alternative auth)
+            token_path: Path where OAuth2 user tokens are persisted so they
+                can be refreshed instead of re-running the consent flow
         """
         super().__init__(
             name="calendar_writer",
@@ -41,123 +114,98 @@ class CalendarWriterTool(BaseTool):
         self.credentials_path = credentials_path
         self.service_account_email = service_account_email
         self.service_account_key = service_account_key
+        self.token_path = token_path
         self.service = None
+        self._events_resource = None
+        # Event body -> insert in progress, so duplicate concurrent requests
+        # create the event once. Writes are never cached beyond that.
+        self._inflight: Dict[Tuple, "asyncio.Task[Dict[str, Any]]"] = {}
+        # The schema is static, so it only needs building once
+        self._schema = self._build_schema()
 
     def _get_service(self):
         """Get or create Google Calendar service."""
         if self.service:
             return self.service
 
-        creds = None
-
-        # Try service account first
-        if self.service_account_email and self.service_account_key:
-            try:
-                creds = ServiceAccountCredentials.from_service_account_info(
-                    {
-                        "type": "service_account",
-                        "client_email": self.service_account_email,
-                        "private_key": self.service_account_key,
-                    },
-                    scopes=SCOPES,
-                )
-            except Exception:
-                pass
-
-        # Fall back to OAuth2 credentials file
-        if not creds and self.credentials_path:
-            try:
-                flow = InstalledAppFlow.from_client_secrets_file(
-                    self.credentials_path, SCOPES
-                )
-                creds = flow.run_local_server(port=0)
-            except Exception:
-                pass
-
-        if not creds or not creds.valid:
-            raise ValueError("Invalid Google Calendar credentials")
-
-        self.service = build("calendar", "v3", credentials=creds)
+        self.service = get_calendar_service(
+            SCOPES,
+            credentials_path=self.credentials_path,
+            service_account_email=self.service_account_email,
+            service_account_key=self.service_account_key,
+            token_path=self.token_path,
+        )
         return self.service
 
+    def _events(self, service):
+        """Get the service's events collection, built once per tool."""
+        # Each service.events() call rebuilds a Resource and its methods
+        # from the discovery document; the collection itself is reusable
+        if self._events_resource is None:
+            self._events_resource = service.events()
+        return self._events_resource
+
     async def execute(
         self, context: ConversationContext, **kwargs
     ) -> ToolResult:
         """
-        Create a calendar event.
+        Create a calendar event, or several events in one batch request.
 
         Args:
             context: Conversation context
-            **kwargs: Must contain:
+            **kwargs: Must contain either the single-event fields:
                 - 'title' (str): Event title
                 - 'start_time' (str): Start time in ISO format
                 - 'end_time' (str, optional): End time in ISO format
                 - 'description' (str, optional): Event description
                 - 'location' (str, optional): Event location
+              or:
+                - 'events' (list): Event dicts with the fields above
 
         Returns:
             ToolResult with created event info
         """
-        if "title" not in kwargs:
-            return ToolResult(
-                success=False,
-                data=None,
-                error="Missing required parameter: title",
-            )
+        events = kwargs.get("events")
+        if events is None:
+            if "title" not in kwargs:
+                return _MISSING_TITLE
+
+            if "start_time" not in kwargs:
+                return _MISSING_START_TIME
 
-        if "start_time" not in kwargs:
+        try:
+            # Building the service may refresh tokens over the network
+            service = await asyncio.to_thread(self._get_service)
+        except Exception as e:
             return ToolResult(
                 success=False,
                 data=None,
-                error="Missing required parameter: start_time",
+                error=f"Failed to authenticate with Google Calendar: {str(e)}",
             )
 
+        if events is not None:
+            return await asyncio.to_thread(self._execute_batch, service, events)
+
         try:
-            service = self._get_service()
-        except Exception as e:
+            args = CalendarEventArgs.model_validate(kwargs)
+        except ValidationError as e:
             return ToolResult(
                 success=False,
                 data=None,
-                error=f"Failed to authenticate with Google Calendar: {str(e)}",
+                error=f"Invalid event parameters: {str(e)}",
             )
 
-        title = kwargs["title"]
-        start_time = kwargs["start_time"]
-        end_time = kwargs.get("end_time")
-        description = kwargs.get("description", "")
-        location = kwargs.get("location", "")
+        title = args.title
+        start_time = args.start_time
+        event = _build_event(args)
+        if event is None:
+            return _INVALID_START_TIME_RESULT
+        end_time = event["end"]["dateTime"]
 
-        # If no end_time, default to 1 hour after start
-        if not end_time:
-            try:
-                start_dt = datetime.fromisoformat(start_time.replace("Z", "+00:00"))
-                end_dt = start_dt.replace(hour=start_dt.hour + 1)
-                end_time = end_dt.isoformat()
-            except Exception:
-                return ToolResult(
-                    success=False,
-                    data=None,
-                    error="Invalid start_time format. Use ISO format (e.g., 2024-01-01T10:00:00Z)",
-                )
-
-        event = {
-            "summary": title,
-            "description": description,
-            "location": location,
-            "start": {
-                "dateTime": start_time,
-                "timeZone": "UTC",
-            },
-            "end": {
-                "dateTime": end_time,
-                "timeZone": "UTC",
-            },
-        }
+        from googleapiclient.errors import HttpError
 
         try:
-            created_event = (
-                service.events().insert(calendarId="primary", body=event).execute()
-            )
+            created_event = await self._insert_event(service, event)
 
             return ToolResult(
                 success=True,
@@ -183,8 +231,113 @@ class CalendarWriterTool(BaseTool):
                 error=f"Failed to create calendar event: {str(e)}",
             )
 
-    def get_schema(self) -> Dict[str, Any]:
-        """Get tool schema for pydantic_ai."""
+    async def _insert_event(self, service, event: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Insert an event, sharing the request with identical in-flight inserts.
+
+        Args:
+            service: Google Calendar service
+            event: Event body
+
+        Returns:
+            Created event from the Calendar API
+        """
+        key = (
+            event["summary"],
+            event["start"]["dateTime"],
+            event["end"]["dateTime"],
+            event["description"],
+            event["location"],
+        )
+        task = self._inflight.get(key)
+        if task is None:
+            # googleapiclient is blocking; keep the event loop free meanwhile
+            request = self._events(service).insert(calendarId="primary", body=event)
+            task = asyncio.ensure_future(
+                asyncio.to_thread(execute_with_retry, request)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # Shield so one cancelled caller doesn't cancel the shared insert
+        return await asyncio.shield(task)
+
+    def _execute_batch(self, service, events: List[Dict[str, Any]]) -> ToolResult:
+        """
+        Create several events using Google API batch requests.
+
+        Events are sent in batches of at most _MAX_BATCH_SIZE, so N events
+        cost ceil(N / _MAX_BATCH_SIZE) round-trips instead of N. Inserts
+        that were rate limited are retried in a follow-up batch.
+
+        Args:
+            service: Google Calendar service
+            events: Event dicts with the single-event parameters
+
+        Returns:
+            ToolResult with a per-event outcome in data["results"]
+        """
+        if not isinstance(events, list) or not events:
+            return _INVALID_EVENTS
+
+        results: List[Dict[str, Any]] = [{} for _ in events]
+        pending: List[Tuple[int, Dict[str, Any]]] = []
+
+        for index, item in enumerate(events):
+            try:
+                args = CalendarEventArgs.model_validate(item)
+            except ValidationError as e:
+                results[index] = {
+                    "success": False,
+                    "error": f"Invalid event parameters: {str(e)}",
+                }
+                continue
+            body = _build_event(args)
+            if body is None:
+                results[index] = {"success": False, "error": _INVALID_START_TIME}
+                continue
+            results[index] = {
+                "title": args.title,
+                "start": args.start_time,
+                "end": body["end"]["dateTime"],
+            }
+            pending.append((index, body))
+
+        def collect(request_id: str, response: Any, exception: Exception) -> None:
+            outcome = results[int(request_id)]
+            if exception is not None:
+                outcome["success"] = False
+                outcome["error"] = f"Google Calendar API error: {str(exception)}"
+            else:
+                outcome["success"] = True
+                outcome["event_id"] = response.get("id")
+                outcome["html_link"] = response.get("htmlLink")
+
+        try:
+            events_resource = self._events(service)
+            for offset in range(0, len(pending), _MAX_BATCH_SIZE):
+                requests = {
+                    str(index): events_resource.insert(calendarId="primary", body=body)
+                    for index, body in pending[offset:offset + _MAX_BATCH_SIZE]
+                }
+                execute_batch_with_retry(service, requests, collect)
+        except Exception as e:
+            return ToolResult(
+                success=False,
+                data={"results": results},
+                error=f"Failed to create calendar events: {str(e)}",
+            )
+
+        created = sum(1 for outcome in results if outcome.get("success"))
+        return ToolResult(
+            success=created == len(events),
+            data={"results": results, "created": created},
+            message=f"Created {created} of {len(events)} calendar events",
+            error=None if created == len(events) else "Some events could not be created",
+        )
+
+    def _build_schema(self) -> Dict[str, Any]:
+        """Build tool schema for pydantic_ai."""
         return {
             "name": self.name,
             "description": self.description,
@@ -211,8 +364,33 @@ class CalendarWriterTool(BaseTool):
                         "type": "string",
                         "description": "Event location (optional)",
                     },
+                    "events": {
+                        "type": "array",
+                        "description": (
+                            "Create several events at once instead of a single "
+                            "title/start_time event. Each item takes the same fields."
+                        ),
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "title": {"type": "string"},
+                                "start_time": {"type": "string"},
+                                "end_time": {"type": "string"},
+                                "description": {"type": "string"},
+                                "location": {"type": "string"},
+                            },
+                            "required": ["title", "start_time"],
+                        },
+                    },
                 },
-                "required": ["title", "start_time"],
+                # Either one event's fields or a list of events
+                "anyOf": [
+                    {"required": ["title", "start_time"]},
+                    {"required": ["events"]},
+                ],
             },
         }
 
+    def get_schema(self) -> Dict[str, Any]:
+        """Get tool schema for pydantic_ai; a copy callers may modify."""
+        return copy.deepcopy(self._schema)
@@ -1,10 +1,18 @@
 """Context Manager tool for retrieving conversation history."""
 
+import copy
 from typing import Any, Dict
 
 from .base import BaseTool, ToolResult
 from ..context.models import ConversationContext
 
+# Returned whenever the query is missing; shared since it never varies
+_MISSING_QUERY = ToolResult(
+    success=False,
+    data=None,
+    error="Query parameter is required"
+)
+
 
 class ContextManagerTool(BaseTool):
     """Tool for retrieving previous conversation messages."""
@@ -29,6 +37,8 @@ class ContextManagerTool(BaseTool):
             ),
         )
         self.context_manager = context_manager
+        # The schema is static, so it only needs building once
+        self._schema = self._build_schema()
 
     async def execute(
         self, context: ConversationContext, **kwargs
@@ -46,11 +56,7 @@ class ContextManagerTool(BaseTool):
         """
         query = kwargs.get("query")
         if not query:
-            return ToolResult(
-                success=False,
-                data=None,
-                error="Query parameter is required"
-            )
+            return _MISSING_QUERY
 
         try:
             summary, count = await self.context_manager.get_llm_context(
@@ -75,8 +81,8 @@ class ContextManagerTool(BaseTool):
                 error=f"Failed to generate LLM context: {str(e)}"
             )
 
-    def get_schema(self) -> Dict[str, Any]:
-        """Get tool schema for pydantic_ai."""
+    def _build_schema(self) -> Dict[str, Any]:
+        """Build tool schema for pydantic_ai."""
         return {
             "name": self.name,
             "description": self.description,
@@ -92,3 +98,6 @@ class ContextManagerTool(BaseTool):
             },
         }
 
+    def get_schema(self) -> Dict[str, Any]:
+        """Get tool schema for pydantic_ai; a copy callers may modify."""
+        return copy.deepcopy(self._schema)
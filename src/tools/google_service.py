@@ -0,0 +1,442 @@
+"""Shared Google API credentials, connections and services for the Google tools."""
+
+import functools
+import logging
+import os
+import random
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Sequence, Tuple
+
+# The Google client libraries are heavy; they are imported on first use so
+# loading the calendar tools stays cheap when the calendar is never queried
+if TYPE_CHECKING:
+    from google.auth.credentials import Credentials
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Credentials keyed by scopes and credential source, so every Google API used
+# with the same account authenticates (and refreshes tokens) only once
+_credentials_cache: Dict[Tuple, "Credentials"] = {}
+# Built API resources keyed by (api, version) plus the credentials key
+_service_cache: Dict[Tuple, Any] = {}
+_service_cache_lock = threading.Lock()
+
+# httplib2.Http keeps TLS connections alive but is not thread-safe. Requests
+# run in worker threads, so each thread gets its own pooled client, shared by
+# every cached service of every Google API.
+_HTTP_TIMEOUT_SECONDS = 30
+_thread_local = threading.local()
+
+# Retry policy for rate limits and transient server errors, mirroring the
+# one notion_client applies to Notion requests
+_MAX_RETRIES = 4
+_INITIAL_RETRY_DELAY_SECONDS = 0.5
+_MAX_RETRY_DELAY_SECONDS = 30.0
+_RETRYABLE_SERVER_STATUSES = frozenset({500, 502, 503, 504})
+
+
+def get_service(
+    api: str,
+    version: str,
+    scopes: Sequence[str],
+    credentials_path: Optional[str] = None,
+    service_account_email: Optional[str] = None,
+    service_account_key: Optional[str] = None,
+    token_path: Optional[str] = None,
+) -> Any:
+    """
+    Get a Google API service, building and caching it on first use.
+
+    Authentication (including any interactive OAuth2 consent) only happens
+    the first time a set of credentials is used; later calls, including for
+    other APIs with the same credentials, reuse them. All services share the
+    per-thread HTTP connection pools.
+
+    Args:
+        api: Google API name (e.g. "calendar")
+        version: API version (e.g. "v3")
+        scopes: OAuth2 scopes the service needs
+        credentials_path: Path to OAuth2 client secrets JSON file
+        service_account_email: Service account email (alternative auth)
+        service_account_key: Service account private key (alternative auth)
+        token_path: Path where OAuth2 user tokens are persisted
+
+    Returns:
+        Google API resource
+
+    Raises:
+        ValueError: If no valid credentials could be obtained
+    """
+    creds_key = (tuple(scopes), credentials_path, service_account_email, token_path)
+    service_key = (api, version, creds_key)
+
+    with _service_cache_lock:
+        service = _service_cache.get(service_key)
+        if service is not None:
+            return service
+
+        creds = _credentials_cache.get(creds_key)
+        if creds is None:
+            creds = _load_credentials(
+                scopes,
+                credentials_path,
+                service_account_email,
+                service_account_key,
+                token_path,
+            )
+            if creds is None:
+                raise ValueError(f"Invalid Google API credentials for {api}")
+            _credentials_cache[creds_key] = creds
+
+        service = _build_service(api, version, creds)
+        _service_cache[service_key] = service
+        return service
+
+
+def get_calendar_service(
+    scopes: Sequence[str],
+    credentials_path: Optional[str] = None,
+    service_account_email: Optional[str] = None,
+    service_account_key: Optional[str] = None,
+    token_path: Optional[str] = None,
+) -> Any:
+    """
+    Get the shared Google Calendar v3 service.
+
+    Args:
+        scopes: OAuth2 scopes the service needs
+        credentials_path: Path to OAuth2 client secrets JSON file
+        service_account_email: Service account email (alternative auth)
+        service_account_key: Service account private key (alternative auth)
+        token_path: Path where OAuth2 user tokens are persisted
+
+    Returns:
+        Google Calendar API resource
+
+    Raises:
+        ValueError: If no valid credentials could be obtained
+    """
+    return get_service(
+        "calendar",
+        "v3",
+        scopes,
+        credentials_path=credentials_path,
+        service_account_email=service_account_email,
+        service_account_key=service_account_key,
+        token_path=token_path,
+    )
+
+
+def execute_with_retry(request: Any) -> Any:
+    """
+    Execute a Google API request, retrying rate limits and server errors.
+
+    429 responses are always retried, waiting for the Retry-After header
+    when the server sends one. Server errors are only retried for GET
+    requests, so writes are never duplicated. Otherwise the delay grows
+    exponentially with jitter. Blocks while waiting; call from a worker
+    thread.
+
+    Args:
+        request: googleapiclient HttpRequest
+
+    Returns:
+        Deserialized response body
+
+    Raises:
+        HttpError: If the request fails with a non-retryable status or
+            retries are exhausted
+    """
+    from googleapiclient.errors import HttpError
+
+    attempt = 0
+    while True:
+        try:
+            return request.execute()
+        except HttpError as e:
+            status = e.resp.status
+            if not _is_retryable(status, request.method) or attempt >= _MAX_RETRIES:
+                raise
+
+            delay = _retry_delay(e.resp.get("retry-after"), attempt)
+            logger.warning(
+                f"Google API returned {status}, retrying in {delay:.1f}s "
+                f"(attempt {attempt + 1}/{_MAX_RETRIES})"
+            )
+            time.sleep(delay)
+            attempt += 1
+
+
+def execute_batch_with_retry(
+    service: Any,
+    requests: Dict[str, Any],
+    callback: Callable[[str, Any, Optional[Exception]], None],
+) -> None:
+    """
+    Execute requests as one batch, retrying the ones that failed transiently.
+
+    Sub-requests are retried like execute_with_retry retries requests: 429s
+    always, server errors only for GET. The retries go out together as a
+    new batch after the backoff delay. Blocks while waiting; call from a
+    worker thread.
+
+    Args:
+        service: Google API resource the requests belong to
+        requests: Requests by batch request ID
+        callback: Called once per request ID with (request_id, response,
+            exception) for its final outcome
+
+    Raises:
+        HttpError: If the batch request itself fails
+    """
+    from googleapiclient.errors import HttpError
+
+    attempt = 0
+    while requests:
+        retry: Dict[str, Any] = {}
+        retry_after: Optional[str] = None
+
+        def collect(request_id: str, response: Any, exception: Exception) -> None:
+            nonlocal retry_after
+            request = requests[request_id]
+            if (
+                isinstance(exception, HttpError)
+                and attempt < _MAX_RETRIES
+                and _is_retryable(exception.resp.status, request.method)
+            ):
+                retry[request_id] = request
+                retry_after = exception.resp.get("retry-after") or retry_after
+                return
+            callback(request_id, response, exception)
+
+        batch = service.new_batch_http_request(callback=collect)
+        for request_id, request in requests.items():
+            batch.add(request, request_id=request_id)
+        batch.execute()
+
+        if retry:
+            delay = _retry_delay(retry_after, attempt)
+            logger.warning(
+                f"Google API batch had {len(retry)} retryable failure(s), "
+                f"retrying in {delay:.1f}s (attempt {attempt + 1}/{_MAX_RETRIES})"
+            )
+            time.sleep(delay)
+            attempt += 1
+        requests = retry
+
+
+def _is_retryable(status: int, method: str) -> bool:
+    """Whether a failed request may be sent again without duplicating writes."""
+    return status == 429 or (
+        status in _RETRYABLE_SERVER_STATUSES and method == "GET"
+    )
+
+
+def _retry_delay(retry_after: Optional[str], attempt: int) -> float:
+    """Seconds to wait before retry number attempt + 1."""
+    if retry_after:
+        try:
+            return min(max(float(retry_after), 0.0), _MAX_RETRY_DELAY_SECONDS)
+        except ValueError:
+            pass  # HTTP-date form; fall back to backoff
+    base = _INITIAL_RETRY_DELAY_SECONDS * (2 ** attempt)
+    return min(base / 2 + base * random.random(), _MAX_RETRY_DELAY_SECONDS)
+
+
+def clear_service_cache() -> None:
+    """Drop all cached services and credentials (e.g. after credentials change)."""
+    with _service_cache_lock:
+        _service_cache.clear()
+        _credentials_cache.clear()
+
+
+def _thread_http() -> Any:
+    """Get the calling thread's keep-alive httplib2 client."""
+    http = getattr(_thread_local, "http", None)
+    if http is None:
+        import httplib2
+
+        http = httplib2.Http(timeout=_HTTP_TIMEOUT_SECONDS)
+        _thread_local.http = http
+    return http
+
+
+class _ThreadLocalHttp:
+    """
+    httplib2 client stand-in that sends through the executing thread's pool.
+
+    Requests are often built on one thread and executed on another (built
+    on the event loop, run via asyncio.to_thread), and httplib2.Http is not
+    thread-safe, so the pool is looked up when a request is sent rather
+    than when it is built.
+    """
+
+    def request(self, *args, **kwargs):
+        return _thread_http().request(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(_thread_http(), name)
+
+
+def _build_service(api: str, version: str, creds: "Credentials") -> Any:
+    """
+    Build a Google API resource over pooled, per-thread HTTP connections.
+
+    Args:
+        api: Google API name
+        version: API version
+        creds: Google credentials
+
+    Returns:
+        Google API resource
+    """
+    from google_auth_httplib2 import AuthorizedHttp
+    from googleapiclient.discovery import build
+
+    # The discovery document ships with google-api-python-client, so the
+    # service is built without fetching it; a discovery cache would only
+    # add a filesystem lookup
+    return build(
+        api,
+        version,
+        # Requests and batches share this client, which sends through the
+        # pool of whichever thread executes them
+        http=AuthorizedHttp(creds, http=_ThreadLocalHttp()),
+        model=_json_model(),
+        static_discovery=True,
+        cache_discovery=False,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _json_model() -> Any:
+    """
+    Get the request/response body model shared by all Google services.
+
+    Uses orjson for (de)serialization when it is installed, falling back
+    to googleapiclient's stdlib-json model otherwise.
+
+    Returns:
+        googleapiclient JsonModel instance
+    """
+    from googleapiclient.model import JsonModel
+
+    if orjson is None:
+        return JsonModel()
+
+    class OrjsonModel(JsonModel):
+        def serialize(self, body_value):
+            return orjson.dumps(body_value).decode("utf-8")
+
+        def deserialize(self, content):
+            try:
+                return orjson.loads(content)
+            except orjson.JSONDecodeError:
+                # Non-JSON bodies are returned as text, like JsonModel does
+                return super().deserialize(content)
+
+    return OrjsonModel()
+
+
+def _load_credentials(
+    scopes: Sequence[str],
+    credentials_path: Optional[str],
+    service_account_email: Optional[str],
+    service_account_key: Optional[str],
+    token_path: Optional[str],
+) -> Optional["Credentials"]:
+    """
+    Load credentials, preferring a service account over OAuth2 user tokens.
+
+    Returns:
+        Credentials, or None if none could be obtained
+    """
+    # Try service account first; its token is fetched by the HTTP client
+    if service_account_email and service_account_key:
+        from google.oauth2.service_account import (
+            Credentials as ServiceAccountCredentials,
+        )
+
+        try:
+            return ServiceAccountCredentials.from_service_account_info(
+                {
+                    "type": "service_account",
+                    "client_email": service_account_email,
+                    "private_key": service_account_key,
+                    "token_uri": "https://oauth2.googleapis.com/token",
+                },
+                scopes=list(scopes),
+            )
+        except Exception as e:
+            logger.warning(f"Invalid Google service account credentials: {e}")
+
+    creds = _load_oauth_credentials(scopes, credentials_path, token_path)
+    if creds is None or not creds.valid:
+        return None
+    return creds
+
+
+def _load_oauth_credentials(
+    scopes: Sequence[str],
+    credentials_path: Optional[str],
+    token_path: Optional[str],
+) -> Optional["Credentials"]:
+    """
+    Load OAuth2 user credentials, refreshing persisted tokens when possible.
+
+    The interactive consent flow only runs when no usable token is stored,
+    or the stored token lacks the requested scopes. It then also asks for
+    the scopes the stored token already had, so tools sharing a token file
+    with different scopes (the calendar reader and writer) end up with one
+    token that covers both instead of replacing each other's. The token file
+    is only rewritten when the credentials changed.
+
+    Returns:
+        Credentials, or None if none could be obtained
+    """
+    from google.auth.transport.requests import Request
+    from google.oauth2.credentials import Credentials
+    from google_auth_oauthlib.flow import InstalledAppFlow
+
+    creds = None
+    granted_scopes: Sequence[str] = ()
+    changed = False
+
+    if token_path and os.path.exists(token_path):
+        try:
+            stored = Credentials.from_authorized_user_file(token_path)
+            granted_scopes = stored.scopes or ()
+            if stored.has_scopes(scopes):
+                creds = stored
+                if not creds.valid and creds.expired and creds.refresh_token:
+                    creds.refresh(Request())
+                    changed = True
+        except Exception as e:
+            logger.warning(f"Could not reuse stored Google token: {e}")
+            creds = None
+
+    if (not creds or not creds.valid) and credentials_path:
+        try:
+            flow = InstalledAppFlow.from_client_secrets_file(
+                credentials_path, list(dict.fromkeys([*granted_scopes, *scopes]))
+            )
+            creds = flow.run_local_server(port=0)
+            changed = True
+        except Exception as e:
+            logger.warning(f"Google OAuth2 flow failed: {e}")
+            return None
+
+    if changed and creds and creds.valid and token_path:
+        try:
+            with open(token_path, "w") as f:
+                f.write(creds.to_json())
+        except OSError as e:
+            logger.warning(f"Could not persist Google token: {e}")
+
+    return creds
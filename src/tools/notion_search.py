@@ -1,8 +1,16 @@
 """Notion Search tool - searches index and fetches page content."""
 
+import asyncio
+import copy
+import functools
 import logging
+import operator
+import re
+import threading
 import time
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
 
 from ..context.models import ConversationContext
 from ..memory.embeddings import EmbeddingGenerator
@@ -13,6 +21,56 @@ from .base import BaseTool, ToolResult
 if TYPE_CHECKING:
     from ..debug.trace import RequestTrace
 
+logger = logging.getLogger(__name__)
+
+# Page reads are cached briefly so repeated lookups within an agent loop
+# don't each pay a round-trip to Notion
+_PAGE_CACHE_TTL_SECONDS = 30.0
+_PAGE_CACHE_SIZE = 256
+
+# Number of query embeddings kept, so repeated searches skip the model
+_QUERY_EMBEDDING_CACHE_SIZE = 512
+
+# Recent searches reused for near-duplicate queries. Embeddings are unit
+# length, so the dot product is the cosine similarity.
+_SEMANTIC_CACHE_SIZE = 64
+_SEMANTIC_CACHE_TTL_SECONDS = 300.0
+_SEMANTIC_CACHE_MIN_SIMILARITY = 0.97
+
+# Returned whenever neither argument is given; shared since it never varies
+_MISSING_QUERY = ToolResult(
+    success=False,
+    data=None,
+    error="Either 'query' or 'page_id' parameter is required",
+)
+
+# A Notion page ID, with or without UUID dashes, ending a URL path segment
+# (after the title slug) and not part of a longer hex string
+_PAGE_ID_RE = re.compile(
+    r"(?<![0-9a-f])"
+    r"[0-9a-f]{8}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{12}$",
+    re.IGNORECASE,
+)
+
+
+def _extract_page_id(page_id: str) -> str:
+    """
+    Extract the page ID from a Notion URL or ID string.
+
+    Only the last path segment is searched, so block IDs in the fragment
+    and database view IDs in the query string are ignored. Strings without
+    a recognizable ID are returned unchanged.
+
+    Args:
+        page_id: Page ID, or a URL containing one
+
+    Returns:
+        The page ID as written in the input
+    """
+    segments = [segment for segment in urlparse(page_id).path.split("/") if segment]
+    match = _PAGE_ID_RE.search(segments[-1]) if segments else None
+    return match.group(0) if match else page_id
+
 
 class NotionSearchTool(BaseTool):
     """Tool for searching and reading Notion pages via semantic search."""
@@ -48,8 +106,24 @@ class NotionSearchTool(BaseTool):
         self.vector_store = vector_store
         self.embedding_generator = embedding_generator
         self.default_results = default_results
-        self.logger = logging.getLogger(__name__)
+        # Bound to this generator; callers must not mutate the vectors
+        self._embed_query = functools.lru_cache(
+            maxsize=_QUERY_EMBEDDING_CACHE_SIZE
+        )(embedding_generator.generate_embedding)
         self._trace: Optional["RequestTrace"] = None
+        # (query embedding, max_results) -> (expiry, results), least recent first
+        self._semantic_cache: "OrderedDict[Tuple, Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        self._semantic_cache_lock = threading.Lock()
+        # page_id -> (expiry, page data) for recently fetched pages
+        self._page_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        # page_id -> fetch in progress, shared by concurrent callers
+        self._inflight: Dict[str, "asyncio.Task[Dict[str, Any]]"] = {}
+        # The schema is static, so it only needs building once
+        self._schema = self._build_schema()
+
+    async def aclose(self) -> None:
+        """Close the pooled Notion API connections."""
+        await self.notion_client.aclose()
 
     def set_trace(self, trace: Optional["RequestTrace"]):
         """Set the request trace for search operations."""
@@ -79,6 +153,7 @@ class NotionSearchTool(BaseTool):
 
         # If page_id is provided, directly fetch that page
         if page_id:
+            page_id = _extract_page_id(page_id)
             try:
                 page_content = await self._fetch_page_content(page_id)
                 return ToolResult(
@@ -95,11 +170,7 @@ class NotionSearchTool(BaseTool):
 
         # Query is required for search
         if not query:
-            return ToolResult(
-                success=False,
-                data=None,
-                error="Either 'query' or 'page_id' parameter is required",
-            )
+            return _MISSING_QUERY
 
         # Search the index
         try:
@@ -134,7 +205,7 @@ class NotionSearchTool(BaseTool):
                     message=self._format_page_content(page_content),
                 )
             except Exception as e:
-                self.logger.warning(f"Failed to fetch page content: {e}")
+                logger.warning(f"Failed to fetch page content: {e}")
                 # Fall back to returning search results
                 return ToolResult(
                     success=True,
@@ -179,14 +250,9 @@ class NotionSearchTool(BaseTool):
                 }
             )
 
-        # Generate embedding for query
-        query_embedding = self.embedding_generator.generate_embedding(query)
-
-        # Search vector store
-        results = self.vector_store.search(
-            query_embedding=query_embedding,
-            n_results=max_results,
-        )
+        # Embedding and vector search are blocking, so run them on a worker
+        # thread to keep the event loop free for other tool calls
+        results = await asyncio.to_thread(self._query_index, query, max_results)
 
         duration_ms = (time.time() - start_time) * 1000
 
@@ -217,25 +283,132 @@ class NotionSearchTool(BaseTool):
 
         return results
 
+    def _query_index(self, query: str, max_results: int) -> List[Dict[str, Any]]:
+        """
+        Embed a query and search the vector store, blocking the caller.
+
+        Args:
+            query: Search query
+            max_results: Maximum number of results
+
+        Returns:
+            Vector store search results
+        """
+        # Generate embedding for query (cached for repeated queries)
+        query_embedding = self._embed_query(query)
+
+        cached = self._semantic_lookup(query_embedding, max_results)
+        if cached is not None:
+            return cached
+
+        results = self.vector_store.search(
+            query_embedding=query_embedding,
+            n_results=max_results,
+        )
+
+        with self._semantic_cache_lock:
+            self._semantic_cache[(tuple(query_embedding), max_results)] = (
+                time.monotonic() + _SEMANTIC_CACHE_TTL_SECONDS,
+                results,
+            )
+            if len(self._semantic_cache) > _SEMANTIC_CACHE_SIZE:
+                self._semantic_cache.popitem(last=False)
+        return list(results)
+
+    def _semantic_lookup(
+        self, query_embedding: List[float], max_results: int
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Find recent results for a query nearly identical to this one.
+
+        Args:
+            query_embedding: Unit-length query embedding
+            max_results: Maximum number of results requested
+
+        Returns:
+            Copy of the cached results, or None if no close match
+        """
+        now = time.monotonic()
+        best_key = None
+        best_similarity = _SEMANTIC_CACHE_MIN_SIMILARITY
+
+        with self._semantic_cache_lock:
+            for key, (expiry, _) in list(self._semantic_cache.items()):
+                if expiry <= now:
+                    del self._semantic_cache[key]
+                    continue
+                embedding, cached_max_results = key
+                if cached_max_results != max_results:
+                    continue
+                similarity = sum(map(operator.mul, embedding, query_embedding))
+                if similarity >= best_similarity:
+                    best_key, best_similarity = key, similarity
+
+            if best_key is None:
+                return None
+            self._semantic_cache.move_to_end(best_key)
+            return list(self._semantic_cache[best_key][1])
+
     async def _fetch_page_content(self, page_id: str) -> Dict[str, Any]:
         """
         Fetch full content of a specific page.
 
+        Pages read in the last _PAGE_CACHE_TTL_SECONDS are served from
+        cache, and concurrent requests for the same page share one fetch.
+
         Args:
             page_id: Notion page ID
 
         Returns:
             Dictionary with page content and metadata
         """
-        # Get page metadata
-        page = self.notion_client.get_page(page_id)
-        title = self.notion_client.get_page_title(page)
+        now = time.monotonic()
+        cached = self._page_cache.get(page_id)
+        if cached is not None:
+            expiry, page_data = cached
+            if expiry > now:
+                return dict(page_data)
+            del self._page_cache[page_id]
+
+        task = self._inflight.get(page_id)
+        if task is None:
+            task = asyncio.ensure_future(self._load_page_content(page_id))
+            self._inflight[page_id] = task
+            task.add_done_callback(
+                lambda _: self._inflight.pop(page_id, None)
+            )
 
-        # Get full content
-        content = self.notion_client.get_page_content(page_id)
+        # Shield so one cancelled caller doesn't cancel the shared fetch
+        page_data = await asyncio.shield(task)
+
+        if len(self._page_cache) >= _PAGE_CACHE_SIZE:
+            self._page_cache.clear()
+        self._page_cache[page_id] = (
+            time.monotonic() + _PAGE_CACHE_TTL_SECONDS,
+            page_data,
+        )
+        return dict(page_data)
+
+    async def _load_page_content(self, page_id: str) -> Dict[str, Any]:
+        """
+        Fetch full content of a specific page from Notion.
 
-        # Get stored metadata from index if available
-        stored = self.vector_store.get_by_id(page_id)
+        Args:
+            page_id: Notion page ID
+
+        Returns:
+            Dictionary with page content and metadata
+        """
+        # Page metadata, block content and stored index metadata don't
+        # depend on each other, so fetch them in parallel
+        page, content, stored = await asyncio.gather(
+            self.notion_client.get_page_async(page_id),
+            self.notion_client.get_page_content_async(page_id),
+            asyncio.to_thread(self.vector_store.get_by_id, page_id),
+        )
+        title = self.notion_client.get_page_title(page)
+
+        # Use stored metadata from index if available
         path = stored.get("metadata", {}).get("path", title) if stored else title
         summary = stored.get("metadata", {}).get("summary", "") if stored else ""
 
@@ -249,47 +422,32 @@ class NotionSearchTool(BaseTool):
 
     def _format_search_results(self, results: List[Dict[str, Any]]) -> str:
         """Format search results for display."""
-        lines = [f"Found {len(results)} matching page(s):\n"]
-
+        entries = [f"Found {len(results)} matching page(s):\n"]
         for i, result in enumerate(results, 1):
             metadata = result.get("metadata", {})
-            title = metadata.get("title", "Untitled")
-            path = metadata.get("path", title)
-            summary = metadata.get("summary", "")
-            page_id = metadata.get("page_id", "")
-
-            lines.append(f"{i}. **{path}**")
-            if summary:
-                lines.append(f"   {summary}")
-            lines.append(f"   Page ID: {page_id}")
-            lines.append("")
+            path = metadata.get("path", metadata.get("title", "Untitled"))
+            summary = metadata.get("summary")
+            summary_line = f"   {summary}\n" if summary else ""
+            entries.append(
+                f"{i}. **{path}**\n{summary_line}"
+                f"   Page ID: {metadata.get('page_id', '')}\n"
+            )
 
-        return "\n".join(lines)
+        return "\n".join(entries)
 
     def _format_page_content(self, page_data: Dict[str, Any]) -> str:
         """Format page content for display."""
-        lines = [
-            f"# {page_data['title']}",
-            f"Path: {page_data['path']}",
-            "",
-        ]
-
-        if page_data.get("summary"):
-            lines.extend([
-                "**Summary:**",
-                page_data["summary"],
-                "",
-            ])
-
-        lines.extend([
-            "**Content:**",
-            page_data.get("content", ""),
-        ])
-
-        return "\n".join(lines)
+        summary = page_data.get("summary")
+        summary_section = f"**Summary:**\n{summary}\n\n" if summary else ""
+        return (
+            f"# {page_data['title']}\n"
+            f"Path: {page_data['path']}\n\n"
+            f"{summary_section}"
+            f"**Content:**\n{page_data.get('content', '')}"
+        )
 
-    def get_schema(self) -> Dict[str, Any]:
-        """Get tool schema for pydantic_ai."""
+    def _build_schema(self) -> Dict[str, Any]:
+        """Build tool schema for pydantic_ai."""
         return {
             "name": self.name,
             "description": self.description,
@@ -307,7 +465,7 @@ class NotionSearchTool(BaseTool):
                     },
                     "page_id": {
                         "type": "string",
-                        "description": "Specific page ID to read (bypasses search)",
+                        "description": "Specific page ID or Notion page URL to read (bypasses search)",
                     },
                     "max_results": {
                         "type": "integer",
@@ -318,3 +476,7 @@ class NotionSearchTool(BaseTool):
                 "required": [],
             },
         }
+
+    def get_schema(self) -> Dict[str, Any]:
+        """Get tool schema for pydantic_ai; a copy callers may modify."""
+        return copy.deepcopy(self._schema)
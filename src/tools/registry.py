@@ -1,10 +1,13 @@
 """Centralized tool registry."""
 
+import logging
 from typing import Dict, List, Optional
 
 from .base import BaseTool
 from ..config.config_schema import AppConfig
 
+logger = logging.getLogger(__name__)
+
 
 class ToolRegistry:
     """Centralized registry for all tools."""
@@ -43,6 +46,14 @@ class ToolRegistry:
         """
         return list(self._tools.values())
 
+    async def aclose(self) -> None:
+        """Release the resources of every registered tool, e.g. on shutdown."""
+        for tool in self._tools.values():
+            try:
+                await tool.aclose()
+            except Exception as e:
+                logger.warning(f"Error closing tool {tool.get_name()}: {e}")
+
     def initialize_tools(
         self, config: AppConfig, context_manager=None
     ) -> None:
@@ -66,6 +77,7 @@ class ToolRegistry:
         if config.tools.notion and config.tools.notion.api_key:
             try:
                 from ..memory.vector_store import VectorStore
+                from ..memory.embedding_cache import EmbeddingCache
                 from ..memory.embeddings import EmbeddingGenerator
                 from .notion_search import NotionSearchTool
 
@@ -74,7 +86,10 @@ class ToolRegistry:
                     db_path=config.database.vector_db_path,
                     collection_name=config.tools.notion.index_collection,
                 )
-                embedding_generator = EmbeddingGenerator()
+                embedding_generator = EmbeddingGenerator(
+                    cache=EmbeddingCache(config.database.embedding_cache),
+                    precision=config.tools.notion.embedding_precision,
+                )
 
                 notion_search = NotionSearchTool(
                     api_key=config.tools.notion.api_key,
@@ -103,11 +118,13 @@ class ToolRegistry:
                     credentials_path=cal_config.credentials_path,
                     service_account_email=cal_config.service_account_email,
                     service_account_key=cal_config.service_account_key,
+                    token_path=cal_config.token_path,
                 )
                 calendar_writer = CalendarWriterTool(
                     credentials_path=cal_config.credentials_path,
                     service_account_email=cal_config.service_account_email,
                     service_account_key=cal_config.service_account_key,
+                    token_path=cal_config.token_path,
                 )
                 self.register_tool(calendar_reader)
                 self.register_tool(calendar_writer)
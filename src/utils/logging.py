@@ -1,11 +1,21 @@
 """Logging utility with verbosity levels and file logging."""
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+# Rotate the log file at this size, keeping this many old files
+_LOG_FILE_MAX_BYTES = 50_000_000
+_LOG_FILE_BACKUP_COUNT = 5
+
+# Background thread writing queued records to the log file
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
 
 def setup_logging(
     verbosity: int = 0,
@@ -49,6 +59,7 @@ def setup_logging(
 
     # Clear existing handlers
     root_logger.handlers.clear()
+    _stop_queue_listener()
 
     # Console handler with verbosity-based level
     # But always show ERROR and CRITICAL messages
@@ -62,15 +73,29 @@ def setup_logging(
     console_handler.setFormatter(console_format)
     root_logger.addHandler(console_handler)
 
-    # File handler (always DEBUG level to capture everything)
-    file_handler = logging.FileHandler(log_file, encoding="utf-8")
+    # File handler (always DEBUG level to capture everything). Records are
+    # queued and written by a background thread, so logging calls on hot
+    # paths never wait on disk I/O.
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_file,
+        maxBytes=_LOG_FILE_MAX_BYTES,
+        backupCount=_LOG_FILE_BACKUP_COUNT,
+        encoding="utf-8",
+    )
     file_handler.setLevel(logging.DEBUG)
     file_format = logging.Formatter(
         "%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
     file_handler.setFormatter(file_format)
-    root_logger.addHandler(file_handler)
+
+    global _queue_listener
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, file_handler, respect_handler_level=True
+    )
+    _queue_listener.start()
 
     logger = logging.getLogger(__name__)
     logger.info(f"Logging initialized. Verbosity: {verbosity}, Log file: {log_file}")
@@ -78,6 +103,20 @@ def setup_logging(
     return logger
 
 
+def _stop_queue_listener() -> None:
+    """Flush queued records to the log file and stop the writer thread."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+
+
+# Write out anything still queued when the process exits
+atexit.register(_stop_queue_listener)
+
+
 def parse_verbosity(args: list) -> int:
     """
     Parse verbosity level from command line arguments.
@@ -1,6 +1,7 @@
 """Base class for web debug UI subsections."""
 
 from abc import ABC, abstractmethod
+from pathlib import Path
 from typing import Any, Dict, Optional
 import logging
 
@@ -94,6 +95,21 @@ class BaseSubsection(ABC):
         logger.warning(f"Unhandled action '{action}' in {self.name}")
         return {"error": f"Unknown action: {action}"}
 
+    async def get_file(self, file_id: str) -> Optional[Path]:
+        """
+        Get a file the frontend can download over HTTP.
+
+        Override to serve large payloads from disk instead of passing them
+        through a WebSocket action.
+
+        Args:
+            file_id: Subsection-specific file identifier
+
+        Returns:
+            Path to the file, or None if there is no such file
+        """
+        return None
+
     def get_metadata(self) -> Dict[str, Any]:
         """Get subsection metadata for UI."""
         return {
@@ -1,6 +1,6 @@
 """Subsection registry for web debug UI."""
 
-from typing import Dict, List, Optional, Type
+from typing import Dict, List, Optional, Tuple, Type
 import logging
 
 from .base import BaseSubsection
@@ -39,21 +39,28 @@ class SubsectionRegistry:
 
     def __init__(self):
         self._subsections: Dict[str, BaseSubsection] = {}
+        # Priority-ordered view, rebuilt only after a registration
+        self._sorted_cache: Optional[Tuple[BaseSubsection, ...]] = None
 
     def register(self, subsection_instance: BaseSubsection) -> None:
         """Register a subsection."""
         if subsection_instance.name in self._subsections:
             logger.warning(f"Overwriting subsection: {subsection_instance.name}")
         self._subsections[subsection_instance.name] = subsection_instance
+        self._sorted_cache = None
         logger.debug(f"Registered subsection: {subsection_instance.name}")
 
     def get(self, name: str) -> Optional[BaseSubsection]:
         """Get subsection by name."""
         return self._subsections.get(name)
 
-    def get_all(self) -> List[BaseSubsection]:
+    def get_all(self) -> Tuple[BaseSubsection, ...]:
         """Get all subsections sorted by priority."""
-        return sorted(self._subsections.values(), key=lambda s: s.priority)
+        if self._sorted_cache is None:
+            self._sorted_cache = tuple(
+                sorted(self._subsections.values(), key=lambda s: s.priority)
+            )
+        return self._sorted_cache
 
     def get_metadata_list(self) -> List[Dict]:
         """Get metadata for all subsections."""
@@ -1,13 +1,21 @@
 """FastAPI web server for debug UI."""
 
 import asyncio
+import hashlib
 import logging
-from typing import Dict, Any, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from pathlib import Path
 
 import uvicorn
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
-from fastapi.responses import HTMLResponse, FileResponse
+from fastapi import (
+    FastAPI,
+    HTTPException,
+    Request,
+    Response,
+    WebSocket,
+)
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, HTMLResponse
 from fastapi.staticfiles import StaticFiles
 
 from .registry import SubsectionRegistry
@@ -15,6 +23,12 @@ from .websocket_manager import ConnectionManager
 
 logger = logging.getLogger(__name__)
 
+try:
+    import httptools  # noqa: F401
+    _HTTP_PROTOCOL = "httptools"
+except ImportError:
+    _HTTP_PROTOCOL = "h11"
+
 
 class WebDebugServer:
     """Web server for debug UI with live updates."""
@@ -29,9 +43,28 @@ class WebDebugServer:
         self.port = port
         self.registry = registry
         self.app = FastAPI(title="Personal Agent Debug UI")
+        # Subsection templates and the UI's assets compress well; WebSocket
+        # traffic is not affected
+        self.app.add_middleware(GZipMiddleware, minimum_size=1024)
         self.manager = ConnectionManager()
         self._server: Optional[uvicorn.Server] = None
         self._static_dir = Path(__file__).parent / "static"
+        # The page is fixed at install time, so it is read once and served
+        # from memory
+        self._index_page = self._load_index_page()
+        # subsection -> (updates queued this loop tick, future for their send)
+        self._pending_updates: Dict[
+            str, Tuple[List[Dict[str, Any]], asyncio.Future]
+        ] = {}
+
+        # Client message type -> handler
+        self._ws_handlers: Dict[
+            str, Callable[[WebSocket, Dict[str, Any]], Awaitable[None]]
+        ] = {
+            "subscribe": self._on_subscribe,
+            "unsubscribe": self._on_unsubscribe,
+            "action": self._on_action,
+        }
 
         self._setup_routes()
 
@@ -39,20 +72,23 @@ class WebDebugServer:
         """Configure FastAPI routes."""
 
         @self.app.get("/", response_class=HTMLResponse)
-        async def index():
-            """Serve the main HTML page."""
-            index_path = self._static_dir / "index.html"
-            if not index_path.exists():
+        async def index(request: Request):
+            """Serve the main HTML page, or 304 if the client's copy is current."""
+            if self._index_page is None:
                 raise HTTPException(status_code=404, detail="index.html not found")
-            return index_path.read_text()
 
-        @self.app.get("/static/{file_path:path}")
-        async def serve_static(file_path: str):
-            """Serve static files."""
-            full_path = self._static_dir / file_path
-            if not full_path.exists() or not full_path.is_file():
-                raise HTTPException(status_code=404, detail="File not found")
-            return FileResponse(full_path)
+            body, etag = self._index_page
+            # Clients revalidate every time, so an upgraded UI is never
+            # stale, but an unchanged page costs only a 304
+            headers = {"ETag": etag, "Cache-Control": "no-cache"}
+            if request.headers.get("if-none-match") == etag:
+                return Response(status_code=304, headers=headers)
+            return HTMLResponse(content=body, headers=headers)
+
+        # Starlette serves assets with ETag/Last-Modified, 304s and ranges
+        self.app.mount(
+            "/static", StaticFiles(directory=str(self._static_dir)), name="static"
+        )
 
         @self.app.get("/api/subsections")
         async def get_subsections():
@@ -76,73 +112,139 @@ class WebDebugServer:
                 "template": await subsection.get_html_template(),
             }
 
+        @self.app.get("/api/subsection/{name}/file/{file_id}")
+        async def get_subsection_file(name: str, file_id: str):
+            """Stream a file provided by a subsection."""
+            subsection = self.registry.get(name) if self.registry else None
+            path = await subsection.get_file(file_id) if subsection else None
+            if path is None:
+                raise HTTPException(status_code=404, detail="File not found")
+
+            # Sent from disk in chunks, never parsed or held in memory whole
+            return FileResponse(path, headers={"Cache-Control": "no-cache"})
+
         @self.app.websocket("/ws")
         async def websocket_endpoint(websocket: WebSocket):
             """Handle WebSocket connections for live updates."""
             await self.manager.connect(websocket)
             try:
-                while True:
-                    data = await websocket.receive_json()
+                # Ends cleanly when the client disconnects
+                async for data in websocket.iter_json():
                     await self._handle_ws_message(websocket, data)
-            except WebSocketDisconnect:
-                self.manager.disconnect(websocket)
             except Exception as e:
                 logger.debug(f"WebSocket error: {e}")
+            finally:
                 self.manager.disconnect(websocket)
 
+    def _load_index_page(self) -> Optional[Tuple[bytes, str]]:
+        """
+        Read the main HTML page into memory.
+
+        Returns:
+            (body, ETag), or None if index.html is missing
+        """
+        index_path = self._static_dir / "index.html"
+        if not index_path.is_file():
+            return None
+        body = index_path.read_bytes()
+        return body, f'"{hashlib.sha1(body).hexdigest()[:16]}"'
+
     async def _handle_ws_message(self, websocket: WebSocket, data: Dict[str, Any]):
         """Handle WebSocket message from client."""
-        msg_type = data.get("type")
+        handler = self._ws_handlers.get(data.get("type"))
+        if handler:
+            await handler(websocket, data)
 
-        if msg_type == "subscribe":
-            subsection_name = data.get("subsection")
-            if subsection_name:
-                await self.manager.subscribe(websocket, subsection_name)
+    async def _on_subscribe(self, websocket: WebSocket, data: Dict[str, Any]):
+        """Subscribe the client to a subsection's updates."""
+        subsection_name = data.get("subsection")
+        if subsection_name:
+            await self.manager.subscribe(websocket, subsection_name)
 
-        elif msg_type == "unsubscribe":
-            subsection_name = data.get("subsection")
-            if subsection_name:
-                self.manager.unsubscribe(websocket, subsection_name)
+    async def _on_unsubscribe(self, websocket: WebSocket, data: Dict[str, Any]):
+        """Unsubscribe the client from a subsection's updates."""
+        subsection_name = data.get("subsection")
+        if subsection_name:
+            self.manager.unsubscribe(websocket, subsection_name)
 
-        elif msg_type == "action":
-            subsection_name = data.get("subsection")
-            action = data.get("action")
-            payload = data.get("data", {})
+    async def _on_action(self, websocket: WebSocket, data: Dict[str, Any]):
+        """Run a subsection action and send its result back to the client."""
+        if not self.registry:
+            return
 
-            if not self.registry:
-                return
-
-            subsection = self.registry.get(subsection_name)
-            if subsection and action:
-                result = await subsection.handle_action(action, payload)
-                await websocket.send_json(
-                    {
-                        "type": "action_result",
-                        "subsection": subsection_name,
-                        "action": action,
-                        "result": result,
-                    }
-                )
+        subsection_name = data.get("subsection")
+        action = data.get("action")
+        subsection = self.registry.get(subsection_name)
+        if subsection and action:
+            result = await subsection.handle_action(action, data.get("data", {}))
+            await self.manager.send(
+                websocket,
+                {
+                    "type": "action_result",
+                    "subsection": subsection_name,
+                    "action": action,
+                    "result": result,
+                },
+            )
 
     async def broadcast_update(self, subsection_name: str, data: Dict[str, Any]) -> None:
-        """Broadcast update to all subscribed clients."""
-        await self.manager.broadcast_to_subsection(
-            subsection_name,
-            {
-                "type": "update",
-                "subsection": subsection_name,
-                "data": data,
-            },
-        )
+        """
+        Broadcast update to all subscribed clients.
+
+        Updates for the same subsection queued within one event loop tick
+        are coalesced into a single "update_batch" message.
+
+        Args:
+            subsection_name: Subsection the update belongs to
+            data: Update data
+        """
+        pending = self._pending_updates.get(subsection_name)
+        if pending is None:
+            loop = asyncio.get_running_loop()
+            pending = ([], loop.create_future())
+            self._pending_updates[subsection_name] = pending
+            loop.call_soon(self._flush_updates, subsection_name)
+
+        updates, sent = pending
+        updates.append(data)
+        await asyncio.shield(sent)
+
+    def _flush_updates(self, subsection_name: str) -> None:
+        """Send the updates queued for a subsection in one message."""
+        updates, sent = self._pending_updates.pop(subsection_name)
+        asyncio.ensure_future(self._send_updates(subsection_name, updates, sent))
+
+    async def _send_updates(
+        self,
+        subsection_name: str,
+        updates: List[Dict[str, Any]],
+        sent: asyncio.Future,
+    ) -> None:
+        """Broadcast queued updates and wake their callers."""
+        message: Dict[str, Any] = {"subsection": subsection_name}
+        if len(updates) == 1:
+            message.update(type="update", data=updates[0])
+        else:
+            message.update(type="update_batch", items=updates)
+
+        try:
+            await self.manager.broadcast_to_subsection(subsection_name, message)
+        finally:
+            if not sent.done():
+                sent.set_result(None)
 
     async def start(self) -> None:
         """Start the web server."""
+        # The server shares the caller's event loop (uvloop when main.py
+        # installs it), so only the HTTP parser is chosen here
         config = uvicorn.Config(
             self.app,
             host=self.host,
             port=self.port,
             log_level="warning",
             access_log=False,
+            http=_HTTP_PROTOCOL,
+            ws_per_message_deflate=False,
         )
         self._server = uvicorn.Server(config)
         await self._server.serve()
@@ -7,6 +7,7 @@ function debugApp() {
         data: {},
         wsStatus: 'connecting',
         ws: null,
+        wsDecoder: new TextDecoder(),
         overflowOpen: false,
         visibleCount: 5,
         loading: true,
@@ -93,6 +94,7 @@ function debugApp() {
 
             try {
                 this.ws = new WebSocket(wsUrl);
+                this.ws.binaryType = 'arraybuffer';
                 this.wsStatus = 'connecting';
 
                 this.ws.onopen = () => {
@@ -121,7 +123,11 @@ function debugApp() {
 
                 this.ws.onmessage = (event) => {
                     try {
-                        const message = JSON.parse(event.data);
+                        // The server sends UTF-8 JSON in binary frames
+                        const text = typeof event.data === 'string'
+                            ? event.data
+                            : this.wsDecoder.decode(event.data);
+                        const message = JSON.parse(text);
                         this.handleWSMessage(message);
                     } catch (e) {
                         console.error('Failed to parse WebSocket message:', e);
@@ -151,7 +157,12 @@ function debugApp() {
         },
 
         handleWSMessage(message) {
-            if (message.type === 'update' && message.subsection === this.activeSection) {
+            if (message.type === 'update_batch') {
+                // Several updates coalesced by the server into one frame
+                for (const data of message.items) {
+                    this.handleWSMessage({ type: 'update', subsection: message.subsection, data });
+                }
+            } else if (message.type === 'update' && message.subsection === this.activeSection) {
                 // Merge update into current data
                 if (message.data) {
                     // Special handling for new conversations
@@ -172,6 +183,9 @@ function debugApp() {
                         }
                         // Dispatch event for subsection component to handle details
                         window.dispatchEvent(new CustomEvent('conversation-update', { detail: update }));
+                    } else if (message.data.new_logs && this.activeSection === 'logs') {
+                        // Append streamed entries, keeping as many as the server does
+                        this.data.logs = [...this.data.logs, ...message.data.new_logs].slice(-500);
                     } else {
                         // Deep merge for nested objects, replace for arrays
                         for (const [key, value] of Object.entries(message.data)) {
@@ -356,12 +370,15 @@ function conversationDebugger() {
             if (!conv) return;
 
             try {
-                window.dispatchEvent(new CustomEvent('send-action', {
-                    detail: {
-                        action: 'load_trace',
-                        data: { trace_id: traceId }
-                    }
-                }));
+                // Traces can be large, so they are downloaded over HTTP
+                // rather than sent through the WebSocket
+                const response = await fetch(
+                    `/api/subsection/conversations/file/${encodeURIComponent(traceId)}`
+                );
+                if (!response.ok) {
+                    throw new Error(`HTTP ${response.status}`);
+                }
+                this.handleTraceLoaded(await response.json());
             } catch (e) {
                 console.error('Failed to load trace:', e);
             }
@@ -1,7 +1,14 @@
 """Configuration viewer subsection."""
 
+import copy
 import json
-from typing import Any, Dict, Optional
+import re
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from ..base import BaseSubsection
 from ..registry import subsection
@@ -9,11 +16,18 @@ from ..registry import subsection
 # Global config reference
 _config: Optional[Any] = None
 
+# (id of the config, masked dict, JSON text) for the config last displayed
+_display_cache: Optional[Tuple[int, Dict[str, Any], str]] = None
+
+# Config keys whose values are masked
+_SECRET_RE = re.compile(r"token|key|secret|password|credential", re.IGNORECASE)
+
 
 def set_config(config: Any) -> None:
     """Set the global config reference for the viewer."""
-    global _config
+    global _config, _display_cache
     _config = config
+    _display_cache = None
 
 
 def get_config() -> Optional[Any]:
@@ -21,49 +35,73 @@ def get_config() -> Optional[Any]:
     return _config
 
 
+def _mask_value(value: Any) -> Any:
+    """Mask a secret value, keeping a short prefix of strings."""
+    if isinstance(value, str) and len(value) > 4:
+        return value[:4] + "*" * (len(value) - 4)
+    elif value:
+        return "***"
+    return value
+
+
+def _mask_secrets(root: Any) -> Any:
+    """
+    Mask secret values in place throughout nested dicts and lists.
+
+    Args:
+        root: Dict or list to mask; it is modified, so pass a copy
+
+    Returns:
+        root, after masking
+    """
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            for key, value in node.items():
+                # Mask fields that likely contain secrets
+                if _SECRET_RE.search(key):
+                    node[key] = _mask_value(value)
+                elif isinstance(value, (dict, list)):
+                    stack.append(value)
+        elif isinstance(node, list):
+            stack.extend(item for item in node if isinstance(item, (dict, list)))
+    return root
+
+
 def config_to_display_dict(config: Any) -> Dict[str, Any]:
     """Convert config to a display-safe dictionary (masks secrets)."""
     if config is None:
         return {}
 
     try:
-        # Convert Pydantic model to dict
+        # Convert Pydantic model to dict; the dumps are fresh copies
         if hasattr(config, "model_dump"):
             config_dict = config.model_dump()
         elif hasattr(config, "dict"):
             config_dict = config.dict()
         else:
-            config_dict = dict(config)
-
-        # Mask sensitive fields
-        def mask_secrets(obj: Any, path: str = "") -> Any:
-            if isinstance(obj, dict):
-                masked = {}
-                for key, value in obj.items():
-                    current_path = f"{path}.{key}" if path else key
-                    # Mask fields that likely contain secrets
-                    if any(
-                        secret in key.lower()
-                        for secret in ["token", "key", "secret", "password", "credential"]
-                    ):
-                        if isinstance(value, str) and len(value) > 4:
-                            masked[key] = value[:4] + "*" * (len(value) - 4)
-                        elif value:
-                            masked[key] = "***"
-                        else:
-                            masked[key] = value
-                    else:
-                        masked[key] = mask_secrets(value, current_path)
-                return masked
-            elif isinstance(obj, list):
-                return [mask_secrets(item, path) for item in obj]
-            return obj
-
-        return mask_secrets(config_dict)
+            config_dict = copy.deepcopy(dict(config))
+
+        return _mask_secrets(config_dict)
     except Exception as e:
         return {"error": f"Failed to serialize config: {str(e)}"}
 
 
+# Template for the config viewer
+_HTML_TEMPLATE = '''
+<div class="config-viewer">
+    <h3>Current Configuration (Read-Only)</h3>
+    <p style="color: #6b7280; font-size: 13px; margin-bottom: 16px;">
+        Sensitive values (tokens, keys, secrets) are masked for security.
+    </p>
+    <div class="config-content">
+        <pre x-text="data.config_json"></pre>
+    </div>
+</div>
+'''
+
+
 @subsection
 class ConfigViewerSubsection(BaseSubsection):
     """Read-only configuration viewer subsection."""
@@ -78,24 +116,27 @@ class ConfigViewerSubsection(BaseSubsection):
 
     async def get_initial_data(self) -> Dict[str, Any]:
         """Get initial config data."""
+        global _display_cache
         config = get_config()
-        config_dict = config_to_display_dict(config)
 
+        # The config is replaced, not edited, so it is masked and
+        # serialized once per config object
+        if _display_cache is None or _display_cache[0] != id(config):
+            config_dict = config_to_display_dict(config)
+            if orjson is not None:
+                config_json = orjson.dumps(
+                    config_dict, option=orjson.OPT_INDENT_2, default=str
+                ).decode("utf-8")
+            else:
+                config_json = json.dumps(config_dict, indent=2, default=str)
+            _display_cache = (id(config), config_dict, config_json)
+
+        _, config_dict, config_json = _display_cache
         return {
             "config": config_dict,
-            "config_json": json.dumps(config_dict, indent=2, default=str),
+            "config_json": config_json,
         }
 
     async def get_html_template(self) -> str:
         """Get HTML template for config viewer."""
-        return '''
-<div class="config-viewer">
-    <h3>Current Configuration (Read-Only)</h3>
-    <p style="color: #6b7280; font-size: 13px; margin-bottom: 16px;">
-        Sensitive values (tokens, keys, secrets) are masked for security.
-    </p>
-    <div class="config-content">
-        <pre x-text="data.config_json"></pre>
-    </div>
-</div>
-'''
+        return _HTML_TEMPLATE
@@ -1,85 +1,52 @@
 """Conversation debugger subsection for web UI."""
 
+import asyncio
 import json
 import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from ...debug.response_logger import SUMMARY_SUFFIX, build_trace_summary
 from ..base import BaseSubsection
 from ..registry import subsection
 
 logger = logging.getLogger(__name__)
 
+# Threads used to read trace files in parallel during a directory scan
+_SCAN_WORKERS = 8
 
-@subsection
-class ConversationDebuggerSubsection(BaseSubsection):
-    """Displays conversation traces for debugging."""
-
-    def __init__(self, log_dir: str = "logs/responses"):
-        """Initialize conversation debugger.
-
-        Args:
-            log_dir: Directory containing JSON trace files
-        """
-        super().__init__(
-            name="conversations",
-            display_name="Conversation Debugger",
-            priority=30,
-            icon="💬",
-        )
-        self.log_dir = Path(log_dir)
-
-    async def get_initial_data(self) -> Dict[str, Any]:
-        """Load all conversation traces from disk.
-
-        Returns:
-            Dictionary with list of conversations
-        """
-        conversations = self._load_conversations()
-        return {"conversations": conversations}
+# A lookup miss rescans an unchanged directory at most this often, in case
+# a file was written within the mtime granularity of the last scan
+_MISS_RESCAN_INTERVAL_SECONDS = 2.0
 
-    def _load_conversations(self) -> List[Dict[str, Any]]:
-        """Scan log directory for JSON trace files.
 
-        Returns:
-            List of conversation summaries sorted by timestamp (newest first)
-        """
-        if not self.log_dir.exists():
-            return []
+def _read_trace(path: Path) -> Dict[str, Any]:
+    """Parse a JSON trace file, with orjson when it is installed.
 
-        conversations = []
-        for json_file in self.log_dir.glob("response_*.json"):
-            try:
-                with open(json_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-
-                # Extract summary info
-                conversations.append({
-                    "trace_id": data.get("trace_id", ""),
-                    "chat_id": data.get("chat_id", 0),
-                    "user_id": data.get("user_id"),
-                    "timestamp": data.get("timestamp", ""),
-                    "duration_ms": data.get("duration_ms", 0),
-                    "user_message": data.get("user_message", "")[:100],  # Truncate
-                    "event_count": len(data.get("events", [])),
-                    "file_path": str(json_file),
-                })
-            except Exception as e:
-                logger.warning(f"Failed to load {json_file}: {e}")
-                continue
+    Args:
+        path: Trace file path
 
-        # Sort by timestamp descending (newest first)
-        conversations.sort(key=lambda x: x["timestamp"], reverse=True)
-        return conversations
+    Returns:
+        Parsed trace data
+    """
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
 
-    async def get_html_template(self) -> str:
-        """Return HTML template for conversation debugger.
 
-        Returns:
-            HTML string with Alpine.js directives
-        """
-        return """
+# Markup, styles and Alpine.js component for the debugger panel
+_HTML_TEMPLATE = """
 <div class="conversation-debugger" x-data="conversationDebugger()">
     <div class="debugger-layout">
         <!-- Left Panel: Conversation Selector -->
@@ -579,6 +546,145 @@ class ConversationDebuggerSubsection(BaseSubsection):
 </style>
 """
 
+
+@subsection
+class ConversationDebuggerSubsection(BaseSubsection):
+    """Displays conversation traces for debugging."""
+
+    def __init__(self, log_dir: str = "logs/responses"):
+        """Initialize conversation debugger.
+
+        Args:
+            log_dir: Directory containing JSON trace files
+        """
+        super().__init__(
+            name="conversations",
+            display_name="Conversation Debugger",
+            priority=30,
+            icon="💬",
+        )
+        self.log_dir = Path(log_dir)
+        # trace_id -> trace file, and the summaries from the same scan. Trace
+        # files are written once, so the scan is only redone when the
+        # directory's mtime changes (a file was added or removed).
+        self._trace_index: Dict[str, Path] = {}
+        self._conversations: List[Dict[str, Any]] = []
+        self._dir_mtime: Optional[int] = None
+        # time.monotonic() of the last scan
+        self._scanned_at = 0.0
+        # Keeps concurrent worker threads from rescanning at the same time
+        self._index_lock = threading.Lock()
+
+    async def get_initial_data(self) -> Dict[str, Any]:
+        """Load all conversation traces from disk.
+
+        Returns:
+            Dictionary with list of conversations
+        """
+        # Scanning reads files, so keep it off the event loop
+        conversations = await asyncio.to_thread(self._load_conversations)
+        return {"conversations": conversations}
+
+    def _load_conversations(self) -> List[Dict[str, Any]]:
+        """Get summaries of the JSON trace files in the log directory.
+
+        Returns:
+            List of conversation summaries sorted by timestamp (newest first)
+        """
+        self._refresh_index_if_stale()
+        return list(self._conversations)
+
+    def _refresh_index_if_stale(self, max_age: Optional[float] = None) -> None:
+        """Rescan the log directory if files were added or removed.
+
+        Args:
+            max_age: Also rescan if the last scan is older than this many
+                seconds, even if the directory's mtime is unchanged
+        """
+        with self._index_lock:
+            try:
+                mtime = self.log_dir.stat().st_mtime_ns
+            except FileNotFoundError:
+                self._trace_index = {}
+                self._conversations = []
+                self._dir_mtime = None
+                return
+
+            expired = (
+                max_age is not None
+                and time.monotonic() - self._scanned_at > max_age
+            )
+            if mtime != self._dir_mtime or expired:
+                self._conversations = self._scan_conversations()
+                self._dir_mtime = mtime
+                self._scanned_at = time.monotonic()
+
+    def _scan_conversations(self) -> List[Dict[str, Any]]:
+        """Read every JSON trace file and rebuild the trace index.
+
+        Returns:
+            List of conversation summaries sorted by timestamp (newest first)
+        """
+        # scandir filters on names without a stat per file, unlike Path.glob;
+        # is_file() uses the file type read with the directory entry
+        with os.scandir(self.log_dir) as entries:
+            names = {entry.name for entry in entries if entry.is_file()}
+        json_files = [
+            self.log_dir / name
+            for name in names
+            if name.startswith("response_")
+            and name.endswith(".json")
+            and not name.endswith(SUMMARY_SUFFIX)
+        ]
+        has_summary = [
+            json_file.with_suffix(SUMMARY_SUFFIX).name in names
+            for json_file in json_files
+        ]
+
+        with ThreadPoolExecutor(max_workers=_SCAN_WORKERS) as executor:
+            summaries = executor.map(self._summarize_trace, json_files, has_summary)
+            conversations = [summary for summary in summaries if summary]
+
+        # Sort by timestamp descending (newest first)
+        conversations.sort(key=lambda x: x["timestamp"], reverse=True)
+        self._trace_index = {
+            conv["trace_id"]: Path(conv["file_path"]) for conv in conversations
+        }
+        return conversations
+
+    def _summarize_trace(
+        self, json_file: Path, has_summary: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """Read the summary fields of one trace file.
+
+        Args:
+            json_file: Trace file path
+            has_summary: Whether a summary file was written next to it
+
+        Returns:
+            Conversation summary, or None if the file can't be read
+        """
+        try:
+            if has_summary:
+                summary = _read_trace(json_file.with_suffix(SUMMARY_SUFFIX))
+            else:
+                # Traces logged before summaries existed need a full parse
+                summary = build_trace_summary(_read_trace(json_file))
+        except Exception as e:
+            logger.warning(f"Failed to load {json_file}: {e}")
+            return None
+
+        summary["file_path"] = str(json_file)
+        return summary
+
+    async def get_html_template(self) -> str:
+        """Return HTML template for conversation debugger.
+
+        Returns:
+            HTML string with Alpine.js directives
+        """
+        return _HTML_TEMPLATE
+
     async def handle_action(self, action: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Handle actions from the frontend.
 
@@ -594,17 +700,55 @@ class ConversationDebuggerSubsection(BaseSubsection):
             if not trace_id:
                 return {"error": "trace_id required"}
 
-            # Find the JSON file
-            for json_file in self.log_dir.glob("response_*.json"):
-                try:
-                    with open(json_file, "r", encoding="utf-8") as f:
-                        trace_data = json.load(f)
-                    if trace_data.get("trace_id") == trace_id:
-                        return trace_data
-                except Exception as e:
-                    logger.warning(f"Failed to load {json_file}: {e}")
-                    continue
+            return await asyncio.to_thread(self._load_trace, trace_id)
 
+        return await super().handle_action(action, data)
+
+    async def get_file(self, file_id: str) -> Optional[Path]:
+        """Get the JSON file of the trace with the given ID.
+
+        Args:
+            file_id: Trace ID
+
+        Returns:
+            Path to the trace file, or None if it isn't found
+        """
+        return await asyncio.to_thread(self._find_trace, file_id)
+
+    def _load_trace(self, trace_id: str) -> Dict[str, Any]:
+        """Read the full trace with the given ID.
+
+        Args:
+            trace_id: Trace ID
+
+        Returns:
+            Trace data, or an error dictionary if it isn't found
+        """
+        json_file = self._find_trace(trace_id)
+        if json_file is None:
             return {"error": "Trace not found"}
 
-        return await super().handle_action(action, data)
+        try:
+            return _read_trace(json_file)
+        except Exception as e:
+            logger.warning(f"Failed to load {json_file}: {e}")
+            return {"error": "Trace not found"}
+
+    def _find_trace(self, trace_id: str) -> Optional[Path]:
+        """Look up the JSON file of a trace.
+
+        Args:
+            trace_id: Trace ID
+
+        Returns:
+            Path to the trace file, or None if it isn't found
+        """
+        self._refresh_index_if_stale()
+        json_file = self._trace_index.get(trace_id)
+        if json_file is None:
+            # The mtime may not have ticked if the file was written right
+            # after the last scan, so rescan before giving up, unless the
+            # index is fresh (unknown IDs must not force a scan each time)
+            self._refresh_index_if_stale(max_age=_MISS_RESCAN_INTERVAL_SECONDS)
+            json_file = self._trace_index.get(trace_id)
+        return json_file
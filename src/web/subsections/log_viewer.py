@@ -1,6 +1,8 @@
 """Live log viewer subsection."""
 
+import asyncio
 import logging
+import threading
 from collections import deque
 from datetime import datetime
 from typing import Any, Dict, List, Optional
@@ -8,6 +10,21 @@ from typing import Any, Dict, List, Optional
 from ..base import BaseSubsection
 from ..registry import subsection
 
+# Level filter choices offered by the UI
+_LEVELS = ["ALL", "DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+
+# Filtered views kept per handler; each level is a distinct key
+_FILTER_CACHE_SIZE = 8
+
+# Level name -> number, for filtering stored entries
+_LEVEL_ORDER = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40, "CRITICAL": 50}
+
+# Entries waiting to be broadcast; beyond this, new ones are only stored
+_BROADCAST_QUEUE_SIZE = 1000
+
+# Most entries sent in one broadcast
+_BROADCAST_BATCH_SIZE = 256
+
 
 class WebLogHandler(logging.Handler):
     """Custom logging handler that stores logs for the web UI."""
@@ -16,46 +33,150 @@ class WebLogHandler(logging.Handler):
         super().__init__()
         self.logs: deque = deque(maxlen=max_entries)
         self._broadcast_callback: Optional[callable] = None
+        # New entries go through a queue to one drain task that broadcasts
+        # them in batches, rather than one task and message per record
+        self._broadcast_queue: Optional[asyncio.Queue] = None
+        self._broadcast_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._broadcast_thread: Optional[int] = None
+        self._drain_task: Optional[asyncio.Task] = None
+        # Bumped whenever self.logs changes; filtered views are cached for
+        # the version they were built from
+        self._version: int = 0
+        self._filter_cache: Dict[str, List[Dict[str, Any]]] = {}
+        self._filter_cache_version: int = 0
+        # Formatted "YYYY-MM-DD HH:MM:SS" of the last record's second
+        self._ts_cache_sec: int = -1
+        self._ts_cache_prefix: str = ""
+
+    def _format_timestamp(self, record: logging.LogRecord) -> str:
+        """Format a record's time, reusing the date and time of its second."""
+        sec = int(record.created)
+        if sec != self._ts_cache_sec:
+            self._ts_cache_prefix = datetime.fromtimestamp(sec).isoformat(
+                sep=" ", timespec="seconds"
+            )
+            self._ts_cache_sec = sec
+        return f"{self._ts_cache_prefix}.{int(record.msecs):03d}"
 
     def emit(self, record: logging.LogRecord) -> None:
         """Emit a log record."""
+        if record.levelno < self.level:
+            return
         try:
             log_entry = {
-                "timestamp": datetime.fromtimestamp(record.created).strftime(
-                    "%Y-%m-%d %H:%M:%S.%f"
-                )[:-3],
+                "timestamp": self._format_timestamp(record),
                 "level": record.levelname,
+                "levelno": record.levelno,
                 "logger": record.name,
                 "message": self.format(record),
             }
             self.logs.append(log_entry)
+            self._version += 1
 
             # Broadcast to websocket if callback is set
-            if self._broadcast_callback:
-                try:
-                    import asyncio
-
-                    asyncio.create_task(
-                        self._broadcast_callback({"new_log": log_entry})
-                    )
-                except RuntimeError:
-                    # No event loop running, skip broadcast
-                    pass
+            if self._broadcast_queue is not None:
+                if threading.get_ident() == self._broadcast_thread:
+                    self._enqueue(log_entry)
+                else:
+                    try:
+                        self._broadcast_loop.call_soon_threadsafe(
+                            self._enqueue, log_entry
+                        )
+                    except RuntimeError:
+                        # Event loop closed, skip broadcast
+                        pass
         except Exception:
             self.handleError(record)
 
     def set_broadcast_callback(self, callback: callable) -> None:
-        """Set the callback function for broadcasting new logs."""
+        """
+        Set the callback function for broadcasting new logs.
+
+        Must be called from the event loop the callback runs on. New
+        entries are passed to it in batches as {"new_logs": [...]}.
+
+        Args:
+            callback: Coroutine function taking the update data
+        """
         self._broadcast_callback = callback
+        if self._drain_task is None:
+            self._broadcast_loop = asyncio.get_running_loop()
+            self._broadcast_thread = threading.get_ident()
+            self._broadcast_queue = asyncio.Queue(maxsize=_BROADCAST_QUEUE_SIZE)
+            self._drain_task = self._broadcast_loop.create_task(self._drain())
+
+    def _enqueue(self, log_entry: Dict[str, Any]) -> None:
+        """Queue an entry for broadcast; runs on the event loop thread."""
+        try:
+            self._broadcast_queue.put_nowait(log_entry)
+        except asyncio.QueueFull:
+            # The entry is still in self.logs for clients that reload
+            pass
+
+    async def _drain(self) -> None:
+        """Broadcast queued entries, sending everything queued as one batch."""
+        queue = self._broadcast_queue
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < _BROADCAST_BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
+            try:
+                await self._broadcast_callback({"new_logs": batch})
+            except Exception:
+                # Not logged: the record would be queued for broadcast again
+                pass
+
+    def set_capture_level(self, level: str) -> None:
+        """
+        Store only records at or above a level.
+
+        Set once from configuration; the UI's level dropdown only filters
+        what is shown. Loggers skip emit for records below the handler's
+        level, and emit checks it too, so they are never formatted.
+
+        Args:
+            level: Level name, e.g. "INFO"
+        """
+        self.setLevel(level)
+
+    def clear(self) -> None:
+        """Remove all stored logs."""
+        with self.lock:
+            self.logs.clear()
+            self._version += 1
 
     def get_logs(self, level: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Get stored logs, optionally filtered by level."""
-        logs = list(self.logs)
-        if level and level != "ALL":
-            level_order = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40, "CRITICAL": 50}
-            min_level = level_order.get(level, 0)
-            logs = [log for log in logs if level_order.get(log["level"], 0) >= min_level]
-        return logs
+        """
+        Get stored logs, optionally filtered by level.
+
+        Results are reused until a log is added or the logs are cleared,
+        so callers must not modify the returned list.
+
+        Args:
+            level: Minimum level name, or None/"ALL" for every entry
+
+        Returns:
+            Stored log entries, oldest first
+        """
+        level = level or "ALL"
+        # emit runs under the same lock, possibly on another thread
+        with self.lock:
+            if self._filter_cache_version != self._version:
+                self._filter_cache.clear()
+                self._filter_cache_version = self._version
+
+            logs = self._filter_cache.get(level)
+            if logs is None:
+                if level == "ALL":
+                    logs = list(self.logs)
+                else:
+                    min_level = _LEVEL_ORDER.get(level, 0)
+                    logs = [log for log in self.logs if log["levelno"] >= min_level]
+                if len(self._filter_cache) >= _FILTER_CACHE_SIZE:
+                    # Drop the oldest view
+                    del self._filter_cache[next(iter(self._filter_cache))]
+                self._filter_cache[level] = logs
+            return logs
 
 
 # Global handler instance
@@ -75,31 +196,8 @@ def get_log_handler() -> WebLogHandler:
     return _log_handler
 
 
-@subsection
-class LogViewerSubsection(BaseSubsection):
-    """Live log streaming subsection."""
-
-    def __init__(self):
-        super().__init__(
-            name="logs",
-            display_name="Live Logs",
-            priority=10,
-            icon="",
-        )
-        self._handler = get_log_handler()
-
-    async def get_initial_data(self) -> Dict[str, Any]:
-        """Get initial log data."""
-        return {
-            "logs": self._handler.get_logs(),
-            "levels": ["ALL", "DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
-            "selectedLevel": "ALL",
-            "autoScroll": True,
-        }
-
-    async def get_html_template(self) -> str:
-        """Get HTML template for log viewer."""
-        return '''
+# Template for the log viewer; level filtering runs in the browser
+_HTML_TEMPLATE = '''
 <div class="log-viewer" x-data="{
     filteredLogs: data.logs,
     selectedLevel: data.selectedLevel,
@@ -110,7 +208,7 @@ class LogViewerSubsection(BaseSubsection):
             this.filteredLogs = data.logs;
         } else {
             const minLevel = levelOrder[this.selectedLevel] || 0;
-            this.filteredLogs = data.logs.filter(log => (levelOrder[log.level] || 0) >= minLevel);
+            this.filteredLogs = data.logs.filter(log => log.levelno >= minLevel);
         }
     },
     scrollToBottom() {
@@ -153,15 +251,46 @@ class LogViewerSubsection(BaseSubsection):
 </div>
 '''
 
+
+@subsection
+class LogViewerSubsection(BaseSubsection):
+    """Live log streaming subsection."""
+
+    def __init__(self):
+        super().__init__(
+            name="logs",
+            display_name="Live Logs",
+            priority=10,
+            icon="",
+        )
+        self._handler = get_log_handler()
+
+    async def get_initial_data(self) -> Dict[str, Any]:
+        """Get initial log data."""
+        return {
+            "logs": self._handler.get_logs(),
+            "levels": _LEVELS,
+            "selectedLevel": "ALL",
+            "autoScroll": True,
+        }
+
+    async def get_html_template(self) -> str:
+        """Get HTML template for log viewer."""
+        return _HTML_TEMPLATE
+
     async def handle_action(
         self, action: str, data: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Handle actions from the frontend."""
         if action == "clear":
-            self._handler.logs.clear()
+            self._handler.clear()
             return {"success": True, "logs": []}
         return await super().handle_action(action, data)
 
     def set_broadcast_callback(self, callback: callable) -> None:
         """Set up broadcasting for new log entries."""
         self._handler.set_broadcast_callback(callback)
+
+    def set_capture_level(self, level: str) -> None:
+        """Set the lowest level of log records kept for the viewer."""
+        self._handler.set_capture_level(level)
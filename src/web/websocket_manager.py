@@ -1,13 +1,40 @@
 """WebSocket connection manager for live updates."""
 
-from typing import Dict, List, Set, Any
+from typing import Dict, Iterable, List, Set, Any
+import asyncio
 import logging
 import json
 
 from fastapi import WebSocket
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Messages buffered per client before it is dropped as too slow
+_SEND_QUEUE_SIZE = 256
+
+
+def _encode(data: Dict[str, Any]) -> bytes:
+    """
+    Serialize a message to UTF-8 JSON for sending as a binary WebSocket frame.
+
+    Uses orjson when it is installed, falling back to the stdlib encoder
+    with the same compact output.
+
+    Args:
+        data: Message to serialize
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
 
 class ConnectionManager:
     """Manages WebSocket connections and subscriptions."""
@@ -17,11 +44,21 @@ class ConnectionManager:
         self._connections: Set[WebSocket] = set()
         # Subscription mapping: subsection_name -> set of websockets
         self._subscriptions: Dict[str, Set[WebSocket]] = {}
+        # Each connection has one writer task draining its own send queue,
+        # so sends never run concurrently on a socket and a slow client
+        # can't hold up the others
+        self._queues: Dict[WebSocket, asyncio.Queue] = {}
+        self._writers: Dict[WebSocket, asyncio.Task] = {}
 
     async def connect(self, websocket: WebSocket) -> None:
         """Accept a new WebSocket connection."""
         await websocket.accept()
         self._connections.add(websocket)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=_SEND_QUEUE_SIZE)
+        self._queues[websocket] = queue
+        self._writers[websocket] = asyncio.create_task(
+            self._writer_loop(websocket, queue)
+        )
         logger.debug(f"WebSocket connected. Total connections: {len(self._connections)}")
 
     def disconnect(self, websocket: WebSocket) -> None:
@@ -30,6 +67,10 @@ class ConnectionManager:
         # Remove from all subscriptions
         for subscribers in self._subscriptions.values():
             subscribers.discard(websocket)
+        self._queues.pop(websocket, None)
+        writer = self._writers.pop(websocket, None)
+        if writer is not None and writer is not asyncio.current_task():
+            writer.cancel()
         logger.debug(
             f"WebSocket disconnected. Total connections: {len(self._connections)}"
         )
@@ -46,6 +87,10 @@ class ConnectionManager:
         if subsection_name in self._subscriptions:
             self._subscriptions[subsection_name].discard(websocket)
 
+    async def send(self, websocket: WebSocket, data: Dict[str, Any]) -> None:
+        """Queue a message for a single client."""
+        self._enqueue(websocket, _encode(data))
+
     async def broadcast_to_subsection(
         self, subsection_name: str, data: Dict[str, Any]
     ) -> None:
@@ -53,42 +98,70 @@ class ConnectionManager:
         if subsection_name not in self._subscriptions:
             return
 
-        subscribers = self._subscriptions[subsection_name].copy()
-        disconnected = []
-
-        for websocket in subscribers:
-            try:
-                await websocket.send_json(data)
-            except Exception as e:
-                logger.debug(f"Failed to send to websocket: {e}")
-                disconnected.append(websocket)
-
-        # Clean up disconnected sockets
-        for ws in disconnected:
-            self.disconnect(ws)
+        await self._send_to_all(self._subscriptions[subsection_name].copy(), data)
 
     async def broadcast_all(self, data: Dict[str, Any]) -> None:
         """Broadcast a message to all connected clients."""
-        disconnected = []
+        await self._send_to_all(self._connections.copy(), data)
 
-        for websocket in self._connections.copy():
-            try:
-                await websocket.send_json(data)
-            except Exception as e:
-                logger.debug(f"Failed to send to websocket: {e}")
-                disconnected.append(websocket)
+    async def _send_to_all(
+        self, websockets: Iterable[WebSocket], data: Dict[str, Any]
+    ) -> None:
+        """Queue one message for several clients."""
+        websockets = list(websockets)
+        if not websockets:
+            return
+
+        # Serialize once, not once per recipient
+        message = _encode(data)
+        for websocket in websockets:
+            self._enqueue(websocket, message)
+
+    def _enqueue(self, websocket: WebSocket, message: bytes) -> None:
+        """Add a message to a client's send queue, dropping the client if full."""
+        queue = self._queues.get(websocket)
+        if queue is None:
+            return
 
-        # Clean up disconnected sockets
-        for ws in disconnected:
-            self.disconnect(ws)
+        try:
+            queue.put_nowait(message)
+        except asyncio.QueueFull:
+            logger.warning("Dropping WebSocket client that is not keeping up")
+            self.disconnect(websocket)
+            asyncio.ensure_future(self._close(websocket))
+
+    async def _writer_loop(self, websocket: WebSocket, queue: asyncio.Queue) -> None:
+        """Send a client's queued messages in order until it disconnects."""
+        try:
+            while True:
+                message = await queue.get()
+                try:
+                    await websocket.send_bytes(message)
+                finally:
+                    queue.task_done()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Clean up disconnected sockets
+            logger.debug(f"Failed to send to websocket: {e}")
+            self.disconnect(websocket)
+
+    @staticmethod
+    async def _close(websocket: WebSocket) -> None:
+        """Close a socket, ignoring errors from one that is already gone."""
+        try:
+            await websocket.close()
+        except Exception:
+            pass
 
     async def disconnect_all(self) -> None:
         """Disconnect all clients gracefully."""
+        for writer in self._writers.values():
+            writer.cancel()
+        self._writers.clear()
+        self._queues.clear()
         for websocket in self._connections.copy():
-            try:
-                await websocket.close()
-            except Exception:
-                pass
+            await self._close(websocket)
         self._connections.clear()
         self._subscriptions.clear()
 
@@ -0,0 +1,148 @@
+"""Tests for Agent-as-a-Tool wrappers."""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.agent.base import AgentResult
+from src.context.models import ConversationContext, Message
+from src.tools.agent_tools import (
+    CalendarAgentTool,
+    CalendarQuery,
+    MemoryAgentTool,
+    NotionAgentTool,
+    NotionQuery,
+)
+
+
+def _mock_agent(name="memory"):
+    """Create a mock specialist agent."""
+    agent = MagicMock()
+    agent.get_name.return_value = name
+    agent.get_description.return_value = f"Handles {name} requests."
+    agent.process = AsyncMock(
+        return_value=AgentResult(
+            success=True,
+            response_text="done",
+            structured_data={"ok": True},
+            agent_name=name,
+            trace_id="trace",
+        )
+    )
+    return agent
+
+
+@pytest.fixture
+def conversation_context():
+    """Create a conversation context with a short history."""
+    return ConversationContext(
+        chat_id=123,
+        user_id=456,
+        messages=[
+            Message(
+                chat_id=123,
+                user_id=456,
+                message_text="Hello",
+                role="user",
+                timestamp=datetime.now(),
+            ),
+        ],
+        metadata={},
+    )
+
+
+def test_schema_built_from_request_model():
+    """Test schema is derived from the request model once, and handed out as copies."""
+    with patch.object(
+        CalendarQuery, "model_json_schema", wraps=CalendarQuery.model_json_schema
+    ) as build:
+        tool = CalendarAgentTool(_mock_agent("calendar"))
+
+        schema = tool.get_schema()
+        assert schema["name"] == "delegate_to_calendar"
+        assert schema["parameters"]["required"] == ["action"]
+        assert set(schema["parameters"]["properties"]) == set(CalendarQuery.model_fields)
+
+        # Editing one caller's schema leaves later calls untouched
+        schema["parameters"]["required"].append("extra")
+        schema["parameters"]["properties"].clear()
+        again = tool.get_schema()
+        assert again["parameters"]["required"] == ["action"]
+        assert set(again["parameters"]["properties"]) == set(CalendarQuery.model_fields)
+
+    assert build.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_execute_delegates_to_agent(conversation_context):
+    """Test execute forwards the request and history to the specialist."""
+    agent = _mock_agent()
+    tool = MemoryAgentTool(agent)
+
+    result = await tool.execute(conversation_context, query="lunch plans")
+
+    assert result.success is True
+    assert result.message == "done"
+    assert result.data == {"ok": True}
+    call = agent.process.await_args
+    assert '"query":"lunch plans"' in call.kwargs["message"]
+    assert call.kwargs["context"].message_history == [
+        {"role": "user", "content": "Hello"}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_execute_reports_invalid_request(conversation_context):
+    """Test invalid parameters produce a failed ToolResult."""
+    agent = _mock_agent()
+    tool = MemoryAgentTool(agent)
+
+    result = await tool.execute(conversation_context, query="x", max_messages=0)
+
+    assert result.success is False
+    assert "Agent delegation failed" in result.error
+    agent.process.assert_not_awaited()
+
+
+def test_message_history_dicts_memoized(conversation_context):
+    """Test the history projection is reused until messages change."""
+    history = conversation_context.message_history_dicts
+    assert history == [{"role": "user", "content": "Hello"}]
+    assert conversation_context.message_history_dicts is history
+
+    conversation_context.messages.append(
+        Message(
+            chat_id=123,
+            user_id=456,
+            message_text="Hi!",
+            role="assistant",
+            timestamp=datetime.now(),
+        )
+    )
+    updated = conversation_context.message_history_dicts
+    assert updated is not history
+    assert updated[-1] == {"role": "assistant", "content": "Hi!"}
+
+
+def test_notion_query_legacy_fields_mapped():
+    """Test deprecated NotionQuery fields still map onto the new ones."""
+    legacy = NotionQuery(search_term="roadmap", date_range="last week", max_results=15)
+    assert legacy.user_question == "roadmap"
+    assert legacy.time_context == "last week"
+    assert legacy.max_pages_to_analyze == 10
+
+    modern = NotionQuery(user_question="What is on the roadmap?")
+    assert modern.user_question == "What is on the roadmap?"
+    assert modern.time_context is None
+    assert modern.max_pages_to_analyze == 5
+
+
+def test_notion_query_scope_matches_search_scope_enum():
+    """Test NotionQuery scope values stay in sync with the specialist enum."""
+    from src.agent.specialists.notion_models import SearchScope
+
+    tool = NotionAgentTool(_mock_agent("notion"))
+    properties = tool.get_schema()["parameters"]["properties"]
+    assert set(properties["search_scope"]["enum"]) == {s.value for s in SearchScope}
+    assert NotionQuery().search_scope == SearchScope.PRECISE
@@ -0,0 +1,123 @@
+"""Tests for Google Calendar reader tool."""
+
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.context.models import ConversationContext
+from src.tools.calendar_reader import CalendarReaderTool
+
+
+@pytest.fixture
+def context():
+    """Create an empty conversation context."""
+    return ConversationContext(chat_id=123, user_id=456, messages=[])
+
+
+@pytest.fixture
+def tool():
+    """Create a calendar reader with a mocked Google service."""
+    tool = CalendarReaderTool()
+    tool.service = MagicMock()
+    tool.service.events.return_value.list.return_value.execute.return_value = {
+        "items": [
+            {
+                "id": "evt1",
+                "summary": "Standup",
+                "start": {"dateTime": "2026-01-15T09:00:00Z"},
+                "location": "Room 1",
+            },
+            {
+                "id": "evt2",
+                "start": {"date": "2026-01-16"},
+            },
+        ]
+    }
+    return tool
+
+
+@pytest.mark.asyncio
+async def test_execute_projects_events(tool, context):
+    """Test events are projected onto the tool's result fields."""
+    result = await tool.execute(context, max_results=5)
+
+    assert result.success is True
+    assert result.data["count"] == 2
+    assert result.data["events"] == [
+        {
+            "id": "evt1",
+            "summary": "Standup",
+            "start": "2026-01-15T09:00:00Z",
+            "description": "",
+            "location": "Room 1",
+        },
+        {
+            "id": "evt2",
+            "summary": "No title",
+            "start": "2026-01-16",
+            "description": "",
+            "location": "",
+        },
+    ]
+
+
+@pytest.mark.asyncio
+async def test_execute_reports_missing_credentials(context):
+    """Test missing credentials produce an authentication error."""
+    result = await CalendarReaderTool().execute(context)
+
+    assert result.success is False
+    assert "authenticate" in result.error
+
+
+@pytest.mark.asyncio
+async def test_execute_defaults_to_next_seven_days(tool, context):
+    """Test the default time range spans seven days from now in UTC."""
+    result = await tool.execute(context)
+
+    time_range = result.data["time_range"]
+    start = datetime.fromisoformat(time_range["min"])
+    end = datetime.fromisoformat(time_range["max"])
+    assert start.utcoffset() == timedelta(0)
+    assert end - start == timedelta(days=7)
+
+
+@pytest.mark.asyncio
+async def test_execute_keeps_explicit_time_range(tool, context):
+    """Test caller-provided bounds are passed through unchanged."""
+    result = await tool.execute(
+        context, time_min="2026-01-01T00:00:00Z", time_max="2026-01-02T00:00:00Z"
+    )
+
+    assert result.data["time_range"] == {
+        "min": "2026-01-01T00:00:00Z",
+        "max": "2026-01-02T00:00:00Z",
+    }
+
+
+@pytest.mark.asyncio
+async def test_execute_validates_parameters(tool, context):
+    """Test parameters are coerced by the args model, and bad ones rejected."""
+    ok = await tool.execute(context, max_results="3")
+    bad = await tool.execute(context, max_results="many")
+
+    assert ok.success is True
+    list_kwargs = tool.service.events.return_value.list.call_args.kwargs
+    assert list_kwargs["maxResults"] == 3
+    assert bad.success is False
+    assert "max_results" in bad.error
+
+
+def test_module_import_defers_google_libraries():
+    """Test importing the tool module does not load the Google client stack."""
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    code = (
+        "import sys; import src.tools.calendar_reader; "
+        "sys.exit('googleapiclient.discovery' in sys.modules)"
+    )
+    repo_root = Path(__file__).resolve().parent.parent
+    assert subprocess.run([sys.executable, "-c", code], cwd=repo_root).returncode == 0
@@ -0,0 +1,237 @@
+"""Tests for Google Calendar writer tool."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.context.models import ConversationContext
+from src.tools.calendar_writer import CalendarWriterTool
+
+
+class FakeBatch:
+    """Minimal stand-in for googleapiclient's BatchHttpRequest."""
+
+    def __init__(self, callback, fail_ids=()):
+        self.callback = callback
+        self.fail_ids = set(fail_ids)
+        self.requests = []
+
+    def add(self, request, request_id):
+        self.requests.append((request_id, request))
+
+    def execute(self):
+        for request_id, _ in self.requests:
+            if request_id in self.fail_ids:
+                self.callback(request_id, None, Exception("quota"))
+            else:
+                self.callback(request_id, {"id": f"evt{request_id}", "htmlLink": "link"}, None)
+
+
+@pytest.fixture
+def context():
+    """Create an empty conversation context."""
+    return ConversationContext(chat_id=123, user_id=456, messages=[])
+
+
+@pytest.fixture
+def tool():
+    """Create a calendar writer with a mocked Google service."""
+    tool = CalendarWriterTool()
+    tool.service = MagicMock()
+    tool.service.events.return_value.insert.return_value.execute.return_value = {
+        "id": "evt1",
+        "htmlLink": "https://calendar.google.com/evt1",
+    }
+    return tool
+
+
+@pytest.mark.asyncio
+async def test_execute_creates_event(tool, context):
+    """Test a single event is created with a default one hour duration."""
+    result = await tool.execute(
+        context, title="Lunch", start_time="2026-01-15T12:00:00+00:00"
+    )
+
+    assert result.success is True
+    assert result.data["event_id"] == "evt1"
+    assert result.data["end"] == "2026-01-15T13:00:00+00:00"
+    body = tool.service.events.return_value.insert.call_args.kwargs["body"]
+    assert body["summary"] == "Lunch"
+
+
+@pytest.mark.asyncio
+async def test_execute_default_end_time_crosses_midnight(tool, context):
+    """Test a late-evening event defaults to ending on the next day."""
+    result = await tool.execute(
+        context, title="Late call", start_time="2026-01-15T23:30:00Z"
+    )
+
+    assert result.success is True
+    assert result.data["end"] == "2026-01-16T00:30:00+00:00"
+
+
+@pytest.mark.asyncio
+async def test_duplicate_concurrent_inserts_share_one_request(tool, context):
+    """Test identical in-flight inserts create the event only once."""
+    execute = tool.service.events.return_value.insert.return_value.execute
+
+    results = await asyncio.gather(
+        tool.execute(context, title="Lunch", start_time="2026-01-15T12:00:00Z"),
+        tool.execute(context, title="Lunch", start_time="2026-01-15T12:00:00Z"),
+    )
+    await tool.execute(context, title="Lunch", start_time="2026-01-15T12:00:00Z")
+
+    assert [r.data["event_id"] for r in results] == ["evt1", "evt1"]
+    # The later, non-concurrent call is a new write
+    assert execute.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_events_collection_is_built_once(tool, context):
+    """Test the events Resource is reused across calls."""
+    await tool.execute(context, title="A", start_time="2026-01-15T12:00:00Z")
+    await tool.execute(context, title="B", start_time="2026-01-15T13:00:00Z")
+
+    assert tool.service.events.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_execute_requires_title(tool, context):
+    """Test a missing title is rejected before calling the API."""
+    result = await tool.execute(context, start_time="2026-01-15T12:00:00Z")
+
+    assert result.success is False
+    assert "title" in result.error
+
+
+@pytest.mark.asyncio
+async def test_execute_rejects_invalid_parameter_types(tool, context):
+    """Test parameters are validated by the event args model."""
+    result = await tool.execute(
+        context, title=["not", "a", "string"], start_time="2026-01-15T12:00:00Z"
+    )
+
+    assert result.success is False
+    assert "title" in result.error
+    tool.service.events.return_value.insert.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_argument_errors_are_shared_and_survive_release(tool, context):
+    """Test constant error results are reused and unaffected by release()."""
+    first = await tool.execute(context, start_time="2026-01-15T12:00:00Z")
+    first.release()
+    second = await tool.execute(context, start_time="2026-01-15T12:00:00Z")
+
+    assert second is first
+    assert second.error == "Missing required parameter: title"
+
+
+@pytest.mark.asyncio
+async def test_execute_batch_creates_events_in_one_request(tool, context):
+    """Test several events share one batch request with per-event outcomes."""
+    batches = []
+
+    def new_batch(callback):
+        batches.append(FakeBatch(callback, fail_ids={"1"}))
+        return batches[-1]
+
+    tool.service.new_batch_http_request.side_effect = new_batch
+
+    result = await tool.execute(
+        context,
+        events=[
+            {"title": "A", "start_time": "2026-01-15T09:00:00Z"},
+            {"title": "B", "start_time": "2026-01-15T10:00:00Z"},
+            {"title": "C"},
+        ],
+    )
+
+    assert len(batches) == 1
+    assert len(batches[0].requests) == 2
+    outcomes = result.data["results"]
+    assert outcomes[0]["success"] is True
+    assert outcomes[0]["event_id"] == "evt0"
+    assert outcomes[1]["success"] is False
+    assert "quota" in outcomes[1]["error"]
+    assert outcomes[2]["success"] is False
+    assert result.data["created"] == 1
+    assert result.success is False
+
+
+@pytest.mark.asyncio
+async def test_execute_batch_chunks_large_inputs(tool, context):
+    """Test batches are capped at the Google per-batch limit."""
+    batches = []
+
+    def new_batch(callback):
+        batches.append(FakeBatch(callback))
+        return batches[-1]
+
+    tool.service.new_batch_http_request.side_effect = new_batch
+    events = [
+        {"title": f"E{i}", "start_time": "2026-01-15T09:00:00Z"} for i in range(120)
+    ]
+
+    result = await tool.execute(context, events=events)
+
+    assert [len(batch.requests) for batch in batches] == [50, 50, 20]
+    assert result.success is True
+    assert result.data["created"] == 120
+
+
+@pytest.mark.asyncio
+async def test_execute_batch_retries_rate_limited_inserts(tool, context):
+    """Test inserts rate limited inside a batch are retried in a new batch."""
+    from unittest.mock import patch
+
+    import httplib2
+    from googleapiclient.errors import HttpError
+
+    rate_limited = HttpError(httplib2.Response({"status": 429, "retry-after": "1"}), b"{}")
+    batches = []
+
+    def new_batch(callback):
+        batch = FakeBatch(callback)
+        if not batches:
+            # The first batch rate limits the second event only
+            def execute():
+                for request_id, _ in batch.requests:
+                    if request_id == "1":
+                        callback(request_id, None, rate_limited)
+                    else:
+                        callback(request_id, {"id": f"evt{request_id}"}, None)
+
+            batch.execute = execute
+        batches.append(batch)
+        return batch
+
+    tool.service.new_batch_http_request.side_effect = new_batch
+
+    with patch("src.tools.google_service.time.sleep") as sleep:
+        result = await tool.execute(
+            context,
+            events=[
+                {"title": "A", "start_time": "2026-01-15T09:00:00Z"},
+                {"title": "B", "start_time": "2026-01-15T10:00:00Z"},
+            ],
+        )
+
+    assert [[rid for rid, _ in batch.requests] for batch in batches] == [["0", "1"], ["1"]]
+    sleep.assert_called_once_with(1.0)
+    assert result.success is True
+    assert result.data["results"][1]["event_id"] == "evt1"
+
+
+def test_schema_requires_one_event_or_an_events_list(tool):
+    """Test the schema tells the model which fields a call needs."""
+    parameters = tool.get_schema()["parameters"]
+    # Callers get their own copy
+    parameters["anyOf"].clear()
+    parameters = tool.get_schema()["parameters"]
+
+    assert parameters["anyOf"] == [
+        {"required": ["title", "start_time"]},
+        {"required": ["events"]},
+    ]
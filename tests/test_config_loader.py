@@ -202,3 +202,16 @@ def test_valid_language_codes():
         # Should be lowercased
         assert config.agent.preferences.language == code.lower()
 
+
+def test_web_log_level_validation():
+    """Test the web log level accepts level names in any case only."""
+    config_dict = {
+        "telegram": {"bot_token": "test_token", "mode": "poll"},
+        "llm": {"provider": "ollama", "ollama": {"model": "llama2"}},
+        "agent": {"debug": {"web_log_level": "info"}},
+    }
+    assert AppConfig(**config_dict).agent.debug.web_log_level == "INFO"
+
+    config_dict["agent"]["debug"]["web_log_level"] = "LOUD"
+    with pytest.raises(ValueError, match="Invalid web log level"):
+        AppConfig(**config_dict)
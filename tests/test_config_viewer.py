@@ -0,0 +1,71 @@
+"""Test configuration viewer subsection."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from pydantic import BaseModel
+
+from src.web.subsections import config_viewer
+from src.web.subsections.config_viewer import ConfigViewerSubsection, set_config
+
+
+class _Telegram(BaseModel):
+    bot_token: str = "1234567890"
+    allowed_users: list = [1, 2]
+
+
+class _Config(BaseModel):
+    telegram: _Telegram = _Telegram()
+    api_key: str = ""
+    model: str = "gpt"
+
+
+@pytest.fixture(autouse=True)
+def reset_config():
+    """Clear the global config after each test."""
+    yield
+    set_config(None)
+
+
+@pytest.mark.asyncio
+async def test_secrets_are_masked():
+    """Test secret-looking keys are masked at any depth."""
+    set_config(_Config())
+    data = await ConfigViewerSubsection().get_initial_data()
+
+    assert data["config"]["telegram"]["bot_token"] == "1234******"
+    assert data["config"]["telegram"]["allowed_users"] == [1, 2]
+    assert data["config"]["api_key"] == ""
+    assert data["config"]["model"] == "gpt"
+    assert json.loads(data["config_json"]) == data["config"]
+
+
+@pytest.mark.asyncio
+async def test_display_data_is_cached_until_config_changes():
+    """Test the config is masked once until a new config is set."""
+    viewer = ConfigViewerSubsection()
+    set_config(_Config())
+
+    with patch.object(
+        config_viewer,
+        "config_to_display_dict",
+        wraps=config_viewer.config_to_display_dict,
+    ) as to_display:
+        first = await viewer.get_initial_data()
+        assert await viewer.get_initial_data() == first
+        assert to_display.call_count == 1
+
+        set_config(_Config(model="other"))
+        assert (await viewer.get_initial_data())["config"]["model"] == "other"
+        assert to_display.call_count == 2
+
+
+def test_nested_lists_are_masked_without_touching_the_source():
+    """Test dicts inside lists are masked and plain dict configs are copied."""
+    source = {"servers": [{"name": "a", "password": "hunter22"}, [{"token": 1}]]}
+
+    display = config_viewer.config_to_display_dict(source)
+
+    assert display == {"servers": [{"name": "a", "password": "hunt****"}, [{"token": "***"}]]}
+    assert source["servers"][0]["password"] == "hunter22"
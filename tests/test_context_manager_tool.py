@@ -1,7 +1,7 @@
 """Tests for Context Manager tool."""
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from src.tools.context_manager import ContextManagerTool
 from src.context.models import ConversationContext
@@ -97,3 +97,19 @@ def test_context_manager_tool_schema():
     assert "query" in schema["parameters"]["properties"]
     assert "query" in schema["parameters"]["required"]
     assert "mode" not in schema["parameters"]["properties"]
+
+
+def test_context_manager_tool_schema_is_built_once(mock_context_manager):
+    """Test that get_schema copies the schema built at construction."""
+    with patch.object(
+        ContextManagerTool,
+        "_build_schema",
+        autospec=True,
+        side_effect=ContextManagerTool._build_schema,
+    ) as build:
+        tool = ContextManagerTool(mock_context_manager)
+        schema = tool.get_schema()
+        schema["parameters"]["required"].clear()
+
+        assert tool.get_schema()["parameters"]["required"] == ["query"]
+    assert build.call_count == 1
@@ -2,6 +2,7 @@
 
 import pytest
 import asyncio
+from unittest.mock import patch
 from pathlib import Path
 from datetime import datetime
 
@@ -70,6 +71,100 @@ async def test_get_recent_messages(temp_db):
     assert messages[0].message_text == "Message 2"
 
 
+@pytest.mark.asyncio
+async def test_concurrent_get_recent_messages_share_one_query(temp_db):
+    """Test reads queued behind a running one are answered by one batch."""
+    await temp_db.initialize()
+
+    for chat_id in (1, 2):
+        for i in range(4):
+            await temp_db.save_message(
+                chat_id=chat_id,
+                user_id=456,
+                message_text=f"Chat {chat_id} message {i}",
+                role="user",
+            )
+
+    batched_calls = []
+    original = temp_db.get_recent_messages_batched
+
+    async def counting(requests):
+        batched_calls.append(list(requests))
+        return await original(requests)
+
+    temp_db.get_recent_messages_batched = counting
+
+    chat1, chat1_short, chat2 = await asyncio.gather(
+        temp_db.get_recent_messages(chat_id=1, limit=3),
+        temp_db.get_recent_messages(chat_id=1, limit=1),
+        temp_db.get_recent_messages(chat_id=2, limit=2),
+    )
+
+    # The first call runs alone; the two queued behind it share a query
+    assert batched_calls == [[(1, 3)], [(1, 1), (2, 2)]]
+    assert [m.message_text for m in chat1] == [
+        "Chat 1 message 1", "Chat 1 message 2", "Chat 1 message 3"
+    ]
+    assert [m.message_text for m in chat1_short] == ["Chat 1 message 3"]
+    assert [m.message_text for m in chat2] == ["Chat 2 message 2", "Chat 2 message 3"]
+
+
+@pytest.mark.asyncio
+async def test_uncontended_get_recent_messages_runs_immediately(temp_db):
+    """Test a lone read queries at once, with no batching delay."""
+    await temp_db.initialize()
+    for i in range(3):
+        await temp_db.save_message(
+            chat_id=1, user_id=456, message_text=f"Message {i}", role="user"
+        )
+
+    loop = asyncio.get_running_loop()
+    with patch.object(loop, "call_later") as call_later:
+        messages = await temp_db.get_recent_messages(chat_id=1, limit=2)
+        everything = await temp_db.get_recent_messages(chat_id=1, limit=-1)
+
+    call_later.assert_not_called()
+    assert not temp_db._recent_batches
+    assert [m.message_text for m in messages] == ["Message 1", "Message 2"]
+    # As with SQLite's LIMIT -1, a negative limit returns every message
+    assert len(everything) == 3
+
+
+@pytest.mark.asyncio
+async def test_cancelled_batch_cancels_queued_reads(temp_db):
+    """Test callers queued on a cancelled batch are not left waiting."""
+    await temp_db.initialize()
+    release_first = asyncio.Event()
+    never = asyncio.Event()
+    gates = [release_first, never]
+
+    async def blocked(requests):
+        await gates.pop(0).wait()
+        return {chat_id: [] for chat_id, _ in requests}
+
+    temp_db.get_recent_messages_batched = blocked
+
+    first = asyncio.ensure_future(temp_db.get_recent_messages(chat_id=1))
+    await asyncio.sleep(0)
+    queued = [
+        asyncio.ensure_future(temp_db.get_recent_messages(chat_id=chat_id))
+        for chat_id in (2, 3)
+    ]
+    await asyncio.sleep(0)
+
+    # The first read finishing starts the batch for the queued ones
+    release_first.set()
+    assert await first == []
+    await asyncio.sleep(0)
+    [batch] = temp_db._recent_batches
+    batch.cancel()
+
+    for read in queued:
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(read, timeout=1)
+    assert temp_db._recent_active == 0
+
+
 @pytest.mark.asyncio
 async def test_get_all_messages(temp_db):
     """Test retrieving all messages for a chat."""
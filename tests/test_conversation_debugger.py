@@ -134,3 +134,102 @@ async def test_html_template(temp_log_dir):
     assert "conversation-selector" in template
     assert "conversation-analyzer" in template
     assert "x-data" in template  # Alpine.js
+
+
+@pytest.mark.asyncio
+async def test_load_trace_reads_only_indexed_file(temp_log_dir, sample_trace):
+    """Test load_trace opens just the matching file once the index is built."""
+    from unittest.mock import patch
+
+    debugger = ConversationDebuggerSubsection(log_dir=str(temp_log_dir))
+    await debugger.get_initial_data()
+
+    for i in range(5):
+        other = dict(sample_trace, trace_id=f"other-{i}")
+        with open(temp_log_dir / f"response_1_{i}.json", "w") as f:
+            json.dump(other, f)
+
+    # New files change the directory, so they are picked up
+    result = await debugger.handle_action("load_trace", {"trace_id": "other-3"})
+    assert result["trace_id"] == "other-3"
+
+    from src.web.subsections import conversation_debugger
+
+    with patch.object(
+        conversation_debugger, "_read_trace", wraps=conversation_debugger._read_trace
+    ) as opened:
+        result = await debugger.handle_action("load_trace", {"trace_id": "test-trace-123"})
+
+    assert result["trace_id"] == "test-trace-123"
+    assert opened.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_unknown_trace_ids_do_not_rescan_fresh_index(temp_log_dir, sample_trace):
+    """Test repeated misses only rescan once the index is old enough."""
+    from unittest.mock import patch
+
+    from src.web.subsections import conversation_debugger
+
+    debugger = ConversationDebuggerSubsection(log_dir=str(temp_log_dir))
+    await debugger.get_initial_data()
+
+    with patch.object(
+        debugger, "_scan_conversations", wraps=debugger._scan_conversations
+    ) as scan:
+        for _ in range(3):
+            result = await debugger.handle_action("load_trace", {"trace_id": "missing"})
+            assert result == {"error": "Trace not found"}
+        assert scan.call_count == 0
+
+        debugger._scanned_at -= conversation_debugger._MISS_RESCAN_INTERVAL_SECONDS + 1
+        assert await debugger.get_file("missing") is None
+        assert scan.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_scan_skips_unreadable_and_unrelated_files(temp_log_dir, sample_trace):
+    """Test the scan reads only valid response traces, newest first."""
+    newer = dict(sample_trace, trace_id="newer", timestamp="2026-02-02T00:00:00")
+    with open(temp_log_dir / "response_2.json", "w") as f:
+        json.dump(newer, f)
+    (temp_log_dir / "response_broken.json").write_text("{not json")
+    (temp_log_dir / "notes.json").write_text("{}")
+    (temp_log_dir / "response_dir.json").mkdir()
+
+    debugger = ConversationDebuggerSubsection(log_dir=str(temp_log_dir))
+    data = await debugger.get_initial_data()
+
+    assert [c["trace_id"] for c in data["conversations"]] == ["newer", "test-trace-123"]
+
+
+@pytest.mark.asyncio
+async def test_scan_reads_summary_files_written_by_logger(temp_log_dir):
+    """Test logged traces are listed from their summary files alone."""
+    from unittest.mock import patch
+    from src.debug import RequestTrace, TelegramResponseLogger
+    from src.web.subsections import conversation_debugger
+
+    response_logger = TelegramResponseLogger(log_dir=str(temp_log_dir), enable_svg=False)
+    trace = RequestTrace()
+    trace.complete()
+    response_logger.log_response(trace, 42, "x" * 150, "reply", user_id=7)
+
+    debugger = ConversationDebuggerSubsection(log_dir=str(temp_log_dir))
+    with patch.object(
+        conversation_debugger, "_read_trace", wraps=conversation_debugger._read_trace
+    ) as opened:
+        data = await debugger.get_initial_data()
+
+    assert [call.args[0].name for call in opened.call_args_list] == [
+        p.name for p in temp_log_dir.glob("*.summary.json")
+    ]
+    [conversation] = data["conversations"]
+    assert conversation["trace_id"] == trace.trace_id
+    assert conversation["user_id"] == 7
+    assert conversation["user_message"] == "x" * 100
+    assert conversation["file_path"].endswith(".json")
+    assert not conversation["file_path"].endswith(".summary.json")
+
+    result = await debugger.handle_action("load_trace", {"trace_id": trace.trace_id})
+    assert result["bot_response"] == "reply"
@@ -0,0 +1,114 @@
+"""Tests for the persistent embedding cache."""
+
+from unittest.mock import patch
+
+import numpy as np
+
+from src.memory.embedding_cache import EmbeddingCache
+from src.memory.embeddings import EmbeddingGenerator
+
+
+def test_cache_round_trips_embeddings(tmp_path):
+    """Test stored embeddings are returned and unknown keys miss."""
+    cache = EmbeddingCache(str(tmp_path / "cache.db"))
+    hit = EmbeddingCache.make_key("model", "hello")
+    miss = EmbeddingCache.make_key("other-model", "hello")
+
+    cache.put_many([hit], [[0.5, -0.25, 1.0]])
+
+    assert cache.get_many([hit, miss]) == [[0.5, -0.25, 1.0], None]
+
+
+def test_cache_persists_across_instances(tmp_path):
+    """Test embeddings survive reopening the cache file."""
+    path = str(tmp_path / "cache.db")
+    key = EmbeddingCache.make_key("model", "hello")
+    first = EmbeddingCache(path)
+    first.put_many([key], [[0.5]])
+    first.close()
+
+    assert EmbeddingCache(path).get_many([key]) == [[0.5]]
+
+
+def test_generator_only_encodes_uncached_texts(tmp_path):
+    """Test cached texts skip the model on later calls."""
+    with patch("src.memory.embeddings.SentenceTransformer") as model_cls:
+        model = model_cls.return_value
+        model.encode.side_effect = lambda texts, **kwargs: np.array(
+            [[float(len(text))] for text in texts]
+        )
+        generator = EmbeddingGenerator(
+            cache=EmbeddingCache(str(tmp_path / "cache.db"))
+        )
+
+        assert generator.generate_embeddings(["a", "bb"]) == [[1.0], [2.0]]
+        assert generator.generate_embeddings(["bb", "ccc"]) == [[2.0], [3.0]]
+        assert generator.generate_embedding("a") == [1.0]
+
+    encoded = [call.args[0] for call in model.encode.call_args_list]
+    assert encoded == [["a", "bb"], ["ccc"]]
+
+
+def test_int8_precision_quantizes_linear_layers():
+    """Test int8 precision swaps Linear layers for dynamic quantized ones."""
+    import torch
+
+    model = torch.nn.Sequential(torch.nn.Linear(4, 4))
+    with patch("src.memory.embeddings.SentenceTransformer", return_value=model):
+        generator = EmbeddingGenerator(precision="int8")
+        generator.model
+
+    assert generator.precision == "int8"
+    assert type(model[0]).__module__.startswith("torch.ao.nn.quantized")
+    assert generator._cache_model_id == "all-MiniLM-L6-v2@int8"
+
+
+def test_fp16_precision_falls_back_on_cpu():
+    """Test fp16 is only applied when the model runs on a GPU."""
+    with patch("src.memory.embeddings.SentenceTransformer") as model_cls:
+        model_cls.return_value.device = "cpu"
+        generator = EmbeddingGenerator(precision="fp16")
+        generator.model
+
+    assert generator.precision == "fp32"
+    model_cls.return_value.half.assert_not_called()
+
+
+def test_fallback_precision_caches_under_applied_precision(tmp_path):
+    """Test vectors from an fp32 fallback are cached as fp32, not fp16."""
+    cache = EmbeddingCache(str(tmp_path / "cache.db"))
+    with patch("src.memory.embeddings.SentenceTransformer") as model_cls:
+        model_cls.return_value.device = "cpu"
+        model_cls.return_value.encode.return_value = np.array([[1.0]])
+        generator = EmbeddingGenerator(cache=cache, precision="fp16")
+
+        generator.generate_embeddings(["a"])
+
+    fp32_key = EmbeddingCache.make_key("all-MiniLM-L6-v2", "a")
+    fp16_key = EmbeddingCache.make_key("all-MiniLM-L6-v2@fp16", "a")
+    assert cache.get_many([fp32_key, fp16_key]) == [[1.0], None]
+
+
+def test_embeddings_are_normalized():
+    """Test the model is asked for unit-length vectors."""
+    with patch("src.memory.embeddings.SentenceTransformer") as model_cls:
+        model_cls.return_value.encode.return_value = np.array([[0.6, 0.8]])
+        EmbeddingGenerator().generate_embeddings(["hello"])
+
+    assert model_cls.return_value.encode.call_args.kwargs["normalize_embeddings"] is True
+
+
+def test_model_loads_only_on_cache_miss(tmp_path):
+    """Test the model isn't loaded while every text is cached."""
+    cache = EmbeddingCache(str(tmp_path / "cache.db"))
+    cache.put_many([EmbeddingCache.make_key("all-MiniLM-L6-v2", "a")], [[1.0]])
+
+    with patch("src.memory.embeddings.SentenceTransformer") as model_cls:
+        model_cls.return_value.encode.return_value = np.array([[2.0]])
+        generator = EmbeddingGenerator(cache=cache)
+
+        assert generator.generate_embedding("a") == [1.0]
+        model_cls.assert_not_called()
+
+        assert generator.generate_embedding("bb") == [2.0]
+        model_cls.assert_called_once_with("all-MiniLM-L6-v2")
@@ -0,0 +1,261 @@
+"""Tests for shared Google API service construction."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.tools import google_service
+from src.tools.calendar_reader import CalendarReaderTool
+from src.tools.calendar_writer import CalendarWriterTool
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start every test with an empty service cache."""
+    google_service.clear_service_cache()
+    yield
+    google_service.clear_service_cache()
+
+
+def _stored_creds(valid=True):
+    """Create mock OAuth2 user credentials as loaded from a token file."""
+    creds = MagicMock(valid=valid, expired=not valid, refresh_token="refresh")
+    creds.scopes = ["scope"]
+    creds.has_scopes.return_value = True
+    creds.to_json.return_value = '{"token": "new"}'
+    return creds
+
+
+def test_persisted_token_is_refreshed_and_saved(tmp_path):
+    """Test a stored token is refreshed and re-saved instead of re-consenting."""
+    token_path = tmp_path / "token.json"
+    token_path.write_text("{}")
+    creds = _stored_creds(valid=False)
+
+    def refresh(request):
+        creds.valid = True
+
+    creds.refresh.side_effect = refresh
+
+    with patch("google.oauth2.credentials.Credentials") as creds_cls, \
+         patch("google_auth_oauthlib.flow.InstalledAppFlow") as flow_cls, \
+         patch("googleapiclient.discovery.build") as build:
+        creds_cls.from_authorized_user_file.return_value = creds
+        service = google_service.get_calendar_service(
+            ["scope"], credentials_path="creds.json", token_path=str(token_path)
+        )
+
+        assert service is build.return_value
+        flow_cls.from_client_secrets_file.assert_not_called()
+        assert build.call_args.kwargs["cache_discovery"] is False
+        assert build.call_args.kwargs["static_discovery"] is True
+        assert token_path.read_text() == '{"token": "new"}'
+
+
+def test_token_missing_scopes_reruns_consent(tmp_path):
+    """Test a stored token without the needed scopes triggers the OAuth flow."""
+    token_path = tmp_path / "token.json"
+    token_path.write_text("{}")
+    stored = _stored_creds()
+    stored.has_scopes.return_value = False
+    fresh = _stored_creds()
+
+    with patch("google.oauth2.credentials.Credentials") as creds_cls, \
+         patch("google_auth_oauthlib.flow.InstalledAppFlow") as flow_cls, \
+         patch("googleapiclient.discovery.build"):
+        creds_cls.from_authorized_user_file.return_value = stored
+        flow_cls.from_client_secrets_file.return_value.run_local_server.return_value = fresh
+        google_service.get_calendar_service(
+            ["scope"], credentials_path="creds.json", token_path=str(token_path)
+        )
+
+        flow_cls.from_client_secrets_file.assert_called_once()
+
+
+def test_valid_stored_token_is_not_rewritten(tmp_path):
+    """Test a token that needed no refresh or consent is left untouched."""
+    token_path = tmp_path / "token.json"
+    token_path.write_text("{}")
+
+    with patch("google.oauth2.credentials.Credentials") as creds_cls, \
+         patch("googleapiclient.discovery.build"):
+        creds_cls.from_authorized_user_file.return_value = _stored_creds()
+        google_service.get_calendar_service(
+            ["scope"], credentials_path="creds.json", token_path=str(token_path)
+        )
+
+    assert token_path.read_text() == "{}"
+
+
+def test_reader_and_writer_share_one_token_file(tmp_path):
+    """Test calendar tools with different scopes converge on one stored token."""
+    import json
+
+    from src.tools import calendar_reader, calendar_writer
+
+    token_path = tmp_path / "token.json"
+    token_path.write_text(json.dumps({"scopes": calendar_reader.SCOPES}))
+
+    def granted(scopes):
+        creds = _stored_creds()
+        creds.scopes = scopes
+        creds.has_scopes.side_effect = lambda wanted: set(wanted) <= set(scopes)
+        creds.to_json.return_value = json.dumps({"scopes": scopes})
+        return creds
+
+    def from_file(path):
+        with open(path) as f:
+            return granted(json.load(f)["scopes"])
+
+    def consent(path, scopes):
+        flow = MagicMock()
+        flow.run_local_server.return_value = granted(scopes)
+        return flow
+
+    with patch("google.oauth2.credentials.Credentials") as creds_cls, \
+         patch("google_auth_oauthlib.flow.InstalledAppFlow") as flow_cls, \
+         patch("googleapiclient.discovery.build"):
+        creds_cls.from_authorized_user_file.side_effect = from_file
+        flow_cls.from_client_secrets_file.side_effect = consent
+
+        def load_both():
+            google_service.clear_service_cache()
+            for tool_cls in (CalendarReaderTool, CalendarWriterTool):
+                tool_cls(
+                    credentials_path="creds.json", token_path=str(token_path)
+                )._get_service()
+
+        # The writer's consent keeps the reader's scope in the shared token
+        load_both()
+        assert flow_cls.from_client_secrets_file.call_count == 1
+        requested = flow_cls.from_client_secrets_file.call_args.args[1]
+        assert set(requested) == set(calendar_reader.SCOPES + calendar_writer.SCOPES)
+
+        # After a restart both tools reuse the token without consent
+        load_both()
+        assert flow_cls.from_client_secrets_file.call_count == 1
+
+
+def test_service_shared_across_tool_instances(tmp_path):
+    """Test tools with the same credentials authenticate only once."""
+    token_path = tmp_path / "token.json"
+    token_path.write_text("{}")
+
+    with patch("google.oauth2.credentials.Credentials") as creds_cls, \
+         patch("googleapiclient.discovery.build") as build:
+        creds_cls.from_authorized_user_file.return_value = _stored_creds()
+
+        first = CalendarWriterTool(token_path=str(token_path))._get_service()
+        second = CalendarWriterTool(token_path=str(token_path))._get_service()
+        reader = CalendarReaderTool(token_path=str(token_path))._get_service()
+
+        assert first is second
+        assert creds_cls.from_authorized_user_file.call_count == 2
+        assert build.call_count == 2
+        assert reader is build.return_value
+
+
+def test_credentials_shared_across_apis(tmp_path):
+    """Test a second Google API reuses the credentials of the first."""
+    token_path = tmp_path / "token.json"
+    token_path.write_text("{}")
+
+    with patch("google.oauth2.credentials.Credentials") as creds_cls, \
+         patch("googleapiclient.discovery.build") as build:
+        creds_cls.from_authorized_user_file.return_value = _stored_creds()
+
+        google_service.get_service("calendar", "v3", ["scope"], token_path=str(token_path))
+        google_service.get_service("tasks", "v1", ["scope"], token_path=str(token_path))
+
+        assert creds_cls.from_authorized_user_file.call_count == 1
+        assert [c.args[:2] for c in build.call_args_list] == [
+            ("calendar", "v3"), ("tasks", "v1")
+        ]
+
+
+def test_missing_credentials_raise():
+    """Test that no credential source raises ValueError."""
+    with pytest.raises(ValueError):
+        google_service.get_calendar_service(["scope"])
+
+
+def test_requests_use_executing_thread_http_pool():
+    """Test a request built on one thread sends through the executing thread's pool."""
+    import threading
+    from unittest.mock import patch
+
+    import httplib2
+    from google.oauth2.credentials import Credentials
+
+    creds = Credentials(token="token")
+    service = google_service._build_service("calendar", "v3", creds)
+    # Built here, as the calendar tools do on the event loop thread
+    request = service.events().list(calendarId="primary")
+    # Batches send through their first request's client, so they resolve too
+    assert isinstance(request.http.http, google_service._ThreadLocalHttp)
+
+    used = []
+
+    def fake_request(http, uri, *args, **kwargs):
+        used.append(http)
+        return httplib2.Response({"status": 200}), b'{"items": []}'
+
+    def execute():
+        with patch.object(httplib2.Http, "request", autospec=True, side_effect=fake_request):
+            request.execute()
+            request.execute()
+        used.append(google_service._thread_http())
+
+    worker = threading.Thread(target=execute)
+    worker.start()
+    worker.join()
+
+    # Both sends reused the worker's own client, not the building thread's
+    assert used[0] is used[1] is used[2]
+    assert used[0] is not google_service._thread_http()
+
+
+def test_json_model_round_trips_bodies():
+    """Test the shared body model encodes requests and decodes responses."""
+    model = google_service._json_model()
+    body = {"summary": "Lunch", "start": {"dateTime": "2026-01-15T12:00:00Z"}}
+
+    assert model.deserialize(model.serialize(body).encode("utf-8")) == body
+    assert model.deserialize(b"not json") == "not json"
+
+
+def _http_error(status, headers=None):
+    """Create a googleapiclient HttpError with the given status."""
+    import httplib2
+    from googleapiclient.errors import HttpError
+
+    resp = httplib2.Response({"status": status, **(headers or {})})
+    return HttpError(resp, b"{}")
+
+
+def test_execute_with_retry_honors_retry_after():
+    """Test a 429 is retried after the server's Retry-After delay."""
+    request = MagicMock(method="POST")
+    request.execute.side_effect = [_http_error(429, {"retry-after": "2"}), {"id": "evt"}]
+
+    with patch("src.tools.google_service.time.sleep") as sleep:
+        assert google_service.execute_with_retry(request) == {"id": "evt"}
+
+    sleep.assert_called_once_with(2.0)
+
+
+def test_execute_with_retry_does_not_repeat_failed_writes():
+    """Test server errors are only retried for GET requests."""
+    from googleapiclient.errors import HttpError
+
+    post = MagicMock(method="POST")
+    post.execute.side_effect = _http_error(503)
+    get = MagicMock(method="GET")
+    get.execute.side_effect = [_http_error(503), {"items": []}]
+
+    with patch("src.tools.google_service.time.sleep"):
+        with pytest.raises(HttpError):
+            google_service.execute_with_retry(post)
+        assert google_service.execute_with_retry(get) == {"items": []}
+
+    assert post.execute.call_count == 1
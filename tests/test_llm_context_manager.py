@@ -76,3 +76,31 @@ async def test_get_llm_context_no_messages(mock_db, mock_llm):
     assert count == 0
     assert "No previous conversation context" in summary
     mock_llm.generate.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_get_llm_context_reuses_summary_until_new_message(mock_db, mock_llm):
+    now = datetime.now(timezone.utc)
+    first = Message(
+        chat_id=1, user_id=1, message_text="Hello",
+        role="user", timestamp=now, message_id=1
+    )
+    second = Message(
+        chat_id=1, user_id=1, message_text="Hi there",
+        role="assistant", timestamp=now, message_id=2
+    )
+    mock_db.get_recent_messages.return_value = [first]
+    manager = ConversationContextManager(db=mock_db, llm=mock_llm)
+
+    await manager.get_llm_context(1, 1, "query")
+    summary, count = await manager.get_llm_context(1, 1, "query")
+
+    assert summary == "Summarized context"
+    assert count == 1
+    assert mock_llm.generate.call_count == 1
+
+    # A different query or a new message needs a fresh summary
+    await manager.get_llm_context(1, 1, "other query")
+    mock_db.get_recent_messages.return_value = [first, second]
+    await manager.get_llm_context(1, 1, "query")
+
+    assert mock_llm.generate.call_count == 3
@@ -0,0 +1,114 @@
+"""Test live log viewer subsection."""
+
+import logging
+from unittest.mock import patch
+
+import pytest
+
+from src.web.subsections.log_viewer import LogViewerSubsection, WebLogHandler
+
+
+@pytest.fixture
+def handler():
+    """Create a log handler attached to a private logger."""
+    handler = WebLogHandler()
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    test_logger = logging.getLogger("test_log_viewer")
+    test_logger.setLevel(logging.DEBUG)
+    test_logger.addHandler(handler)
+    yield handler
+    test_logger.removeHandler(handler)
+
+
+def test_capture_level_skips_formatting_lower_records(handler):
+    """Test records below the configured capture level are never formatted."""
+    test_logger = logging.getLogger("test_log_viewer")
+    handler.set_capture_level("WARNING")
+
+    with patch.object(handler, "format", wraps=handler.format) as formatted:
+        test_logger.debug("noise")
+        test_logger.info("noise")
+        test_logger.error("boom")
+        # Also when emit is called directly
+        handler.emit(logging.makeLogRecord({"msg": "direct", "levelno": logging.INFO}))
+
+    assert formatted.call_count == 1
+    assert [log["message"] for log in handler.get_logs()] == ["boom"]
+
+
+@pytest.mark.asyncio
+async def test_level_dropdown_does_not_change_capture(handler):
+    """Test the UI level filter is client-side and leaves capture alone."""
+    viewer = LogViewerSubsection()
+    viewer._handler = handler
+
+    data = await viewer.get_initial_data()
+    assert data["selectedLevel"] == "ALL"
+    assert "sendAction('set_level'" not in await viewer.get_html_template()
+    assert "error" in await viewer.handle_action("set_level", {"level": "ERROR"})
+    assert handler.level == logging.NOTSET
+
+
+def test_timestamps_match_strftime_format(handler):
+    """Test cached timestamps equal the full strftime rendering."""
+    from datetime import datetime
+
+    for created in (1700000000.0, 1700000000.5, 1700000000.999, 1700000001.042):
+        record = logging.makeLogRecord({"msg": "x", "created": created})
+        record.msecs = (created - int(created)) * 1000
+        expected = datetime.fromtimestamp(created).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+        assert handler._format_timestamp(record) == expected
+
+
+@pytest.mark.asyncio
+async def test_new_logs_are_broadcast_in_batches(handler):
+    """Test records logged together reach the callback as one batch."""
+    import asyncio
+    from unittest.mock import AsyncMock
+
+    test_logger = logging.getLogger("test_log_viewer")
+    callback = AsyncMock()
+    handler.set_broadcast_callback(callback)
+
+    for i in range(3):
+        test_logger.info(f"line {i}")
+    await asyncio.to_thread(test_logger.warning, "from a thread")
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+    batches = [c.args[0]["new_logs"] for c in callback.await_args_list]
+    assert [log["message"] for log in batches[0]] == ["line 0", "line 1", "line 2"]
+    assert [log["message"] for batch in batches for log in batch][-1] == "from a thread"
+    handler._drain_task.cancel()
+
+
+def test_get_logs_filters_by_stored_level_number(handler):
+    """Test filtering compares each entry's stored level number."""
+    test_logger = logging.getLogger("test_log_viewer")
+    test_logger.debug("d")
+    test_logger.warning("w")
+    test_logger.log(35, "custom")
+    test_logger.critical("c")
+
+    assert [log["levelno"] for log in handler.get_logs()] == [10, 30, 35, 50]
+    assert [log["message"] for log in handler.get_logs("WARNING")] == ["w", "custom", "c"]
+    assert [log["message"] for log in handler.get_logs("ERROR")] == ["c"]
+    assert len(handler.get_logs("ALL")) == 4
+
+
+def test_filtered_logs_are_reused_until_logs_change(handler):
+    """Test repeated queries share one result until an emit or clear."""
+    test_logger = logging.getLogger("test_log_viewer")
+    test_logger.info("i")
+    test_logger.error("e")
+
+    first = handler.get_logs("ERROR")
+    assert handler.get_logs("ERROR") is first
+    assert handler.get_logs() is handler.get_logs("ALL")
+
+    test_logger.error("again")
+    assert [log["message"] for log in handler.get_logs("ERROR")] == ["e", "again"]
+
+    handler.clear()
+    assert handler.get_logs("ERROR") == []
+    assert handler.get_logs() == []
@@ -77,3 +77,49 @@ def test_response_logger_metadata_formatting(tmp_path):
     assert "Metadata:" in content
     assert "full_content:" in content
     assert "Multi-line" in content
+
+
+def test_setup_logging_writes_file_through_queue(tmp_path):
+    import logging
+    import logging.handlers
+
+    from src.utils import logging as logging_utils
+
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    log_file = tmp_path / "app.log"
+    try:
+        logging_utils.setup_logging(verbosity=2, log_file=str(log_file))
+        assert any(
+            isinstance(h, logging.handlers.QueueHandler) for h in root.handlers
+        )
+
+        logging.getLogger("test").debug("queued message")
+        logging_utils._stop_queue_listener()
+    finally:
+        root.handlers[:] = saved_handlers
+        root.setLevel(saved_level)
+
+    assert "queued message" in log_file.read_text()
+
+
+def test_response_logger_stores_user_message_preview(tmp_path):
+    import json
+
+    from src.debug.response_logger import build_trace_summary
+
+    response_logger = TelegramResponseLogger(log_dir=str(tmp_path), enable_svg=False)
+    trace = RequestTrace()
+    trace.complete()
+
+    data = response_logger.build_trace_data(trace, 1, "m" * 500, "reply")
+    assert data["user_message_preview"] == "m" * 100
+
+    # Summaries use the stored preview, and slice only for legacy traces
+    assert build_trace_summary(dict(data, user_message_preview="short"))["user_message"] == "short"
+    del data["user_message_preview"]
+    assert build_trace_summary(data)["user_message"] == "m" * 100
+
+    log_path = response_logger.log_response(trace, 1, "m" * 500, "reply")
+    with open(log_path.replace(".log", ".json")) as f:
+        assert json.load(f)["user_message_preview"] == "m" * 100
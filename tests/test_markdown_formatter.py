@@ -107,6 +107,12 @@ class TestMarkdownToTelegramHtml:
         assert "&lt;script&gt;" in result
         assert "&amp; ampersand" in result
 
+    def test_plain_text_fast_path_escapes_html(self):
+        """Test text without markdown is only HTML escaped."""
+        text = "Status: 3 < 5 & done\n-1 is a number"
+        result = markdown_to_telegram_html(text)
+        assert result == "Status: 3 &lt; 5 &amp; done\n-1 is a number"
+
     def test_code_preserves_content(self):
         """Test code blocks preserve markdown-like content."""
         text = "```\n**not bold** and *not italic*\n```"
@@ -177,3 +177,47 @@ def test_extract_non_reply_message(basic_config):
     extracted = extractor.extract(update)
     assert extracted is not None
     assert extracted.reply_to_message_id is None
+
+
+def test_is_bot_mentioned_checks_mention_entities():
+    """Test only mention entities naming the current bot username count."""
+    config = AppConfig(
+        telegram=TelegramConfig(bot_token="test_token", mode="poll", require_mention=True),
+        llm=LLMConfig(
+            provider="ollama",
+            ollama=OllamaConfig(model="llama2"),
+        ),
+    )
+    extractor = MessageExtractor(config)
+    extractor.set_bot_username("@MyBot")
+    message = {
+        "chat": {"id": 123},
+        "message_id": 789,
+        "text": "@mybot hello",
+        "entities": [{"type": "mention", "offset": 0, "length": 6}],
+    }
+
+    assert extractor.is_bot_mentioned(message) is True
+
+    extractor.set_bot_username("otherbot")
+    assert extractor.is_bot_mentioned(message) is False
+
+    assert extractor.is_bot_mentioned({"text": "hello"}) is False
+
+
+def test_extracted_message_uses_slots():
+    """Test ExtractedMessage instances carry no per-instance __dict__."""
+    extracted = ExtractedMessage(chat_id=1, user_id=2, message_text="hi")
+    assert not hasattr(extracted, "__dict__")
+    with pytest.raises(AttributeError):
+        extracted.unknown_field = True
+
+
+def test_extract_rejects_incomplete_messages(basic_config):
+    """Test updates missing text, chat or sender are rejected."""
+    extractor = MessageExtractor(basic_config)
+
+    assert extractor.extract({"edited_message": {"text": "hi"}}) is None
+    assert extractor.extract({"message": {"chat": {"id": 1}, "from": {"id": 2}}}) is None
+    assert extractor.extract({"message": {"text": "hi", "from": {"id": 2}}}) is None
+    assert extractor.extract({"message": {"text": "hi", "chat": {"id": 1}}}) is None
@@ -1,7 +1,7 @@
 """Tests for Notion client."""
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 
 from src.notion.client import NotionClient
 from src.notion.models import NotionBlock
@@ -119,6 +119,179 @@ class TestNotionClient:
         assert blocks[1].block_id == "block-2"
         assert notion_client.client.blocks.children.list.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_get_blocks_async_handles_pagination(self, notion_client):
+        """Test that get_blocks_async follows next_cursor until has_more is False."""
+        async_sdk = MagicMock()
+        async_sdk.blocks.children.list = AsyncMock(side_effect=[
+            {
+                "results": [
+                    {"id": "block-1", "type": "paragraph", "paragraph": {"rich_text": []}}
+                ],
+                "has_more": True,
+                "next_cursor": "cursor-1",
+            },
+            {
+                "results": [
+                    {"id": "block-2", "type": "paragraph", "paragraph": {"rich_text": []}}
+                ],
+                "has_more": False,
+            },
+        ])
+        notion_client._async_client = async_sdk
+
+        blocks = await notion_client.get_blocks_async("page-123")
+
+        assert [b.block_id for b in blocks] == ["block-1", "block-2"]
+        second_call = async_sdk.blocks.children.list.call_args_list[1]
+        assert second_call.kwargs["start_cursor"] == "cursor-1"
+
+    @pytest.mark.asyncio
+    async def test_get_page_content_async_includes_children(self, notion_client):
+        """Test that async page content recurses into child blocks."""
+        def paragraph(block_id, text, has_children=False):
+            return {
+                "id": block_id,
+                "type": "paragraph",
+                "paragraph": {"rich_text": [{"plain_text": text}]},
+                "has_children": has_children,
+            }
+
+        responses = {
+            "page-123": {"results": [paragraph("block-1", "Parent", True)], "has_more": False},
+            "block-1": {"results": [paragraph("block-2", "Child")], "has_more": False},
+        }
+        async_sdk = MagicMock()
+        async_sdk.blocks.children.list = AsyncMock(
+            side_effect=lambda block_id, **kwargs: responses[block_id]
+        )
+        notion_client._async_client = async_sdk
+
+        content = await notion_client.get_page_content_async("page-123")
+
+        assert content == "Parent\n  Child"
+
+    @pytest.mark.asyncio
+    async def test_get_page_content_async_fetches_siblings_concurrently(self, notion_client):
+        """Test sibling subtrees are fetched in parallel and kept in order."""
+        import asyncio
+
+        def paragraph(block_id, text, has_children=False):
+            return {
+                "id": block_id,
+                "type": "paragraph",
+                "paragraph": {"rich_text": [{"plain_text": text}]},
+                "has_children": has_children,
+            }
+
+        responses = {
+            "page-123": {
+                "results": [paragraph("a", "A", True), paragraph("b", "B", True)],
+                "has_more": False,
+            },
+            "a": {"results": [paragraph("a1", "A1")], "has_more": False},
+            "b": {"results": [paragraph("b1", "B1")], "has_more": False},
+        }
+        started = set()
+        both_started = asyncio.Event()
+
+        async def list_children(block_id, **kwargs):
+            if block_id != "page-123":
+                started.add(block_id)
+                if len(started) == 2:
+                    both_started.set()
+                # Neither child listing finishes until both are in flight
+                await asyncio.wait_for(both_started.wait(), timeout=1)
+            return responses[block_id]
+
+        async_sdk = MagicMock()
+        async_sdk.blocks.children.list = AsyncMock(side_effect=list_children)
+        notion_client._async_client = async_sdk
+
+        content = await notion_client.get_page_content_async("page-123")
+
+        assert content == "A\n  A1\nB\n  B1"
+
+    @pytest.mark.asyncio
+    async def test_async_rate_limit_is_shared_across_concurrent_requests(self, notion_client):
+        """Test concurrent async requests start rate_limit_delay apart."""
+        import asyncio
+
+        notion_client.rate_limit_delay = 0.5
+        now = [100.0]
+        waits = []
+
+        async def fake_sleep(delay):
+            waits.append(round(delay, 6))
+            now[0] += delay
+
+        with patch("src.notion.client.time.monotonic", side_effect=lambda: now[0]), \
+             patch("src.notion.client.asyncio.sleep", side_effect=fake_sleep):
+            await asyncio.gather(*(notion_client._rate_limit_async() for _ in range(4)))
+
+        # The first request goes at once; each later one waits its turn
+        assert waits == [0.5, 0.5, 0.5]
+        assert now[0] == 101.5
+
+    @pytest.mark.asyncio
+    async def test_get_page_content_async_cancels_subtrees_on_error(self, notion_client):
+        """Test a failed listing cancels child subtree fetches still in flight."""
+        import asyncio
+
+        def paragraph(block_id, has_children=False):
+            return {
+                "id": block_id,
+                "type": "paragraph",
+                "paragraph": {"rich_text": [{"plain_text": block_id}]},
+                "has_children": has_children,
+            }
+
+        child_started = asyncio.Event()
+        child_cancelled = asyncio.Event()
+
+        async def list_children(block_id, start_cursor=None, **kwargs):
+            if block_id == "a":
+                child_started.set()
+                try:
+                    await asyncio.Event().wait()
+                except asyncio.CancelledError:
+                    child_cancelled.set()
+                    raise
+            if start_cursor is None:
+                return {
+                    "results": [paragraph("a", True)],
+                    "has_more": True,
+                    "next_cursor": "cursor-1",
+                }
+            await child_started.wait()
+            raise RuntimeError("listing failed")
+
+        async_sdk = MagicMock()
+        async_sdk.blocks.children.list = AsyncMock(side_effect=list_children)
+        notion_client._async_client = async_sdk
+
+        with pytest.raises(RuntimeError, match="listing failed"):
+            await notion_client.get_page_content_async("page-123")
+
+        assert child_cancelled.is_set()
+
+    def test_async_primitives_created_on_first_async_use(self, mock_notion_sdk):
+        """Test the client can be built outside any event loop."""
+        client = NotionClient(api_key="test-key")
+
+        assert client._block_request_slots is None
+        assert client._rate_limit_lock is None
+
+    def test_async_client_is_created_once(self, notion_client):
+        """Test that the async client and its connection pool are reused."""
+        with patch("src.notion.client.AsyncClient") as mock_async:
+            first = notion_client.async_client
+            second = notion_client.async_client
+
+        assert first is second
+        mock_async.assert_called_once()
+        assert mock_async.call_args.kwargs["auth"] == "test-api-key"
+
     def test_extract_block_content_paragraph(self, notion_client):
         """Test content extraction from paragraph block."""
         block = {
@@ -167,6 +340,19 @@ class TestNotionClient:
         content = notion_client._extract_block_content(block)
         assert "[Page: Sub Page]" == content
 
+    def test_extract_block_content_special_blocks(self, notion_client):
+        """Test content extraction from non rich text block types."""
+        cases = [
+            ({"type": "image", "image": {"caption": [{"plain_text": "Cat"}]}}, "[Image: Cat]"),
+            ({"type": "image", "image": {"caption": []}}, "[Image]"),
+            ({"type": "divider", "divider": {}}, "---"),
+            ({"type": "bookmark", "bookmark": {"url": "https://x.y"}}, "[Bookmark: https://x.y]"),
+            ({"type": "unsupported", "unsupported": {}}, ""),
+        ]
+
+        for block, expected in cases:
+            assert notion_client._extract_block_content(block) == expected
+
     def test_get_child_pages(self, notion_client):
         """Test getting child page IDs."""
         response = {
@@ -244,6 +244,47 @@ class TestNotionIndexer:
             assert stats.pages_skipped == 0
             assert stats.pages_failed == 0
 
+    @pytest.mark.asyncio
+    async def test_index_workspace_batches_embeddings(
+        self, indexer, workspace_config, mock_embedding_generator, mock_vector_store
+    ):
+        """Test changed pages are embedded and stored in one batch."""
+        mock_embedding_generator.generate_embeddings.side_effect = (
+            lambda texts, batch_size: [[0.1] * 384 for _ in texts]
+        )
+        with patch("src.notion.indexer.WorkspaceTraverser") as MockTraverser:
+            MockTraverser.return_value.traverse.return_value = iter([
+                ("page-1", "Page 1", "Root > Page 1"),
+                ("page-2", "Page 2", "Root > Page 2"),
+            ])
+
+            stats = await indexer.index_workspace(workspace_config)
+
+        assert stats.pages_indexed == 2
+        mock_embedding_generator.generate_embedding.assert_not_called()
+        mock_embedding_generator.generate_embeddings.assert_called_once()
+        mock_vector_store.store.assert_not_called()
+        upsert = mock_vector_store.upsert_batch.call_args.kwargs
+        assert upsert["ids"] == ["page-1", "page-2"]
+        assert len(upsert["embeddings"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_index_workspace_batch_failure_marks_pages_failed(
+        self, indexer, workspace_config, mock_vector_store
+    ):
+        """Test a failed batch store counts every page in it as failed."""
+        mock_vector_store.upsert_batch.side_effect = Exception("store down")
+        with patch("src.notion.indexer.WorkspaceTraverser") as MockTraverser:
+            MockTraverser.return_value.traverse.return_value = iter([
+                ("page-1", "Page 1", "Root > Page 1"),
+                ("page-2", "Page 2", "Root > Page 2"),
+            ])
+
+            stats = await indexer.index_workspace(workspace_config)
+
+        assert stats.pages_indexed == 0
+        assert stats.pages_failed == 2
+
     def test_get_index_stats(self, indexer):
         """Test getting index statistics."""
         stats = indexer.get_index_stats()
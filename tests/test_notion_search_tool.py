@@ -1,10 +1,12 @@
 """Tests for NotionSearchTool."""
 
+import asyncio
+
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
 from datetime import datetime
 
-from src.tools.notion_search import NotionSearchTool
+from src.tools.notion_search import NotionSearchTool, _extract_page_id
 from src.context.models import ConversationContext, Message
 
 
@@ -61,12 +63,14 @@ def notion_search_tool(mock_vector_store, mock_embedding_generator):
     """Create NotionSearchTool with mocks."""
     with patch("src.tools.notion_search.NotionClient") as MockClient:
         mock_client = Mock()
-        mock_client.get_page.return_value = {
+        mock_client.get_page_async = AsyncMock(return_value={
             "id": "page-1",
             "properties": {"title": {"type": "title", "title": [{"plain_text": "Page 1"}]}},
-        }
+        })
         mock_client.get_page_title.return_value = "Page 1"
-        mock_client.get_page_content.return_value = "Full content of the page"
+        mock_client.get_page_content_async = AsyncMock(
+            return_value="Full content of the page"
+        )
         MockClient.return_value = mock_client
 
         tool = NotionSearchTool(
@@ -133,6 +137,84 @@ class TestNotionSearchTool:
         # Verify vector store was searched
         mock_vector_store.search.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_repeated_query_reuses_embedding(
+        self, notion_search_tool, conversation_context, mock_embedding_generator
+    ):
+        """Test that the same query is only embedded once."""
+        for _ in range(2):
+            await notion_search_tool.execute(
+                conversation_context, query="tax notes", read_page=False
+            )
+        await notion_search_tool.execute(
+            conversation_context, query="other", read_page=False
+        )
+
+        assert mock_embedding_generator.generate_embedding.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_search_runs_off_event_loop(
+        self, notion_search_tool, conversation_context, mock_vector_store
+    ):
+        """Test embedding and vector search don't block the event loop thread."""
+        import threading
+
+        threads = []
+        mock_vector_store.search.side_effect = (
+            lambda **kwargs: threads.append(threading.current_thread()) or []
+        )
+
+        await notion_search_tool.execute(
+            conversation_context, query="test query", read_page=False
+        )
+
+        assert threads and threads[0] is not threading.current_thread()
+
+    @pytest.mark.asyncio
+    async def test_near_duplicate_query_reuses_results(
+        self, notion_search_tool, conversation_context,
+        mock_vector_store, mock_embedding_generator,
+    ):
+        """Test a query embedding close to a recent one skips the vector search."""
+        embeddings = {
+            "tax notes": [1.0, 0.0],
+            "my tax notes": [0.99, 0.141],
+            "recipes": [0.0, 1.0],
+        }
+        mock_embedding_generator.generate_embedding.side_effect = embeddings.get
+
+        for query in ("tax notes", "my tax notes"):
+            result = await notion_search_tool.execute(
+                conversation_context, query=query, read_page=False
+            )
+            assert result.data["count"] == 2
+        assert mock_vector_store.search.call_count == 1
+
+        # Dissimilar queries and different result limits search again
+        await notion_search_tool.execute(
+            conversation_context, query="recipes", read_page=False
+        )
+        await notion_search_tool.execute(
+            conversation_context, query="tax notes", read_page=False, max_results=3
+        )
+        assert mock_vector_store.search.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_semantic_cache_entries_expire(
+        self, notion_search_tool, conversation_context, mock_vector_store
+    ):
+        """Test cached search results are not reused after their TTL."""
+        with patch("src.tools.notion_search.time.monotonic", return_value=1000.0):
+            await notion_search_tool.execute(
+                conversation_context, query="tax notes", read_page=False
+            )
+        with patch("src.tools.notion_search.time.monotonic", return_value=2000.0):
+            await notion_search_tool.execute(
+                conversation_context, query="tax notes", read_page=False
+            )
+
+        assert mock_vector_store.search.call_count == 2
+
     @pytest.mark.asyncio
     async def test_search_with_no_results(
         self, notion_search_tool, conversation_context, mock_vector_store
@@ -181,6 +263,72 @@ class TestNotionSearchTool:
         # Search should not be called when page_id is provided
         mock_vector_store.search.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_page_id_is_extracted_from_url(
+        self, notion_search_tool, conversation_context
+    ):
+        """Test that a pasted Notion URL is read as its page ID."""
+        page_hex = "0123456789abcdef0123456789abcdef"
+
+        await notion_search_tool.execute(
+            conversation_context,
+            page_id=f"https://www.notion.so/team/Tax-Notes-{page_hex}?pvs=4",
+        )
+
+        notion_search_tool.notion_client.get_page_async.assert_awaited_once_with(page_hex)
+
+    def test_extract_page_id(self):
+        """Test page ID extraction keeps bare and dashed IDs as written."""
+        dashed = "01234567-89ab-cdef-0123-456789abcdef"
+
+        assert _extract_page_id(dashed) == dashed
+        assert _extract_page_id(f"https://notion.so/{dashed}#block") == dashed
+        assert _extract_page_id("page-1") == "page-1"
+
+    def test_extract_page_id_ignores_fragment_and_query_ids(self):
+        """Test block IDs in fragments and view IDs in queries are not taken."""
+        page = "0123456789abcdef0123456789abcdef"
+        block = "fedcba9876543210fedcba9876543210"
+        view = "aaaabbbbccccddddeeeeffff00001111"
+
+        assert _extract_page_id(f"https://www.notion.so/ws/My-Page-{page}#{block}") == page
+        assert _extract_page_id(f"https://www.notion.so/ws/{page}?v={view}") == page
+        assert _extract_page_id(f"https://www.notion.so/ws/My-Page-{page}/") == page
+        # A longer hex run is not an ID
+        assert _extract_page_id(f"https://www.notion.so/ws/a{page}") == f"https://www.notion.so/ws/a{page}"
+
+    @pytest.mark.asyncio
+    async def test_page_reads_are_shared_and_cached(
+        self, notion_search_tool, conversation_context
+    ):
+        """Test concurrent and repeated reads of a page hit Notion once."""
+        client = notion_search_tool.notion_client
+
+        results = await asyncio.gather(
+            notion_search_tool.execute(conversation_context, page_id="page-1"),
+            notion_search_tool.execute(conversation_context, page_id="page-1"),
+        )
+        again = await notion_search_tool.execute(conversation_context, page_id="page-1")
+
+        assert all(r.success for r in results) and again.success
+        assert client.get_page_async.await_count == 1
+        assert client.get_page_content_async.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_page_read_is_not_cached(
+        self, notion_search_tool, conversation_context
+    ):
+        """Test a failed fetch is retried on the next call."""
+        client = notion_search_tool.notion_client
+        page = client.get_page_async.return_value
+        client.get_page_async.side_effect = [Exception("API error"), page]
+
+        first = await notion_search_tool.execute(conversation_context, page_id="page-1")
+        second = await notion_search_tool.execute(conversation_context, page_id="page-1")
+
+        assert first.success is False
+        assert second.success is True
+
     @pytest.mark.asyncio
     async def test_search_with_max_results(
         self, notion_search_tool, conversation_context, mock_vector_store
@@ -212,7 +360,7 @@ class TestNotionSearchTool:
         self, notion_search_tool, conversation_context
     ):
         """Test handling of page fetch errors."""
-        notion_search_tool.notion_client.get_page.side_effect = Exception("API error")
+        notion_search_tool.notion_client.get_page_async.side_effect = Exception("API error")
 
         result = await notion_search_tool.execute(
             conversation_context,
@@ -246,6 +394,19 @@ class TestNotionSearchTool:
         assert "Root > Page 1" in formatted
         assert "Summary of page 1" in formatted
 
+    def test_format_search_results_layout(self, notion_search_tool):
+        """Test the exact layout of formatted search results."""
+        results = [
+            {"metadata": {"page_id": "p1", "title": "A", "path": "Root > A", "summary": "About A"}},
+            {"metadata": {"page_id": "p2", "title": "B"}},
+        ]
+
+        assert notion_search_tool._format_search_results(results) == (
+            "Found 2 matching page(s):\n\n"
+            "1. **Root > A**\n   About A\n   Page ID: p1\n\n"
+            "2. **B**\n   Page ID: p2\n"
+        )
+
     def test_format_page_content(self, notion_search_tool):
         """Test formatting of page content."""
         page_data = {
@@ -261,3 +422,22 @@ class TestNotionSearchTool:
         assert "Root > Test Page" in formatted
         assert "This is a summary" in formatted
         assert "Full page content here" in formatted
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_notion_connection_pool(
+        self, mock_vector_store, mock_embedding_generator
+    ):
+        """Test closing the tool closes the Notion client's pooled connections."""
+        with patch("src.notion.client.Client"):
+            tool = NotionSearchTool(
+                api_key="test-api-key",
+                vector_store=mock_vector_store,
+                embedding_generator=mock_embedding_generator,
+            )
+        async_client = AsyncMock()
+        tool.notion_client._async_client = async_client
+
+        await tool.aclose()
+
+        async_client.aclose.assert_awaited_once()
+        assert tool.notion_client._async_client is None
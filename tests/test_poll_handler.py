@@ -0,0 +1,72 @@
+"""Tests for Telegram poll handler."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.telegram.poll_handler import PollHandler
+
+
+def _mock_application():
+    """Create a mock python-telegram-bot Application."""
+    application = MagicMock()
+    application.initialize = AsyncMock()
+    application.start = AsyncMock()
+    application.stop = AsyncMock()
+    application.shutdown = AsyncMock()
+    application.bot.delete_webhook = AsyncMock()
+    application.updater.start_polling = AsyncMock()
+    application.updater.stop = AsyncMock()
+    return application
+
+
+@pytest.mark.asyncio
+async def test_restart_reuses_application():
+    """Test start after stop reuses the built application."""
+    application = _mock_application()
+    with patch("src.telegram.poll_handler.Application") as app_cls:
+        app_cls.builder.return_value.token.return_value.build.return_value = application
+        handler = PollHandler(bot_token="token", message_handler=AsyncMock())
+
+        await handler.start()
+        await handler.stop()
+        await handler.start()
+
+        assert app_cls.builder.call_count == 1
+        assert application.add_handler.call_count == 2
+        assert application.updater.start_polling.await_count == 2
+        application.shutdown.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_token_change_rebuilds_application():
+    """Test a changed token shuts down the old application and builds a new one."""
+    first, second = _mock_application(), _mock_application()
+    with patch("src.telegram.poll_handler.Application") as app_cls:
+        app_cls.builder.return_value.token.return_value.build.side_effect = [first, second]
+        handler = PollHandler(bot_token="token", message_handler=AsyncMock())
+
+        await handler.start()
+        await handler.stop()
+        handler.bot_token = "new_token"
+        await handler.start()
+
+        first.shutdown.assert_awaited_once()
+        assert handler.application is second
+
+
+@pytest.mark.asyncio
+async def test_shutdown_releases_application():
+    """Test shutdown stops polling and drops the application."""
+    application = _mock_application()
+    with patch("src.telegram.poll_handler.Application") as app_cls:
+        app_cls.builder.return_value.token.return_value.build.return_value = application
+        handler = PollHandler(bot_token="token", message_handler=AsyncMock())
+
+        await handler.start()
+        await handler.shutdown()
+
+        application.updater.stop.assert_awaited_once()
+        application.stop.assert_awaited_once()
+        application.shutdown.assert_awaited_once()
+        assert handler.application is None
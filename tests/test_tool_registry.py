@@ -92,3 +92,20 @@ def test_initialize_tools_with_context_manager(basic_config):
     assert registry.get_tool("get_conversation_history") is not None
     tools = registry.get_all_tools()
     assert len(tools) == 1
+
+
+@pytest.mark.asyncio
+async def test_aclose_closes_every_tool():
+    """Test closing the registry closes each tool, even after a failure."""
+    registry = ToolRegistry()
+    failing = MockTool("failing")
+    failing.aclose = AsyncMock(side_effect=RuntimeError("boom"))
+    closing = MockTool("closing")
+    closing.aclose = AsyncMock()
+    registry.register_tool(failing)
+    registry.register_tool(closing)
+
+    await registry.aclose()
+
+    failing.aclose.assert_awaited_once()
+    closing.aclose.assert_awaited_once()
@@ -91,3 +91,31 @@ def test_tool_validate_input():
     # Default implementation should return True
     assert tool.validate_input() is True
 
+
+
+def test_tool_result_uses_slots():
+    """Test ToolResult instances carry no per-instance __dict__."""
+    result = ToolResult(success=True, data=None)
+    assert not hasattr(result, "__dict__")
+    assert result.error is None
+    assert result.message is None
+
+
+def test_tool_result_pool_reuses_released_results():
+    """Test acquired results are recycled and plain results are never pooled."""
+    ToolResult._pool.clear()
+
+    first = ToolResult.acquire(success=True, data={"a": 1}, message="ok")
+    first.release()
+    first.release()  # Double release must not pool the object twice
+    assert ToolResult._pool == [first]
+    assert first.data is None
+
+    second = ToolResult.acquire(success=False, data=None, error="boom")
+    assert second is first
+    assert second.success is False
+    assert second.error == "boom"
+    assert second.message is None
+
+    ToolResult(success=True, data=None).release()
+    assert ToolResult._pool == []
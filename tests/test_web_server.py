@@ -0,0 +1,164 @@
+"""Tests for the web debug server."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.web.server import WebDebugServer
+
+
+@pytest.fixture
+def server():
+    """Create a server with a mocked connection manager."""
+    server = WebDebugServer()
+    server.manager = AsyncMock()
+    return server
+
+
+@pytest.mark.asyncio
+async def test_single_update_is_sent_as_update(server):
+    """Test a lone update keeps the plain update message format."""
+    await server.broadcast_update("conversations", {"id": 1})
+
+    server.manager.broadcast_to_subsection.assert_awaited_once_with(
+        "conversations",
+        {"subsection": "conversations", "type": "update", "data": {"id": 1}},
+    )
+
+
+@pytest.mark.asyncio
+async def test_updates_in_one_tick_are_coalesced(server):
+    """Test concurrent updates for a subsection go out as one batch message."""
+    await asyncio.gather(
+        server.broadcast_update("conversations", {"id": 1}),
+        server.broadcast_update("conversations", {"id": 2}),
+        server.broadcast_update("logs", {"line": "x"}),
+    )
+
+    calls = {
+        c.args[0]: c.args[1]
+        for c in server.manager.broadcast_to_subsection.await_args_list
+    }
+    assert calls["conversations"] == {
+        "subsection": "conversations",
+        "type": "update_batch",
+        "items": [{"id": 1}, {"id": 2}],
+    }
+    assert calls["logs"]["type"] == "update"
+    assert server.manager.broadcast_to_subsection.await_count == 2
+
+
+def test_static_files_support_conditional_requests():
+    """Test the page and assets carry ETags and unchanged copies get a 304."""
+    from fastapi.testclient import TestClient
+
+    client = TestClient(WebDebugServer().app)
+
+    for path in ("/", "/static/app.js"):
+        response = client.get(path)
+        assert response.status_code == 200
+        cached = client.get(path, headers={"If-None-Match": response.headers["etag"]})
+        assert cached.status_code == 304
+
+    assert client.get("/").text.startswith("<!DOCTYPE")
+    assert client.get("/static/missing.js").status_code == 404
+
+
+def test_responses_are_gzipped_for_clients_that_accept_it():
+    """Test larger responses are compressed and small ones are left alone."""
+    from fastapi.testclient import TestClient
+
+    client = TestClient(WebDebugServer().app)
+
+    response = client.get("/static/app.js", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert "function debugApp" in response.text
+
+    response = client.get("/static/app.js", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in response.headers
+
+    response = client.get("/api/subsections", headers={"Accept-Encoding": "gzip"})
+    assert response.json() == []
+    assert "content-encoding" not in response.headers
+
+
+def test_trace_files_are_served_over_http(tmp_path):
+    """Test a subsection's files are streamed as is and unknown ones 404."""
+    import json
+
+    from fastapi.testclient import TestClient
+
+    from src.web.registry import SubsectionRegistry
+    from src.web.subsections.conversation_debugger import (
+        ConversationDebuggerSubsection,
+    )
+
+    trace = {"trace_id": "abc", "events": [{"type": "request"}]}
+    (tmp_path / "response_1_x.json").write_text(json.dumps(trace))
+
+    registry = SubsectionRegistry()
+    registry.register(ConversationDebuggerSubsection(log_dir=str(tmp_path)))
+    client = TestClient(WebDebugServer(registry=registry).app)
+
+    response = client.get("/api/subsection/conversations/file/abc")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == trace
+
+    assert client.get("/api/subsection/conversations/file/missing").status_code == 404
+    assert client.get("/api/subsection/nope/file/abc").status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_ws_messages_are_dispatched_by_type(server):
+    """Test client messages reach their handler and unknown types are ignored."""
+    from unittest.mock import MagicMock
+
+    websocket = object()
+    subsection = MagicMock()
+    subsection.handle_action = AsyncMock(return_value={"ok": True})
+    server.registry = MagicMock()
+    server.registry.get.return_value = subsection
+
+    await server._handle_ws_message(websocket, {"type": "subscribe", "subsection": "logs"})
+    server.manager.subscribe.assert_awaited_once_with(websocket, "logs")
+
+    await server._handle_ws_message(
+        websocket,
+        {"type": "action", "subsection": "logs", "action": "clear", "data": {"x": 1}},
+    )
+    subsection.handle_action.assert_awaited_once_with("clear", {"x": 1})
+    server.manager.send.assert_awaited_once_with(
+        websocket,
+        {"type": "action_result", "subsection": "logs", "action": "clear", "result": {"ok": True}},
+    )
+
+    await server._handle_ws_message(websocket, {"type": "bogus"})
+    await server._handle_ws_message(websocket, {})
+    server.manager.unsubscribe.assert_not_called()
+
+
+def test_websocket_session_round_trip():
+    """Test a client gets action results and is unregistered on disconnect."""
+    import json
+
+    from fastapi.testclient import TestClient
+
+    from src.web.registry import SubsectionRegistry
+    from src.web.subsections.config_viewer import ConfigViewerSubsection
+
+    registry = SubsectionRegistry()
+    registry.register(ConfigViewerSubsection())
+    server = WebDebugServer(registry=registry)
+
+    with TestClient(server.app).websocket_connect("/ws") as ws:
+        ws.send_json({"type": "subscribe", "subsection": "config"})
+        ws.send_json({"type": "action", "subsection": "config", "action": "x"})
+        reply = json.loads(ws.receive_bytes())
+        assert reply["type"] == "action_result"
+        assert reply["result"] == {"error": "Unknown action: x"}
+        assert server.manager.connection_count == 1
+
+    # The receive loop ends on disconnect and unregisters the socket
+    assert server.manager.connection_count == 0
@@ -0,0 +1,113 @@
+"""Tests for the debug UI WebSocket connection manager."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.web import websocket_manager
+from src.web.websocket_manager import ConnectionManager
+
+
+def _websocket():
+    """Create a mock WebSocket."""
+    return AsyncMock()
+
+
+async def _flush(manager):
+    """Wait until every client's writer has sent its queued messages."""
+    await asyncio.gather(*(queue.join() for queue in list(manager._queues.values())))
+
+
+@pytest.mark.asyncio
+async def test_broadcast_serializes_once_for_all_subscribers():
+    """Test a broadcast is encoded once and sent as the same frame to everyone."""
+    manager = ConnectionManager()
+    sockets = [_websocket() for _ in range(3)]
+    for ws in sockets:
+        await manager.connect(ws)
+        await manager.subscribe(ws, "conversations")
+
+    message = {"type": "update", "subsection": "conversations", "data": {"id": 1}}
+    with patch(
+        "src.web.websocket_manager._encode", wraps=websocket_manager._encode
+    ) as encode:
+        await manager.broadcast_to_subsection("conversations", message)
+    await _flush(manager)
+
+    encode.assert_called_once()
+    sent = {ws.send_bytes.call_args.args[0] for ws in sockets}
+    assert len(sent) == 1
+    assert json.loads(sent.pop()) == message
+    await manager.disconnect_all()
+
+
+@pytest.mark.asyncio
+async def test_broadcast_drops_failed_sockets():
+    """Test a socket that fails to send is disconnected without affecting peers."""
+    manager = ConnectionManager()
+    good, bad = _websocket(), _websocket()
+    bad.send_bytes.side_effect = RuntimeError("closed")
+    for ws in (good, bad):
+        await manager.connect(ws)
+        await manager.subscribe(ws, "logs")
+
+    await manager.broadcast_to_subsection("logs", {"type": "update"})
+    await _flush(manager)
+
+    good.send_bytes.assert_called_once()
+    assert manager.connection_count == 1
+    await manager.disconnect_all()
+
+
+@pytest.mark.asyncio
+async def test_messages_are_sent_as_binary_json():
+    """Test direct sends use binary frames that decode to the same message."""
+    manager = ConnectionManager()
+    ws = _websocket()
+    await manager.connect(ws)
+
+    message = {"type": "action_result", "result": {"text": "café", 1: [None]}}
+    await manager.send(ws, message)
+    await _flush(manager)
+
+    frame = ws.send_bytes.call_args.args[0]
+    assert isinstance(frame, bytes)
+    assert json.loads(frame) == {
+        "type": "action_result",
+        "result": {"text": "café", "1": [None]},
+    }
+    ws.send_text.assert_not_called()
+    await manager.disconnect_all()
+
+
+@pytest.mark.asyncio
+async def test_messages_keep_order_and_slow_clients_are_dropped():
+    """Test each client gets messages in order and a full queue drops it."""
+    manager = ConnectionManager()
+    fast, slow = _websocket(), _websocket()
+    blocked = asyncio.Event()
+
+    async def never_finishes(message):
+        await blocked.wait()
+
+    slow.send_bytes.side_effect = never_finishes
+    with patch.object(websocket_manager, "_SEND_QUEUE_SIZE", 2):
+        for ws in (fast, slow):
+            await manager.connect(ws)
+            await manager.subscribe(ws, "logs")
+
+    # The slow writer holds the first message, then its queue of two fills
+    for i in range(4):
+        await manager.broadcast_to_subsection("logs", {"i": i})
+        # Let the fast client's writer keep up
+        await asyncio.sleep(0)
+
+    assert manager.connection_count == 1
+    slow.close.assert_awaited()
+
+    await _flush(manager)
+    received = [json.loads(c.args[0])["i"] for c in fast.send_bytes.call_args_list]
+    assert received == [0, 1, 2, 3]
+    await manager.disconnect_all()